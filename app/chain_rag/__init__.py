@@ -7,9 +7,11 @@ Straightforward retrieval-augmented generation chain.
 from app.chain_rag.chain import RAGChain
 from app.chain_rag.response import ResponseFormatter
 from app.chain_rag.retriever import DocumentRetriever
+from app.chain_rag.semantic_cache import SemanticCache
 
 __all__ = [
     "RAGChain",
     "DocumentRetriever",
     "ResponseFormatter",
+    "SemanticCache",
 ]
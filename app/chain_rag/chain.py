@@ -11,6 +11,7 @@ import constants
 from app.chain_rag.prompts import create_rag_prompt, format_context
 from app.chain_rag.response import ResponseFormatter
 from app.chain_rag.retriever import DocumentRetriever
+from app.chain_rag.semantic_cache import SemanticCache
 from app.security.guardrails import GuardrailsConfig, GuardrailsManager
 from config import Config
 from logger import get_logger
@@ -42,6 +43,11 @@ class RAGChain:
             self.config = config
             self.retriever = DocumentRetriever(config)
             self.prompt = create_rag_prompt()
+            self.semantic_cache = SemanticCache(
+                config.rag.semantic_cache_threshold,
+                config.rag.semantic_cache_size,
+                config.rag.semantic_cache_ttl_seconds,
+            )
 
             # Use LLM factory for clean provider-agnostic initialization
             from llm.factory import create_llm
@@ -130,6 +136,20 @@ class RAGChain:
         """
         logger.info(codes.RAG_QUERY_PROCESSING, query=question)
 
+        # The vectorstore embeds the question again on retrieval; that
+        # second call is served by the embeddings provider's cache
+        question_embedding = None
+        if self.semantic_cache.enabled:
+            question_embedding = self.retriever.embeddings.embed_query(question)
+            cached = self.semantic_cache.lookup(question_embedding)
+            if cached is not None:
+                logger.info(
+                    codes.RAG_SEMANTIC_CACHE_HIT,
+                    query=question,
+                    message=constants.MSG_RAG_SEMANTIC_CACHE_HIT,
+                )
+                return {**cached, constants.RESPONSE_KEY_QUERY: question}
+
         documents = self.retriever.retrieve(question)
 
         if not documents:
@@ -154,6 +174,9 @@ class RAGChain:
             source_count=len(documents),
         )
 
+        if question_embedding is not None:
+            self.semantic_cache.store(question_embedding, response)
+
         return response
 
     def _generate_answer(self, question: str, documents) -> str:
@@ -0,0 +1,172 @@
+"""
+Semantic cache for RAG responses.
+
+Users repeat the same question in slightly different words ("What is
+RAG?", "what is rag", "What's RAG?"). An exact-match cache misses all of
+these, so each one pays for retrieval and an LLM call. SemanticCache
+matches questions by embedding similarity instead: each entry is a
+cluster whose centroid is the running mean of the question embeddings
+that hit it, and a new question within the similarity threshold of a
+centroid is served that cluster's response.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Thread-safe cache of RAG responses keyed by question embedding.
+
+    Centroids are kept as unit-length rows of one float32 matrix, so a
+    lookup is a single matrix-vector product. Entries expire ttl_seconds
+    after creation (bounding staleness after new documents are ingested),
+    and the oldest entry is evicted once max_entries is reached. A
+    max_entries of 0 disables the cache.
+
+    Attributes:
+        threshold: Minimum cosine similarity for a hit
+        max_entries: Maximum number of cached responses
+        ttl_seconds: Lifetime of an entry (0 keeps entries until evicted)
+        hits: Number of cache hits
+        misses: Number of cache misses
+    """
+
+    def __init__(self, threshold: float, max_entries: int, ttl_seconds: int):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of cached responses (0 disables)
+            ttl_seconds: Lifetime of an entry (0 keeps entries until evicted)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._centroids: Optional[np.ndarray] = None
+        self._counts: List[int] = []
+        self._created: List[float] = []
+        self._responses: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores and serves responses."""
+        return self.max_entries > 0
+
+    def lookup(self, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached response for a similar question.
+
+        A hit folds the question into the matching cluster's centroid.
+
+        Args:
+            embedding: Question embedding
+
+        Returns:
+            Cached response, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        query = _unit(embedding)
+        if query is None:
+            return None
+
+        with self._lock:
+            self._expire(time.monotonic())
+            size = len(self._responses)
+
+            if size == 0 or self._centroids.shape[1] != query.shape[0]:
+                self.misses += 1
+                return None
+
+            scores = self._centroids[:size] @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            count = self._counts[best]
+            centroid = self._centroids[best] * count + query
+            self._centroids[best] = centroid / np.linalg.norm(centroid)
+            self._counts[best] = count + 1
+            self.hits += 1
+
+            return self._responses[best]
+
+    def store(self, embedding: List[float], response: Dict[str, Any]) -> None:
+        """
+        Cache a response as a new cluster centred on its question.
+
+        Args:
+            embedding: Question embedding
+            response: RAG response to serve for similar questions
+        """
+        if not self.enabled:
+            return
+
+        query = _unit(embedding)
+        if query is None:
+            return
+
+        with self._lock:
+            self._expire(time.monotonic())
+
+            if self._centroids is None or self._centroids.shape[1] != query.shape[0]:
+                self._centroids = np.empty(
+                    (self.max_entries, query.shape[0]), dtype=np.float32
+                )
+                self._counts, self._created, self._responses = [], [], []
+
+            if len(self._responses) >= self.max_entries:
+                self._drop_oldest(1)
+
+            self._centroids[len(self._responses)] = query
+            self._counts.append(1)
+            self._created.append(time.monotonic())
+            self._responses.append(response)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._drop_oldest(len(self._responses))
+
+    def _expire(self, now: float) -> None:
+        """Drop entries older than ttl_seconds (caller holds the lock)."""
+        if self.ttl_seconds <= 0:
+            return
+
+        # Entries are kept in creation order, so expired ones lead
+        cutoff = now - self.ttl_seconds
+        expired = 0
+        while expired < len(self._created) and self._created[expired] < cutoff:
+            expired += 1
+
+        self._drop_oldest(expired)
+
+    def _drop_oldest(self, count: int) -> None:
+        """Remove the count oldest entries (caller holds the lock)."""
+        if count <= 0:
+            return
+
+        size = len(self._responses)
+        self._centroids[: size - count] = self._centroids[count:size]
+        del self._counts[:count]
+        del self._created[:count]
+        del self._responses[:count]
+
+
+def _unit(embedding: List[float]) -> Optional[np.ndarray]:
+    """Convert an embedding to a unit float32 vector (None if zero)."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if not norm:
+        return None
+    return vector / norm
@@ -6,7 +6,7 @@ Coordinates between file repository and external systems.
 
 import hashlib
 import trace.codes as codes
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import constants
 from app.modules.file.entity import File
@@ -45,13 +45,10 @@ class FileService:
         Returns:
             Hex digest checksum
         """
-        sha256 = hashlib.sha256()
-
+        # file_digest reads into a reused buffer (or hashes straight from the
+        # file descriptor) instead of allocating a bytes object per 8 KiB read
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-
-        return sha256.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     def check_duplicate(self, checksum: str) -> Optional[Dict]:
         """
@@ -247,6 +244,22 @@ class FileService:
         with self.session_factory.get_write_session() as session:
             return self.repository.mark_as_indexed(session, file_id)
 
+    def mark_many_as_indexed(self, file_ids: List[str]) -> int:
+        """
+        Mark several files as indexed in one transaction.
+
+        Args:
+            file_ids: File IDs
+
+        Returns:
+            Number of files marked
+        """
+        if not file_ids:
+            return 0
+
+        with self.session_factory.get_write_session() as session:
+            return self.repository.mark_many_as_indexed(session, file_ids)
+
     def get_unindexed_files(self, limit: Optional[int] = None) -> List[Dict]:
         """
         Get files that haven't been indexed yet.
@@ -261,6 +274,47 @@ class FileService:
             files = self.repository.find_unindexed_files(session, limit=limit)
             return [f.to_dict() for f in files]
 
+    def count_unindexed_files(self) -> int:
+        """
+        Count files that haven't been indexed yet.
+
+        Returns:
+            Number of unindexed files
+        """
+        with self.session_factory.get_read_session() as session:
+            return self.repository.count_unindexed_files(session)
+
+    def iter_unindexed_files(
+        self, page_size: int = constants.INGESTION_FILE_PAGE_SIZE
+    ) -> Iterator[Dict]:
+        """
+        Stream files that haven't been indexed yet, one page per query.
+
+        Each page is read in its own session, so callers can mark files
+        as indexed between pages.
+
+        Args:
+            page_size: Files fetched per query
+
+        Yields:
+            File dictionaries ordered by ID
+        """
+        after_id = None
+
+        while True:
+            with self.session_factory.get_read_session() as session:
+                files = self.repository.find_unindexed_files_after(
+                    session, after_id=after_id, limit=page_size
+                )
+                page = [f.to_dict() for f in files]
+
+            yield from page
+
+            if len(page) < page_size:
+                return
+
+            after_id = page[-1]["id"]
+
     def get_indexed_files(self, limit: Optional[int] = None) -> List[Dict]:
         """
         Get files that have been indexed.
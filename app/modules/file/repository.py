@@ -7,6 +7,7 @@ Extends BaseRepository with file-specific operations.
 import trace.codes as codes
 from typing import List, Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 import constants
@@ -26,8 +27,11 @@ class FileRepository(BaseRepository[File]):
     - find_by_filename()
     - find_by_checksum()
     - find_unindexed_files()
+    - find_unindexed_files_after()
+    - count_unindexed_files()
     - find_indexed_files()
     - mark_as_indexed()
+    - mark_many_as_indexed()
     - get_total_size()
     """
 
@@ -90,6 +94,98 @@ class FileRepository(BaseRepository[File]):
             )
         )
 
+    def find_unindexed_files_after(
+        self, session: Session, after_id: Optional[str], limit: int
+    ) -> List[File]:
+        """
+        Find one page of unindexed files, ordered by ID.
+
+        Pages by ID rather than OFFSET, so files marked as indexed while
+        the caller works through earlier pages don't shift later ones.
+
+        Args:
+            session: Database session
+            after_id: Last ID of the previous page (None for the first page)
+            limit: Maximum number of files to return
+
+        Returns:
+            Unindexed files with IDs greater than after_id
+
+        Raises:
+            DatabaseQueryError: If query execution fails
+        """
+        try:
+            logger.info(
+                codes.DB_QUERY_STARTED,
+                operation="find_unindexed_files_after",
+                model=File.__name__,
+            )
+
+            query = session.query(File).filter(
+                File.indexed.is_(False), File.deleted_at.is_(None)
+            )
+
+            if after_id is not None:
+                query = query.filter(File.id > after_id)
+
+            results = query.order_by(File.id).limit(limit).all()
+
+            logger.info(
+                codes.DB_QUERY_COMPLETED,
+                operation="find_unindexed_files_after",
+                count=len(results),
+            )
+
+            return results
+
+        except Exception as e:
+            logger.error(
+                codes.DB_QUERY_FAILED,
+                operation="find_unindexed_files_after",
+                error=str(e),
+                exc_info=True,
+            )
+            raise DatabaseQueryError(
+                message=constants.ERROR_DB_QUERY_FAILED,
+                query="find_unindexed_files_after",
+                details={"after_id": after_id, "limit": limit},
+                original_error=e,
+            ) from e
+
+    def count_unindexed_files(self, session: Session) -> int:
+        """
+        Count files that haven't been indexed yet.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of unindexed files
+
+        Raises:
+            DatabaseQueryError: If count fails
+        """
+        try:
+            count = (
+                session.query(func.count(File.id))
+                .filter(File.indexed.is_(False), File.deleted_at.is_(None))
+                .scalar()
+            )
+            return count or 0
+
+        except Exception as e:
+            logger.error(
+                codes.DB_QUERY_FAILED,
+                operation="count_unindexed_files",
+                error=str(e),
+                exc_info=True,
+            )
+            raise DatabaseQueryError(
+                message=constants.ERROR_DB_QUERY_FAILED,
+                query="count_unindexed_files",
+                original_error=e,
+            ) from e
+
     def find_indexed_files(
         self, session: Session, limit: Optional[int] = None
     ) -> List[File]:
@@ -164,6 +260,69 @@ class FileRepository(BaseRepository[File]):
                 original_error=e,
             ) from e
 
+    def mark_many_as_indexed(self, session: Session, file_ids: List[str]) -> int:
+        """
+        Mark files as indexed with one UPDATE per chunk of IDs.
+
+        Args:
+            session: Database session
+            file_ids: File IDs
+
+        Returns:
+            Number of files marked
+
+        Raises:
+            DatabaseQueryError: If update fails
+        """
+        try:
+            logger.info(
+                codes.DB_REPOSITORY_STARTED,
+                operation="mark_many_as_indexed",
+                count=len(file_ids),
+            )
+
+            now = File._get_current_timestamp()
+            marked = 0
+
+            for start in range(
+                0, len(file_ids), constants.FILE_MARK_INDEXED_CHUNK_SIZE
+            ):
+                chunk = file_ids[start : start + constants.FILE_MARK_INDEXED_CHUNK_SIZE]
+                marked += (
+                    session.query(File)
+                    .filter(File.id.in_(chunk), File.deleted_at.is_(None))
+                    .update(
+                        {
+                            File.indexed: True,
+                            File.indexed_at: now,
+                            File.updated_at: now,
+                        },
+                        synchronize_session=False,
+                    )
+                )
+
+            logger.info(
+                codes.DB_REPOSITORY_COMPLETED,
+                operation="mark_many_as_indexed",
+                count=marked,
+            )
+
+            return marked
+
+        except Exception as e:
+            logger.error(
+                codes.DB_REPOSITORY_FAILED,
+                operation="mark_many_as_indexed",
+                error=str(e),
+                exc_info=True,
+            )
+            raise DatabaseQueryError(
+                message=constants.ERROR_DB_ENTITY_UPDATE_FAILED,
+                query="mark_many_as_indexed",
+                details={"count": len(file_ids)},
+                original_error=e,
+            ) from e
+
     def get_total_size(self, session: Session, include_deleted: bool = False) -> int:
         """
         Get total size of all files in bytes.
@@ -12,7 +12,9 @@ import constants
 from app.modules.health.response import ComponentHealth, HealthResponse
 from config import Config
 from database.session import SessionFactory
+from embeddings.base import EmbeddingsProtocol
 from embeddings.factory import create_embeddings
+from llm.base import LLMProtocol
 from logger import get_logger
 from utils.singleton import SingletonMeta
 from vectorstore.factory import create_vectorstore
@@ -49,6 +51,11 @@ class HealthService(metaclass=SingletonMeta):
             self._llm_health_cache: Optional[Tuple[bool, float]] = None
             self._embeddings_health_cache: Optional[Tuple[bool, float]] = None
 
+            # Provider clients, created on first check and reused afterwards
+            # so each cache refresh doesn't rebuild HTTP clients
+            self._llm: Optional[LLMProtocol] = None
+            self._embeddings: Optional[EmbeddingsProtocol] = None
+
             self._initialized = True
 
     def get_health_status(self) -> HealthResponse:
@@ -339,13 +346,14 @@ class HealthService(metaclass=SingletonMeta):
             # Create LLM with deterministic settings for health check
             # NOTE: Do NOT override max_tokens or max_output_tokens for Google Gemini
             # as it causes empty responses. Use config defaults instead.
-            llm = create_llm(
-                self.config,
-                temperature=0,  # Deterministic responses
-            )
+            if self._llm is None:
+                self._llm = create_llm(
+                    self.config,
+                    temperature=0,  # Deterministic responses
+                )
 
             # Minimal prompt for health check
-            response = llm.invoke("Hi")
+            response = self._llm.invoke("Hi")
             return response is not None and len(str(response.content)) > 0
 
         except Exception as e:
@@ -370,11 +378,12 @@ class HealthService(metaclass=SingletonMeta):
         try:
             from embeddings.factory import create_embeddings
 
-            embeddings = create_embeddings(self.config)
+            if self._embeddings is None:
+                self._embeddings = create_embeddings(self.config)
 
             # Minimal text - generates single embedding vector
             test_text = "hi"
-            result = embeddings.embed_query(test_text)
+            result = self._embeddings.embed_query(test_text)
 
             # Verify we got a valid embedding vector
             return result is not None and len(result) > 0
@@ -21,7 +21,12 @@ class OpenAIEmbeddingsConfig:
     api_key: str = None
     model: str = "text-embedding-3-small"
     batch_size: int = 100
+    max_batch_tokens: int = 270000
+    max_input_tokens: int = 8191
+    tokenizer: str = "tiktoken"
     dimensions: int = 1536
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
     verify_ssl: bool = True
 
 
@@ -31,6 +36,8 @@ class HuggingFaceEmbeddingsConfig:
     model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
     cache_folder: str = "models/huggingface"
     device: str = "cpu"
+    batch_size: int = 32
+    precision: str = "fp32"
 
 
 class AnthropicEmbeddingsConfig:
@@ -40,6 +47,7 @@ class AnthropicEmbeddingsConfig:
     model: str = "voyage-2"
     input_type: str = "document"
     batch_size: int = 128
+    max_batch_tokens: int = 108000
     verify_ssl: bool = True
 
 
@@ -48,6 +56,14 @@ class EmbeddingsConfig:
 
     provider: str = "google"
     dimension: int = 768
+    max_concurrent_batches: int = 5
+    cache_size: int = 10000
+    cache_dir: str = ""
+    blank_texts: str = "raise"
+    query_max_batch_size: int = 16
+    query_flush_interval_ms: int = 0
+    retry_max_attempts: int = 5
+    retry_max_wait_seconds: int = 60
     google: GoogleEmbeddingsConfig = None
     openai: OpenAIEmbeddingsConfig = None
     huggingface: HuggingFaceEmbeddingsConfig = None
@@ -18,6 +18,9 @@ class RAGConfig:
 
     provider: str = "google"
     retrieval_k: int = 5
+    semantic_cache_size: int = 0
+    semantic_cache_threshold: float = 0.86
+    semantic_cache_ttl_seconds: int = 3600
     google: GoogleLLMConfig = None
     openai: OpenAILLMConfig = None
     anthropic: AnthropicLLMConfig = None
@@ -24,6 +24,9 @@ class S3StorageConfig:
     use_localstack: bool = False
     role_arn: str = ""
     role_session_name: str = "rag-app"
+    multipart_threshold_mb: int = 8
+    multipart_chunksize_mb: int = 8
+    max_concurrency: int = 8
 
 
 class StorageConfig:
@@ -11,6 +11,9 @@ class ChromaConfig:
     persist_directory: str = "storage/chroma"
     distance_function: str = "cosine"
     anonymized_telemetry: bool = False
+    hnsw_m: int = 24  # Graph links per node
+    hnsw_construction_ef: int = 128  # Candidate list size while building the index
+    hnsw_search_ef: int = 100  # Candidate list size while querying
 
 
 class PineconeConfig:
@@ -55,6 +58,9 @@ class VectorStoreConfig:
 
     provider: str = "chroma"
     collection_name: str = "rag_documents"
+    ingest_batch_size: int = 256  # Chunks per add_documents call during ingestion
+    ingest_flush_chunks: int = 4096  # Pending chunks that trigger a store
+    ingest_upload_concurrency: int = 2  # Batches embedded and stored at once
     chroma: ChromaConfig = None
     pinecone: PineconeConfig = None
     qdrant: QdrantConfig = None
@@ -92,6 +92,15 @@ SWITCH_PROVIDERS_SEE_DOCS = "   • See docs/PROVIDERS.md for all options"
 SOURCE_DOCS_DIR = "source_docs"
 DEFAULT_SOURCE_DIR = "source_docs"
 
+# Unindexed file records fetched per database query while streaming
+INGESTION_FILE_PAGE_SIZE = 1000
+
+# Files between ingestion progress log lines (per-file events log at DEBUG)
+INGESTION_PROGRESS_LOG_INTERVAL = 100
+
+# File IDs per UPDATE when marking files indexed (SQLite binds at most 999)
+FILE_MARK_INDEXED_CHUNK_SIZE = 500
+
 # Progress messages
 INGESTION_HEADER = "Document Ingestion Pipeline"
 SCANNING_FOR_FILES = "Scanning for documents..."
@@ -160,6 +169,7 @@ DEFAULT_API_HOST = "0.0.0.0"
 DEFAULT_API_PORT = 8000
 DEFAULT_UPLOAD_CHUNK_SIZE = 1048576  # 1MB
 DEFAULT_MAX_FILE_SIZE_MB = 100
+BYTES_PER_MB = 1024 * 1024
 
 # HTTP status messages
 HTTP_STATUS_OK = "OK"
@@ -504,8 +514,31 @@ MASK_SHORT_VALUE = "****"
 EMBEDDING_KEY = "embedding"
 TASK_TYPE_QUERY = "retrieval_query"
 TASK_TYPE_DOCUMENT = "retrieval_document"
+EMBEDDINGS_INPUT_TYPE_DOCUMENT = "document"
+EMBEDDINGS_INPUT_TYPE_QUERY = "query"
+
+# HuggingFace embeddings precision modes
+EMBEDDINGS_PRECISION_FP32 = "fp32"
+EMBEDDINGS_PRECISION_FP16 = "fp16"
+EMBEDDINGS_PRECISION_BF16 = "bf16"
+EMBEDDINGS_PRECISION_INT8 = "int8"
+
+# Handling of empty/whitespace-only texts sent for embedding
+EMBEDDINGS_BLANK_TEXTS_RAISE = "raise"  # Reject the call with ValueError
+EMBEDDINGS_BLANK_TEXTS_ZERO = "zero"  # Zero vectors (providers of known dimension)
+
+# OpenAI embeddings HTTP connection pool limits
+OPENAI_HTTP_MAX_CONNECTIONS = 100
+OPENAI_HTTP_MAX_KEEPALIVE = 20
+
+# OpenAI embeddings request limits and token counting
+OPENAI_MAX_BATCH_INPUTS = 2048  # Max inputs per embeddings request
+OPENAI_TOKENIZER_TIKTOKEN = "tiktoken"
 
 # Embeddings error messages
+ERROR_GOOGLE_GENAI_NOT_INSTALLED = (
+    "google-generativeai package not installed. Run: pip install google-generativeai"
+)
 ERROR_OPENAI_NOT_INSTALLED = "openai package not installed. Run: pip install openai"
 ERROR_SENTENCE_TRANSFORMERS_NOT_INSTALLED = (
     "sentence-transformers package not installed. "
@@ -514,6 +547,14 @@ ERROR_SENTENCE_TRANSFORMERS_NOT_INSTALLED = (
 ERROR_VOYAGEAI_NOT_INSTALLED = (
     "voyageai package not installed. Run: pip install voyageai"
 )
+ERROR_EMBEDDINGS_BLANK_TEXTS = (
+    "Cannot embed empty or whitespace-only texts; drop blank chunks before "
+    'embedding or set embeddings.blank_texts = "zero" (OpenAI only)'
+)
+MSG_EMBEDDINGS_PRECISION_UNSUPPORTED = (
+    "Embeddings precision not supported on this device, using fp32 "
+    "(fp16/bf16 need cuda, int8 needs cpu)"
+)
 MSG_SSL_CERTIFI_BUNDLE = "Using certifi certificate bundle for SSL verification"
 MSG_SSL_DISABLED_DEV = "SSL verification disabled for OpenAI API (development only)"
 MSG_SSL_DISABLED_VOYAGEAI_DEV = (
@@ -525,6 +566,9 @@ ERROR_COLLECTION_NOT_INITIALIZED = (
     "Collection not initialized. Call initialize() first."
 )
 ERROR_INDEX_NOT_INITIALIZED = "Index not initialized. Call initialize() first."
+ERROR_EMBEDDINGS_COUNT_MISMATCH = "Number of embeddings must match number of texts"
+ERROR_METADATAS_COUNT_MISMATCH = "Number of metadatas must match number of texts"
+ERROR_IDS_COUNT_MISMATCH = "Number of ids must match number of texts"
 ERROR_PINECONE_NOT_INSTALLED = (
     "pinecone package not installed. Run: pip install pinecone"
 )
@@ -549,6 +593,9 @@ OPERATION_GET_STATS = "get_stats"
 
 # ChromaDB metadata keys
 CHROMA_HNSW_SPACE = "hnsw:space"
+CHROMA_HNSW_M = "hnsw:M"
+CHROMA_HNSW_CONSTRUCTION_EF = "hnsw:construction_ef"
+CHROMA_HNSW_SEARCH_EF = "hnsw:search_ef"
 
 # Result dictionary keys
 RESULT_KEY_ID = "id"
@@ -583,6 +630,10 @@ QDRANT_PAYLOAD_TEXT = "text"
 WEAVIATE_PROPERTY_TEXT = "text"
 WEAVIATE_PROPERTY_METADATA = "metadata"
 
+# Bulk ingestion defaults (vectorstore.bulk)
+VECTORSTORE_BULK_BATCH_SIZE = 250  # Documents embedded and inserted per batch
+VECTORSTORE_BULK_MAX_CONCURRENCY = 8  # Batches in flight at once
+
 # URL protocol strings
 URL_HTTP_PREFIX = "http://"
 URL_HTTPS_PREFIX = "https://"
@@ -631,6 +682,7 @@ ERROR_EMPTY_DOCUMENT = "Document is empty or has no content"
 SPLITTER_TYPE_TOKEN = "token"
 SPLITTER_TYPE_RECURSIVE = "recursive"
 SPLITTER_TYPE_CHARACTER = "character"
+SPLITTER_TYPE_MARKDOWN = "markdown"
 
 # Default splitting parameters
 DEFAULT_CHUNK_SIZE = 512
@@ -652,6 +704,7 @@ MSG_RAG_QUERY_PROCESSING = "Processing RAG query"
 MSG_RAG_QUERY_COMPLETED = "RAG query completed successfully"
 MSG_RAG_NO_RELEVANT_DOCS = "No relevant documents found for query"
 MSG_RAG_INSUFFICIENT_CONTEXT = "Insufficient context to answer question"
+MSG_RAG_SEMANTIC_CACHE_HIT = "Serving cached answer for a similar question"
 
 # RAG Error Messages
 ERROR_RAG_CHAIN_INIT_FAILED = "Failed to initialize RAG chain"
@@ -837,6 +890,7 @@ MSG_DB_QUERY_EXECUTED = "Database query executed"
 MSG_DB_INITIALIZED = "Database initialized"
 MSG_DB_ENGINE_CREATED = "Database engine created"
 MSG_DB_POOL_CONFIGURED = "Database connection pool configured"
+MSG_DB_POOL_OVERFLOW_CHANGED = "Database connection pool overflow changed"
 
 # Database operation messages
 MSG_DB_CONNECTING = "Connecting to database"
@@ -851,6 +905,10 @@ MSG_DB_DISCONNECTING = "Disconnecting from database"
 QUERY_LOG_PREFIX_WRITE = "[WRITE_DB]"
 QUERY_LOG_PREFIX_READ = "[READ_DB]"
 
+# Query log deduplication (identical statements logged once per window)
+QUERY_LOG_DEDUP_WINDOW_SECONDS = 60
+QUERY_LOG_DEDUP_MAX_ENTRIES = 2048
+
 # Query logging messages
 MSG_QUERY_EXECUTED = "Query executed"
 MSG_QUERY_STARTED = "Query started"
@@ -7,6 +7,7 @@ This module provides database functionality including:
 - Session management (read/write split)
 - Base models and repositories
 - Query logging
+- Connection pool metrics
 
 Architecture:
 - Master-slave database support (read/write split)
@@ -29,6 +29,8 @@ class DatabaseError(Exception):
     All custom database exceptions inherit from this class.
     """
 
+    __slots__ = ("message", "details", "original_error")
+
     def __init__(
         self,
         message: str,
@@ -60,6 +62,8 @@ class DatabaseConnectionError(DatabaseError):
         - Connection pool exhausted
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = constants.ERROR_DB_CONNECTION_FAILED,
@@ -88,6 +92,8 @@ class DatabaseSessionError(DatabaseError):
         - Session commit/rollback error
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = constants.ERROR_DB_SESSION_CREATION_FAILED,
@@ -117,6 +123,8 @@ class DatabaseQueryError(DatabaseError):
         - Duplicate entry
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = constants.ERROR_DB_QUERY_FAILED,
@@ -154,6 +162,8 @@ class DatabaseMigrationError(DatabaseError):
         - Invalid migration version
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = constants.ERROR_MIGRATION_FAILED,
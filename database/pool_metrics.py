@@ -0,0 +1,99 @@
+"""
+SQLAlchemy connection pool metrics with read/write mode support.
+
+This module tracks connection pool overflow so operators can see when
+pool_size is too small for the workload and connections spill over into
+max_overflow.
+"""
+
+import trace.codes as codes
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import constants
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PoolMetricsLogger:
+    """
+    SQLAlchemy pool event listener for overflow metrics.
+
+    Logs only when the pool overflow count changes, keeping the
+    checkout/checkin hot path free of log I/O in steady state.
+    """
+
+    def __init__(self, mode: str = constants.DB_MODE_WRITE):
+        """
+        Initialize pool metrics logger.
+
+        Args:
+            mode: Connection mode (READ or WRITE)
+        """
+        self.mode = mode
+        self.overflow = 0
+        self.peak_overflow = 0
+        self.overflow_checkouts = 0
+
+    def attach_to_engine(self, engine: Engine) -> bool:
+        """
+        Attach pool metrics listeners to SQLAlchemy engine.
+
+        Pools without overflow support (e.g. SQLite's SingletonThreadPool)
+        are skipped.
+
+        Args:
+            engine: SQLAlchemy engine instance
+
+        Returns:
+            True if listeners were attached, False if pool has no overflow
+        """
+        pool = engine.pool
+        if not callable(getattr(pool, "overflow", None)):
+            return False
+
+        self.overflow = pool.overflow()
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            """Record overflow growth on checkout."""
+            current = pool.overflow()
+            if current > 0:
+                self.overflow_checkouts += 1
+            self._record(pool, current)
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            """Record overflow shrink on checkin."""
+            self._record(pool, pool.overflow())
+
+        return True
+
+    def _record(self, pool, current: int) -> None:
+        """
+        Log overflow change if the count moved since last event.
+
+        Args:
+            pool: SQLAlchemy pool instance
+            current: Current overflow count
+        """
+        delta = current - self.overflow
+        if delta == 0:
+            return
+
+        self.overflow = current
+        self.peak_overflow = max(self.peak_overflow, current)
+
+        logger.info(
+            codes.DB_CONNECTION_POOL_OVERFLOW_CHANGED,
+            mode=self.mode,
+            overflow=current,
+            delta=delta,
+            peak_overflow=self.peak_overflow,
+            overflow_checkouts=self.overflow_checkouts,
+            checked_out=pool.checkedout(),
+            pool_size=pool.size(),
+            msg=constants.MSG_DB_POOL_OVERFLOW_CHANGED,
+        )
@@ -3,10 +3,16 @@ SQLAlchemy query logger with read/write mode support.
 
 This module provides query logging functionality with proper mode labeling
 ([WRITE_DB] or [READ_DB]) for debugging and monitoring.
+
+Repeated statements (e.g. N+1 patterns) are logged once per dedup window;
+further occurrences are counted and reported when the window expires.
 """
 
+import threading
 import time
 import trace.codes as codes
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
@@ -38,6 +44,42 @@ class QueryLogger:
             else constants.QUERY_LOG_PREFIX_READ
         )
 
+        # statement hash -> (window start, suppressed count), oldest first
+        self._seen: "OrderedDict[int, Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _should_log(self, statement: str) -> Tuple[bool, Optional[int]]:
+        """
+        Decide whether statement should be logged in the current window.
+
+        Args:
+            statement: SQL statement text
+
+        Returns:
+            Tuple of (should_log, suppressed count from the previous window)
+        """
+        key = hash(statement)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._seen.get(key)
+
+            if (
+                entry is not None
+                and now - entry[0] < constants.QUERY_LOG_DEDUP_WINDOW_SECONDS
+            ):
+                self._seen[key] = (entry[0], entry[1] + 1)
+                return False, None
+
+            self._seen[key] = (now, 0)
+            self._seen.move_to_end(key)
+
+            if len(self._seen) > constants.QUERY_LOG_DEDUP_MAX_ENTRIES:
+                self._seen.popitem(last=False)
+
+        suppressed = entry[1] if entry is not None and entry[1] else None
+        return True, suppressed
+
     def attach_to_engine(self, engine: Engine):
         """
         Attach query logger to SQLAlchemy engine.
@@ -57,14 +99,19 @@ class QueryLogger:
         def after_cursor_execute(
             conn, cursor, statement, parameters, context, executemany
         ):
-            """Log query with execution time."""
+            """Log query with execution time, once per dedup window."""
             total_time = time.time() - conn.info["query_start_time"].pop(-1)
 
+            should_log, suppressed = self._should_log(statement)
+            if not should_log:
+                return
+
             logger.info(
                 codes.DB_QUERY_EXECUTED,
                 mode=self.mode,
                 prefix=self.prefix,
                 query=statement[:500],  # Truncate long queries
+                suppressed=suppressed,
                 parameters=str(parameters)[:200] if parameters else None,
                 execution_time_ms=round(total_time * 1000, 2),
                 msg=constants.MSG_QUERY_EXECUTED,
@@ -7,19 +7,19 @@ with read/write splitting and query logging integration.
 
 import trace.codes as codes
 from contextlib import contextmanager
-from typing import Generator, Optional
-
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from typing import TYPE_CHECKING, Generator, Optional
 
 import constants
 from config import Config
 from database.connection import ConnectionStringBuilder
 from database.exceptions import DatabaseSessionError
-from database.query_logger import QueryLogger
 from logger import get_logger
 from utils.singleton import SingletonMeta
 
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+    from sqlalchemy.orm import Session, sessionmaker
+
 logger = get_logger(__name__)
 
 
@@ -43,10 +43,10 @@ class SessionFactory(metaclass=SingletonMeta):
         logger.info(codes.DB_INITIALIZING)
 
         self._config: Optional[Config] = None
-        self._write_engine: Optional[Engine] = None
-        self._read_engine: Optional[Engine] = None
-        self._WriteSession: Optional[sessionmaker] = None
-        self._ReadSession: Optional[sessionmaker] = None
+        self._write_engine: Optional["Engine"] = None
+        self._read_engine: Optional["Engine"] = None
+        self._WriteSession: Optional["sessionmaker"] = None
+        self._ReadSession: Optional["sessionmaker"] = None
 
         self._initialized = True
 
@@ -62,84 +62,83 @@ class SessionFactory(metaclass=SingletonMeta):
         Ensure database engines are initialized (lazy initialization).
 
         Creates write and read engines with proper pooling and logging.
+        SQLAlchemy is imported here so processes that never touch the
+        database don't pay its import cost.
         """
         if self._write_engine is not None and self._read_engine is not None:
             return
 
+        from sqlalchemy.orm import sessionmaker
+
         self._ensure_config_initialized()
 
         connection_builder = ConnectionStringBuilder(self._config)
 
-        # Create WRITE engine
-        logger.info(codes.DB_ENGINE_CREATING, mode=constants.DB_MODE_WRITE)
-
-        write_url = connection_builder.build(constants.DB_MODE_WRITE)
-        write_pool_config = connection_builder.get_pool_config(constants.DB_MODE_WRITE)
+        self._write_engine = self._make_engine(
+            connection_builder, constants.DB_MODE_WRITE
+        )
+        self._read_engine = self._make_engine(
+            connection_builder, constants.DB_MODE_READ
+        )
 
-        # Build engine kwargs with only provided pool settings
-        engine_kwargs = {
-            "pool_pre_ping": write_pool_config["pool_pre_ping"],
-            "pool_recycle": write_pool_config["pool_recycle"],
-            "echo": False,  # We use custom query logger
-        }
+        # Create session makers
+        self._WriteSession = sessionmaker(bind=self._write_engine)
+        self._ReadSession = sessionmaker(bind=self._read_engine)
 
-        # Only add pool_size and max_overflow if provided (not for SQLite)
-        if "pool_size" in write_pool_config:
-            engine_kwargs["pool_size"] = write_pool_config["pool_size"]
-        if "max_overflow" in write_pool_config:
-            engine_kwargs["max_overflow"] = write_pool_config["max_overflow"]
+    def _make_engine(
+        self, connection_builder: ConnectionStringBuilder, mode: str
+    ) -> "Engine":
+        """
+        Create engine for specified mode with pooling and query logging.
 
-        self._write_engine = create_engine(write_url, **engine_kwargs)
+        Args:
+            connection_builder: Connection string builder for configured driver
+            mode: Connection mode (READ or WRITE)
 
-        # Attach query logger if debug enabled
-        if connection_builder.is_debug_enabled(constants.DB_MODE_WRITE):
-            query_logger = QueryLogger(constants.DB_MODE_WRITE)
-            query_logger.attach_to_engine(self._write_engine)
+        Returns:
+            SQLAlchemy engine for the given mode
+        """
+        from sqlalchemy import create_engine
 
-        logger.info(
-            codes.DB_ENGINE_CREATED,
-            mode=constants.DB_MODE_WRITE,
-            msg=constants.MSG_DB_ENGINE_CREATED,
-        )
+        from database.pool_metrics import PoolMetricsLogger
+        from database.query_logger import QueryLogger
 
-        # Create READ engine
-        logger.info(codes.DB_ENGINE_CREATING, mode=constants.DB_MODE_READ)
+        logger.info(codes.DB_ENGINE_CREATING, mode=mode)
 
-        read_url = connection_builder.build(constants.DB_MODE_READ)
-        read_pool_config = connection_builder.get_pool_config(constants.DB_MODE_READ)
+        url = connection_builder.build(mode)
+        pool_config = connection_builder.get_pool_config(mode)
 
         # Build engine kwargs with only provided pool settings
         engine_kwargs = {
-            "pool_pre_ping": read_pool_config["pool_pre_ping"],
-            "pool_recycle": read_pool_config["pool_recycle"],
-            "echo": False,
+            "pool_pre_ping": pool_config["pool_pre_ping"],
+            "pool_recycle": pool_config["pool_recycle"],
+            "echo": False,  # We use custom query logger
         }
 
         # Only add pool_size and max_overflow if provided (not for SQLite)
-        if "pool_size" in read_pool_config:
-            engine_kwargs["pool_size"] = read_pool_config["pool_size"]
-        if "max_overflow" in read_pool_config:
-            engine_kwargs["max_overflow"] = read_pool_config["max_overflow"]
+        for key in ("pool_size", "max_overflow"):
+            if key in pool_config:
+                engine_kwargs[key] = pool_config[key]
 
-        self._read_engine = create_engine(read_url, **engine_kwargs)
+        engine = create_engine(url, **engine_kwargs)
 
         # Attach query logger if debug enabled
-        if connection_builder.is_debug_enabled(constants.DB_MODE_READ):
-            query_logger = QueryLogger(constants.DB_MODE_READ)
-            query_logger.attach_to_engine(self._read_engine)
+        if connection_builder.is_debug_enabled(mode):
+            QueryLogger(mode).attach_to_engine(engine)
+
+        # Track pool overflow so operators can right-size pool_size
+        PoolMetricsLogger(mode).attach_to_engine(engine)
 
         logger.info(
             codes.DB_ENGINE_CREATED,
-            mode=constants.DB_MODE_READ,
+            mode=mode,
             msg=constants.MSG_DB_ENGINE_CREATED,
         )
 
-        # Create session makers
-        self._WriteSession = sessionmaker(bind=self._write_engine)
-        self._ReadSession = sessionmaker(bind=self._read_engine)
+        return engine
 
     @contextmanager
-    def get_write_session(self) -> Generator[Session, None, None]:
+    def get_write_session(self) -> Generator["Session", None, None]:
         """
         Get database session for WRITE operations (master).
 
@@ -177,8 +176,17 @@ class SessionFactory(metaclass=SingletonMeta):
 
         except Exception as e:
             if session:
-                logger.error(codes.DB_TRANSACTION_FAILED, error=str(e), exc_info=True)
-                session.rollback()
+                # Roll back before logging so the connection is released
+                # without waiting on log formatting; the failure is logged
+                # even if the rollback itself raises
+                try:
+                    session.rollback()
+                finally:
+                    logger.error(
+                        codes.DB_TRANSACTION_FAILED,
+                        error=str(e),
+                        exc_info=True,
+                    )
                 logger.info(
                     codes.DB_TRANSACTION_ROLLED_BACK,
                     msg=constants.MSG_DB_TRANSACTION_ROLLED_BACK,
@@ -200,7 +208,7 @@ class SessionFactory(metaclass=SingletonMeta):
                 )
 
     @contextmanager
-    def get_read_session(self) -> Generator[Session, None, None]:
+    def get_read_session(self) -> Generator["Session", None, None]:
         """
         Get database session for READ operations (slave/replica).
 
@@ -254,7 +262,7 @@ class SessionFactory(metaclass=SingletonMeta):
                     msg=constants.MSG_DB_SESSION_CLOSED,
                 )
 
-    def get_write_engine(self) -> Engine:
+    def get_write_engine(self) -> "Engine":
         """
         Get write engine directly (for migrations and admin operations).
 
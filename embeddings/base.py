@@ -5,7 +5,7 @@ All embedding implementations must follow this protocol to ensure
 a uniform API regardless of provider.
 """
 
-from typing import List, Protocol
+from typing import Iterator, List, Protocol
 
 
 class EmbeddingsProtocol(Protocol):
@@ -33,6 +33,25 @@ class EmbeddingsProtocol(Protocol):
         """
         ...
 
+    def iter_embed_documents(self, texts: List[str]) -> Iterator[List[List[float]]]:
+        """
+        Generate embeddings for multiple documents incrementally.
+
+        Lets callers persist each window of vectors before the next is
+        computed instead of holding all of them in memory.
+
+        Args:
+            texts: List of text strings to embed
+
+        Yields:
+            Embedding vectors for consecutive windows of texts, in order
+
+        Example:
+            for vectors in embeddings.iter_embed_documents(texts):
+                store.add(vectors)
+        """
+        ...
+
     def embed_query(self, text: str) -> List[float]:
         """
         Generate embedding for a single query.
@@ -45,6 +64,9 @@ class EmbeddingsProtocol(Protocol):
         Returns:
             Embedding vector as list of floats
 
+        Raises:
+            ValueError: If text is empty or whitespace
+
         Example:
             query = "What is RAG?"
             vector = embeddings.embed_query(query)
@@ -0,0 +1,119 @@
+"""
+Micro-batching coalescer for concurrent embed_query calls.
+
+A server handling many queries at once would otherwise send one API
+request per query. QueryBatcher collects queries arriving within a short
+window and embeds them with a single batched request, handing each caller
+its own vector. Identical queries in the same window are embedded once.
+
+With flush_interval_ms = 0 (the default) every query is embedded
+immediately, so single-user chat paths see no added latency.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Tuple
+
+from embeddings.batching import dedupe
+
+
+class QueryBatcher:
+    """
+    Coalesce concurrent single-text embedding calls into batches.
+
+    The first caller of a new batch becomes its leader: it waits up to
+    flush_interval_ms (or until max_batch_size queries have joined),
+    then embeds the whole batch and resolves every caller's future.
+    Callers block only on their own future, so no background thread is
+    needed.
+
+    Attributes:
+        max_batch_size: Maximum number of queries per batch
+        flush_interval_ms: Time the leader waits for more queries
+    """
+
+    def __init__(
+        self,
+        embed_one: Callable[[str], List[float]],
+        embed_many: Callable[[List[str]], List[List[float]]],
+        max_batch_size: int,
+        flush_interval_ms: int,
+    ):
+        """
+        Initialize query batcher.
+
+        Args:
+            embed_one: Provider call embedding a single query
+            embed_many: Provider call embedding a list of queries
+            max_batch_size: Maximum number of queries per batch
+            flush_interval_ms: Time to wait for more queries (0 disables)
+        """
+        self._embed_one = embed_one
+        self._embed_many = embed_many
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval_ms = flush_interval_ms
+        self._pending: List[Tuple[str, Future]] = []
+        self._batch_full = threading.Event()
+        self._lock = threading.Lock()
+
+    def submit(self, text: str) -> List[float]:
+        """
+        Embed a query, possibly batched with concurrent queries.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector for text
+        """
+        if self.flush_interval_ms <= 0 or self.max_batch_size == 1:
+            return self._embed_one(text)
+
+        future: Future = Future()
+
+        with self._lock:
+            batch = self._pending
+            batch.append((text, future))
+            is_leader = len(batch) == 1
+            if is_leader:
+                self._batch_full = threading.Event()
+            batch_full = self._batch_full
+            if len(batch) >= self.max_batch_size:
+                batch_full.set()
+                # Close the full batch so later callers start a new one
+                self._pending = []
+
+        if is_leader:
+            batch_full.wait(self.flush_interval_ms / 1000)
+            self._flush(batch)
+
+        return future.result()
+
+    def _flush(self, pending: List[Tuple[str, Future]]) -> None:
+        """
+        Embed a batch of queries and resolve their futures.
+
+        Args:
+            pending: The leader's batch of (text, future) pairs
+        """
+        with self._lock:
+            # A batch that timed out before filling is still open
+            if self._pending is pending:
+                self._pending = []
+
+        # Concurrent sessions often ask the same question; send it once
+        texts, positions = dedupe([text for text, _ in pending])
+
+        try:
+            if len(texts) == 1:
+                embeddings = [self._embed_one(texts[0])]
+            else:
+                embeddings = self._embed_many(texts)
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+
+        for (_, future), position in zip(pending, positions):
+            # Each caller gets its own list, as with an uncoalesced call
+            future.set_result(list(embeddings[position]))
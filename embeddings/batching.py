@@ -0,0 +1,623 @@
+"""
+Batch dispatch helpers shared by API-backed embeddings providers.
+
+Providers split documents into batches and send them to the remote API.
+Batches are independent network round-trips, so they are dispatched
+concurrently on a bounded thread pool (or, for native async clients, as
+semaphore-bounded coroutines) instead of one after another.
+Texts are batched in length order so each batch holds similarly sized
+inputs, then results are restored to input order.
+
+Transient API errors are retried per batch with jittered exponential
+backoff (or the server's Retry-After delay), and a batch rejected as an
+invalid request is split in half so one bad input doesn't fail the whole
+document set.
+
+For ingestion, pipeline_windows overlaps vector store writes with the
+embedding of the next window of documents.
+"""
+
+import asyncio
+import functools
+import random
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from trace import codes
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+import constants
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Batch results: lists of floats, or a float32 matrix for providers that
+# decode vectors straight into numpy (rows then flow through as arrays)
+Vectors = Union[List[List[float]], np.ndarray]
+
+TokenCounter = Callable[[str], int]
+BatchProcessor = Callable[[List[str], int], Vectors]
+BatchEmbedder = Callable[[List[str]], Vectors]
+AsyncBatchProcessor = Callable[[List[str], int], Awaitable[Vectors]]
+AsyncBatchEmbedder = Callable[[List[str]], Awaitable[Vectors]]
+
+
+def length_order(texts: List[str]) -> List[int]:
+    """
+    Get input indices ordered by text length (shortest first).
+
+    Args:
+        texts: Texts to order
+
+    Returns:
+        List of indices into texts
+    """
+    return sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+
+def dedupe(texts: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Collapse repeated texts so each distinct text is embedded once.
+
+    Args:
+        texts: Texts to deduplicate
+
+    Returns:
+        Tuple of (unique texts in first-seen order, index into the unique
+        texts for each input)
+    """
+    unique: Dict[str, int] = {}
+    positions = [unique.setdefault(text, len(unique)) for text in texts]
+    return list(unique), positions
+
+
+@functools.lru_cache(maxsize=None)
+def shared_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """
+    Get the process-wide batch executor for a provider and worker count.
+
+    Providers are also created per request (e.g. health checks), so the
+    executor is shared rather than owned by an instance and never left
+    behind un-shut-down; its idle workers are joined at interpreter exit.
+
+    Args:
+        name: Thread name prefix, one per provider
+        max_workers: Maximum number of batches in flight
+
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    return ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=name)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate a text's token count without a tokenizer.
+
+    One token per three UTF-8 bytes overestimates English (~4 characters
+    per token) and roughly matches CJK (one 3-byte character per token),
+    so batches packed with it stay under provider token limits.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def split_batches(
+    texts: List[str],
+    batch_size: int,
+    max_tokens: int = 0,
+    count_tokens: TokenCounter = estimate_tokens,
+) -> List[List[str]]:
+    """
+    Split texts into consecutive batches.
+
+    A batch is closed when it holds batch_size texts or when adding the
+    next text would exceed max_tokens (estimated). Over length-sorted
+    input this greedy packing fits many short texts per request while
+    keeping long ones under the provider's token limit.
+
+    Args:
+        texts: Texts to split
+        batch_size: Maximum number of texts per batch
+        max_tokens: Maximum estimated tokens per batch (0 disables)
+        count_tokens: Token counter (a real tokenizer, or estimate_tokens)
+
+    Returns:
+        List of batches preserving input order
+    """
+    if max_tokens <= 0:
+        return [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_tokens = 0
+
+    for text in texts:
+        text_tokens = count_tokens(text)
+        if batch and (
+            len(batch) >= batch_size or batch_tokens + text_tokens > max_tokens
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+
+        batch.append(text)
+        batch_tokens += text_tokens
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+class _BatchPlan(NamedTuple):
+    """Batches to send plus the bookkeeping to restore input order."""
+
+    unique_embeddings: List[List[float]]
+    positions: List[int]
+    order: List[int]
+    batches: List[List[str]]
+
+
+def _plan_batches(
+    texts: List[str],
+    batch_size: int,
+    dimension: int,
+    max_batch_tokens: int,
+    count_tokens: TokenCounter,
+) -> _BatchPlan:
+    """
+    Dedupe texts, fill blanks with zero vectors and pack the rest.
+
+    Args:
+        texts: Texts to embed
+        batch_size: Maximum number of texts per batch
+        dimension: Zero-vector dimension for blank texts (0 rejects them)
+        max_batch_tokens: Maximum estimated tokens per batch (0 disables)
+        count_tokens: Token counter used for packing
+
+    Returns:
+        Batch plan for texts
+
+    Raises:
+        ValueError: If texts contain blanks and dimension is 0
+    """
+    unique_texts, positions = dedupe(texts)
+    unique_embeddings: List[List[float]] = [None] * len(unique_texts)
+
+    embeddable = [i for i, text in enumerate(unique_texts) if text.strip()]
+    if len(embeddable) < len(unique_texts):
+        if not dimension:
+            logger.error(
+                codes.EMBEDDINGS_BLANK_TEXTS_REJECTED,
+                count=len(unique_texts) - len(embeddable),
+                message=codes.MSG_EMBEDDINGS_BLANK_TEXTS_REJECTED,
+            )
+            raise ValueError(constants.ERROR_EMBEDDINGS_BLANK_TEXTS)
+
+        logger.warning(
+            codes.EMBEDDINGS_BLANK_TEXTS_SKIPPED,
+            count=len(unique_texts) - len(embeddable),
+            message=codes.MSG_EMBEDDINGS_BLANK_TEXTS_SKIPPED,
+        )
+        for i, text in enumerate(unique_texts):
+            if not text.strip():
+                unique_embeddings[i] = [0.0] * dimension
+
+    embeddable_texts = [unique_texts[i] for i in embeddable]
+    order = [embeddable[i] for i in length_order(embeddable_texts)]
+    batches = split_batches(
+        [unique_texts[i] for i in order], batch_size, max_batch_tokens, count_tokens
+    )
+
+    return _BatchPlan(unique_embeddings, positions, order, batches)
+
+
+def _collect_batches(
+    plan: _BatchPlan, batch_results: Iterable[Vectors]
+) -> List[List[float]]:
+    """
+    Scatter per-batch results back to input order.
+
+    Rows of float32 batch matrices are kept as array views, not copied
+    into lists; EmbeddingCache.fill converts them once after caching.
+
+    Args:
+        plan: Batch plan the results belong to
+        batch_results: Embeddings for each batch in plan.batches
+
+    Returns:
+        List of embedding vectors in input order
+    """
+    unique_embeddings = plan.unique_embeddings
+
+    start = 0
+    for batch, batch_embeddings in zip(plan.batches, batch_results):
+        # Each batch owns a fixed slice of order, so writes never overlap
+        batch_positions = plan.order[start : start + len(batch)]
+        start += len(batch)
+        for position, embedding in zip(batch_positions, batch_embeddings):
+            unique_embeddings[position] = embedding
+
+    if len(unique_embeddings) == len(plan.positions):
+        # No repeats: dedupe kept input order, so nothing to scatter
+        return unique_embeddings
+    return [unique_embeddings[position] for position in plan.positions]
+
+
+def map_batches(
+    texts: List[str],
+    batch_size: int,
+    process_batch: BatchProcessor,
+    executor: Executor,
+    dimension: int,
+    max_batch_tokens: int = 0,
+    count_tokens: TokenCounter = estimate_tokens,
+) -> List[List[float]]:
+    """
+    Embed texts by dispatching batches to a thread pool.
+
+    Repeated texts are embedded once and their vectors shared. Empty and
+    whitespace-only texts are never sent (APIs reject them, failing the
+    whole batch): they raise ValueError, or get a zero vector when the
+    provider passes its output dimension. The rest are sorted by
+    length and packed into batches bounded by count and estimated
+    tokens, so per-batch token counts stay uniform. Each
+    batch runs the provider's blocking call on the provider's shared
+    executor, whose worker count bounds how many batches are in flight.
+    The output list is pre-allocated and each batch writes its results
+    straight into their input positions, so output order matches input
+    order. A single batch runs in the calling thread.
+
+    Args:
+        texts: Texts to embed
+        batch_size: Maximum number of texts per batch
+        process_batch: Provider callable taking (batch, batch_num)
+        executor: Executor running the batches
+        dimension: Zero-vector dimension for blank texts (0 rejects them)
+        max_batch_tokens: Maximum estimated tokens per batch (0 disables)
+        count_tokens: Token counter used for packing
+
+    Returns:
+        List of embedding vectors in input order
+
+    Raises:
+        ValueError: If texts contain blanks and dimension is 0
+    """
+    plan = _plan_batches(texts, batch_size, dimension, max_batch_tokens, count_tokens)
+    batches = plan.batches
+
+    if len(batches) == 1:
+        batch_results = [process_batch(batches[0], 1)]
+    else:
+        futures = [
+            executor.submit(process_batch, batch, index + 1)
+            for index, batch in enumerate(batches)
+        ]
+        batch_results = (future.result() for future in futures)
+
+    return _collect_batches(plan, batch_results)
+
+
+async def gather_batches(
+    texts: List[str],
+    batch_size: int,
+    process_batch: AsyncBatchProcessor,
+    max_concurrency: int,
+    dimension: int,
+    max_batch_tokens: int = 0,
+    count_tokens: TokenCounter = estimate_tokens,
+) -> List[List[float]]:
+    """
+    Embed texts by awaiting batches concurrently on the running loop.
+
+    Async counterpart of map_batches for providers with a native async
+    client: batching, dedupe and blank handling are identical, but batches
+    are coroutines bounded by a semaphore instead of thread pool jobs.
+
+    Args:
+        texts: Texts to embed
+        batch_size: Maximum number of texts per batch
+        process_batch: Provider coroutine function taking (batch, batch_num)
+        max_concurrency: Maximum number of batches in flight
+        dimension: Zero-vector dimension for blank texts (0 rejects them)
+        max_batch_tokens: Maximum estimated tokens per batch (0 disables)
+        count_tokens: Token counter used for packing
+
+    Returns:
+        List of embedding vectors in input order
+
+    Raises:
+        ValueError: If texts contain blanks and dimension is 0
+    """
+    plan = _plan_batches(texts, batch_size, dimension, max_batch_tokens, count_tokens)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(index: int, batch: List[str]) -> List[List[float]]:
+        async with semaphore:
+            return await process_batch(batch, index + 1)
+
+    batch_results = await asyncio.gather(
+        *(run(index, batch) for index, batch in enumerate(plan.batches))
+    )
+
+    return _collect_batches(plan, batch_results)
+
+
+def iter_windows(
+    embed_documents: Callable[[List[str]], List[List[float]]],
+    texts: List[str],
+    window_size: int,
+) -> Iterator[List[List[float]]]:
+    """
+    Embed texts one window at a time.
+
+    Args:
+        embed_documents: Provider embed_documents method
+        texts: Texts to embed
+        window_size: Number of texts embedded per window
+
+    Yields:
+        Embedding vectors for each window, in input order
+    """
+    window_size = max(1, window_size)
+    for start in range(0, len(texts), window_size):
+        yield embed_documents(texts[start : start + window_size])
+
+
+def pipeline_windows(
+    windows: Iterator[List[List[float]]],
+    write: Callable[[int, List[List[float]]], None],
+) -> int:
+    """
+    Write embedded windows while the next window is being embedded.
+
+    Each window is handed to write() on a single background thread, then
+    the caller's thread advances the iterator, so the vector store upsert
+    of window k overlaps the provider calls for window k + 1. Writes stay
+    sequential and in order; a failed write stops the pipeline and is
+    raised to the caller.
+
+    Args:
+        windows: Embedding windows, e.g. from iter_embed_documents()
+        write: Called as write(start, vectors), where start is the index of
+            the window's first text in the full input
+
+    Returns:
+        Number of vectors written
+    """
+    start = 0
+    pending: Optional[Future] = None
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="vector-writer") as pool:
+        for vectors in windows:
+            if pending is not None:
+                pending.result()
+            pending = pool.submit(write, start, vectors)
+            start += len(vectors)
+
+        if pending is not None:
+            pending.result()
+
+    return start
+
+
+def write_windows(
+    embeddings: Any,
+    texts: List[str],
+    vectors: Optional[List[List[float]]],
+    write: Callable[[int, List[List[float]]], None],
+) -> int:
+    """
+    Embed texts window by window and write each window to a vector store.
+
+    Precomputed vectors are written in a single call on the calling thread;
+    there is nothing to embed, so nothing for a writer thread to overlap.
+    Otherwise windows from the provider's iter_embed_documents() go through
+    pipeline_windows.
+
+    Args:
+        embeddings: Embeddings provider with iter_embed_documents()
+        texts: Document texts
+        vectors: Optional precomputed vectors, one per text
+        write: Called as write(start, vectors), as for pipeline_windows
+
+    Returns:
+        Number of vectors written
+    """
+    if vectors is not None:
+        write(0, vectors)
+        return len(vectors)
+    return pipeline_windows(embeddings.iter_embed_documents(texts), write)
+
+
+def _retry_policy(
+    retryable: Tuple[Type[BaseException], ...], max_attempts: int, max_wait_seconds: int
+) -> Dict[str, Any]:
+    """Build tenacity arguments shared by the sync and async retry paths."""
+    return {
+        "retry": retry_if_exception_type(retryable),
+        "wait": _retry_wait(max_wait_seconds),
+        "stop": stop_after_attempt(max(1, max_attempts)),
+        "before_sleep": _log_retry,
+        "reraise": True,
+    }
+
+
+def _retry_wait(max_wait_seconds: int) -> Callable[[Any], float]:
+    """
+    Build the tenacity wait between retries of a batch call.
+
+    Waits follow the server's Retry-After header when the error carries
+    one, else exponential backoff with full jitter. Both are randomized
+    so concurrent batches throttled together don't retry in lockstep.
+    """
+    backoff = wait_random_exponential(multiplier=1, max=max_wait_seconds)
+
+    def wait(retry_state) -> float:
+        retry_after = _retry_after(retry_state.outcome.exception())
+        if retry_after is None:
+            return backoff(retry_state)
+        return min(max_wait_seconds, retry_after + random.uniform(0, 1))
+
+    return wait
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Read the Retry-After delay in seconds from an HTTP error, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        # HTTP-date values are rare for rate limits; fall back to backoff
+        pass
+    return None
+
+
+def _halves(batch: List[str], error: Exception) -> Tuple[List[str], List[str]]:
+    """Log a batch split and return its two halves."""
+    logger.warning(
+        codes.EMBEDDINGS_BATCH_SPLITTING,
+        batch_size=len(batch),
+        error=str(error),
+        message=codes.MSG_EMBEDDINGS_BATCH_SPLITTING,
+    )
+
+    middle = len(batch) // 2
+    return batch[:middle], batch[middle:]
+
+
+def embed_with_retry(
+    embed_batch: BatchEmbedder,
+    batch: List[str],
+    retryable: Tuple[Type[BaseException], ...],
+    splittable: Tuple[Type[BaseException], ...],
+    max_attempts: int,
+    max_wait_seconds: int,
+) -> List[List[float]]:
+    """
+    Embed a batch, retrying transient errors and splitting on bad input.
+
+    Errors of a retryable type (rate limits, connection errors) are retried
+    with exponential backoff. If the batch is rejected as an invalid request
+    it is split in half and each half is retried, isolating bad inputs
+    (e.g. an oversized document) down to a single text. Every other error
+    (authentication, permission, unknown model, exhausted retries) is
+    raised as-is, since no smaller batch would succeed.
+
+    Args:
+        embed_batch: Provider call embedding a list of texts
+        batch: Batch of texts to embed
+        retryable: Exception types worth retrying
+        splittable: Invalid-request exception types worth splitting on
+        max_attempts: Maximum attempts per call
+        max_wait_seconds: Maximum backoff between attempts
+
+    Returns:
+        List of embedding vectors for the batch
+    """
+    retrying = Retrying(**_retry_policy(retryable, max_attempts, max_wait_seconds))
+
+    try:
+        return retrying(embed_batch, batch)
+    except splittable as e:
+        if len(batch) <= 1:
+            raise
+
+        return [
+            embedding
+            for half in _halves(batch, e)
+            for embedding in embed_with_retry(
+                embed_batch,
+                half,
+                retryable,
+                splittable,
+                max_attempts,
+                max_wait_seconds,
+            )
+        ]
+
+
+async def aembed_with_retry(
+    embed_batch: AsyncBatchEmbedder,
+    batch: List[str],
+    retryable: Tuple[Type[BaseException], ...],
+    splittable: Tuple[Type[BaseException], ...],
+    max_attempts: int,
+    max_wait_seconds: int,
+) -> List[List[float]]:
+    """
+    Async counterpart of embed_with_retry for native async clients.
+
+    Args:
+        embed_batch: Provider coroutine function embedding a list of texts
+        batch: Batch of texts to embed
+        retryable: Exception types worth retrying
+        splittable: Invalid-request exception types worth splitting on
+        max_attempts: Maximum attempts per call
+        max_wait_seconds: Maximum backoff between attempts
+
+    Returns:
+        List of embedding vectors for the batch
+    """
+    retrying = AsyncRetrying(**_retry_policy(retryable, max_attempts, max_wait_seconds))
+
+    try:
+        return await retrying(embed_batch, batch)
+    except splittable as e:
+        if len(batch) <= 1:
+            raise
+
+        embeddings: List[List[float]] = []
+        for half in _halves(batch, e):
+            embeddings.extend(
+                await aembed_with_retry(
+                    embed_batch,
+                    half,
+                    retryable,
+                    splittable,
+                    max_attempts,
+                    max_wait_seconds,
+                )
+            )
+        return embeddings
+
+
+def _log_retry(retry_state) -> None:
+    """Log a retried batch call (tenacity before_sleep hook)."""
+    logger.warning(
+        codes.EMBEDDINGS_BATCH_RETRYING,
+        attempt=retry_state.attempt_number,
+        error=str(retry_state.outcome.exception()),
+        message=codes.MSG_EMBEDDINGS_BATCH_RETRYING,
+    )
@@ -0,0 +1,372 @@
+"""
+In-process LRU cache for embedding vectors.
+
+RAG pipelines embed the same queries across sessions and the same chunks
+across re-ingests. Caching vectors by (provider, model, input type, text
+digest) lets repeat inputs skip the provider call entirely.
+
+Vectors are held as contiguous float32 arrays rather than lists of Python
+floats, cutting per-vector memory from ~32 bytes per dimension (boxed
+float plus list slot) to 4. Provider models emit float32, so the values
+round-trip unchanged. Once the cache is full, each new vector is copied
+into the evicted entry's array, so steady-state puts don't allocate.
+
+With a cache_dir configured, vectors are also written through to a SQLite
+file keyed by SHA-256 of (provider, model, dimension, input type, text),
+so repeat inputs skip the provider call across restarts and re-ingests.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+CacheKey = Tuple[str, str, str, bytes]
+
+_DISK_CACHE_FILENAME = "embeddings.sqlite3"
+
+# Keys per SELECT, below SQLite's default bound-parameter limit (999)
+_DISK_QUERY_CHUNK = 500
+
+
+class DiskEmbeddingStore:
+    """
+    Persistent embedding store backed by SQLite.
+
+    Vectors are stored as raw float32 bytes under a SHA-256 digest of the
+    provider, model, dimension, input type and text, so entries written by
+    one model or output size are never served to another.
+
+    Attributes:
+        path: Path to the SQLite database file
+    """
+
+    def __init__(self, cache_dir: str, provider: str, model: str, dimension: int):
+        """
+        Open (or create) the store under cache_dir.
+
+        Args:
+            cache_dir: Directory holding the SQLite file
+            provider: Embeddings provider name
+            model: Model name
+            dimension: Embedding dimension requested from the model
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, _DISK_CACHE_FILENAME)
+        self._prefix = f"{provider}|{model}|{dimension}|"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+    def _key(self, text: str, input_type: str) -> bytes:
+        """Build SHA-256 key for text and input type."""
+        return hashlib.sha256(
+            f"{self._prefix}{input_type}|{text}".encode("utf-8")
+        ).digest()
+
+    def get(self, text: str, input_type: str) -> Optional[np.ndarray]:
+        """
+        Get stored embedding for text.
+
+        Args:
+            text: Input text
+            input_type: Input type (e.g. document or query)
+
+        Returns:
+            Stored float32 vector, or None if absent
+        """
+        return self.get_many([text], input_type)[0]
+
+    def get_many(self, texts: List[str], input_type: str) -> List[Optional[np.ndarray]]:
+        """
+        Get stored embeddings for multiple texts with batched queries.
+
+        Args:
+            texts: Input texts
+            input_type: Input type (e.g. document or query)
+
+        Returns:
+            Per-text float32 vector, or None if absent
+        """
+        keys = [self._key(text, input_type) for text in texts]
+        vectors: Dict[bytes, bytes] = {}
+
+        with self._lock:
+            # One IN (...) query per chunk instead of a round trip per text
+            for start in range(0, len(keys), _DISK_QUERY_CHUNK):
+                chunk = keys[start : start + _DISK_QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                vectors.update(
+                    self._conn.execute(
+                        "SELECT key, vector FROM embeddings "
+                        f"WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+
+        return [
+            np.frombuffer(vectors[key], dtype=np.float32) if key in vectors else None
+            for key in keys
+        ]
+
+    def put_many(
+        self, texts: List[str], input_type: str, embeddings: List[List[float]]
+    ) -> None:
+        """
+        Store embeddings for multiple texts in one transaction.
+
+        Args:
+            texts: Input texts
+            input_type: Input type (e.g. document or query)
+            embeddings: Embedding vectors aligned with texts
+        """
+        rows = [
+            (
+                self._key(text, input_type),
+                np.asarray(embedding, dtype=np.float32).tobytes(),
+            )
+            for text, embedding in zip(texts, embeddings)
+        ]
+        if not rows:
+            return
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                rows,
+            )
+
+    def clear(self) -> None:
+        """Remove all stored embeddings for every provider and model."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM embeddings")
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache of embedding vectors.
+
+    Keys hash the text with BLAKE2b (128-bit digest) so long documents
+    don't stay alive as dict keys. A capacity of 0 disables the in-process
+    tier; a cache_dir adds a persistent DiskEmbeddingStore behind it.
+
+    Attributes:
+        provider: Embeddings provider name
+        model: Model name
+        capacity: Maximum number of cached vectors
+        hits: Number of cache hits
+        misses: Number of cache misses
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        capacity: int,
+        cache_dir: str = "",
+        dimension: int = 0,
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            provider: Embeddings provider name
+            model: Model name
+            capacity: Maximum number of cached vectors (0 disables caching)
+            cache_dir: Directory for the persistent store ("" disables it)
+            dimension: Embedding dimension, part of the persistent key
+        """
+        self.provider = provider
+        self.model = model
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = (
+            DiskEmbeddingStore(cache_dir, provider, model, dimension)
+            if cache_dir
+            else None
+        )
+
+    def _key(self, text: str, input_type: str) -> CacheKey:
+        """Build cache key for text and input type."""
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        return (self.provider, self.model, input_type, digest)
+
+    def get(self, text: str, input_type: str) -> Optional[List[float]]:
+        """
+        Get cached embedding for text.
+
+        Args:
+            text: Input text
+            input_type: Input type (e.g. document or query)
+
+        Returns:
+            Cached embedding vector, or None on miss
+        """
+        return self._get_many([text], input_type)[0]
+
+    def _get_many(
+        self, texts: List[str], input_type: str
+    ) -> List[Optional[List[float]]]:
+        """Get embeddings from memory, then the persistent store in one query."""
+        results = [self._get_memory(text, input_type) for text in texts]
+
+        absent = [i for i, embedding in enumerate(results) if embedding is None]
+        if absent and self._disk is not None:
+            stored = self._disk.get_many([texts[i] for i in absent], input_type)
+            for index, vector in zip(absent, stored):
+                if vector is not None:
+                    self._put_memory(texts[index], input_type, vector)
+                    results[index] = vector.tolist()
+
+        hits = sum(embedding is not None for embedding in results)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(results) - hits
+        return results
+
+    def _get_memory(self, text: str, input_type: str) -> Optional[List[float]]:
+        """Get embedding from the in-process LRU tier."""
+        if self.capacity <= 0:
+            return None
+
+        key = self._key(text, input_type)
+
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                return None
+            self._entries.move_to_end(key)
+            return embedding.tolist()
+
+    def put(self, text: str, input_type: str, embedding: List[float]) -> None:
+        """
+        Store embedding for text, evicting least recently used entries.
+
+        Args:
+            text: Input text
+            input_type: Input type (e.g. document or query)
+            embedding: Embedding vector
+        """
+        self._put_memory(text, input_type, embedding)
+        if self._disk is not None:
+            self._disk.put_many([text], input_type, [embedding])
+
+    def _put_memory(
+        self, text: str, input_type: str, embedding: Union[List[float], np.ndarray]
+    ) -> None:
+        """Store embedding in the in-process LRU tier."""
+        if self.capacity <= 0:
+            return
+
+        key = self._key(text, input_type)
+
+        with self._lock:
+            # Entries never leave the cache (get() returns a copy), so the
+            # array being replaced or evicted can be refilled in place
+            buffer = self._entries.pop(key, None)
+            while len(self._entries) >= self.capacity:
+                _, evicted = self._entries.popitem(last=False)
+                buffer = evicted if buffer is None else buffer
+
+            if buffer is not None and buffer.shape == (len(embedding),):
+                np.copyto(buffer, embedding)
+            else:
+                buffer = np.array(embedding, dtype=np.float32)
+
+            self._entries[key] = buffer
+
+    def lookup(
+        self, texts: List[str], input_type: str
+    ) -> Tuple[List[Optional[List[float]]], List[int]]:
+        """
+        Look up embeddings for multiple texts.
+
+        Args:
+            texts: Input texts
+            input_type: Input type (e.g. document or query)
+
+        Returns:
+            Tuple of (per-text embedding or None, indices of cache misses)
+        """
+        # Repeated texts are looked up once and share the result; texts
+        # missing from memory are read from disk in batched queries
+        unique = list(dict.fromkeys(texts))
+        found = dict(zip(unique, self._get_many(unique, input_type)))
+
+        results = [found[text] for text in texts]
+        missing = [i for i, embedding in enumerate(results) if embedding is None]
+        return results, missing
+
+    def store(
+        self, texts: List[str], input_type: str, embeddings: List[List[float]]
+    ) -> None:
+        """
+        Store embeddings for multiple texts.
+
+        Args:
+            texts: Input texts
+            input_type: Input type (e.g. document or query)
+            embeddings: Embedding vectors aligned with texts
+        """
+        # Repeated texts carry the same vector; write each one once. Blank
+        # texts may hold placeholder zero vectors, so they are never cached
+        unique = {
+            text: embedding
+            for text, embedding in zip(texts, embeddings)
+            if text.strip()
+        }
+
+        for text, embedding in unique.items():
+            self._put_memory(text, input_type, embedding)
+        if self._disk is not None:
+            self._disk.put_many(list(unique), input_type, list(unique.values()))
+
+    def fill(
+        self,
+        results: List[Optional[List[float]]],
+        missing: List[int],
+        missing_texts: List[str],
+        input_type: str,
+        embeddings: List[List[float]],
+    ) -> List[List[float]]:
+        """
+        Store freshly computed embeddings and merge them into lookup results.
+
+        Args:
+            results: Per-text results from lookup()
+            missing: Indices of cache misses from lookup()
+            missing_texts: Texts at the missing indices
+            input_type: Input type (e.g. document or query)
+            embeddings: Embedding vectors (lists or float32 rows) for missing_texts
+
+        Returns:
+            Complete list of embedding vectors in input order
+        """
+        self.store(missing_texts, input_type, embeddings)
+
+        for index, embedding in zip(missing, embeddings):
+            if isinstance(embedding, np.ndarray):
+                # Decoded float32 rows are cached as-is, then boxed once here
+                embedding = embedding.tolist()
+            results[index] = embedding
+
+        return results
+
+    def clear(self) -> None:
+        """Remove all cached embeddings, including the persistent store."""
+        with self._lock:
+            self._entries.clear()
+        if self._disk is not None:
+            self._disk.clear()
@@ -4,10 +4,23 @@ Anthropic (Voyage AI) embeddings implementation.
 Uses Voyage AI's embedding models (recommended by Anthropic).
 """
 
+import asyncio
+import os
+import time
 from trace import codes
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List
+
+import certifi
 
 import constants
+from embeddings.batcher import QueryBatcher
+from embeddings.batching import (
+    embed_with_retry,
+    iter_windows,
+    map_batches,
+    shared_executor,
+)
+from embeddings.cache import EmbeddingCache
 from logger import get_logger
 
 if TYPE_CHECKING:
@@ -15,6 +28,35 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Resolved once; certifi.where() stats the bundle file on every call
+_CERTIFI_BUNDLE = certifi.where()
+
+
+def _disable_requests_ssl_verification() -> None:
+    """
+    Make requests skip SSL verification (development only).
+
+    The Voyage AI client has no option for a custom session, so
+    requests.Session.request is patched. The patch is applied at most once
+    per process so constructing more providers doesn't stack wrappers.
+    """
+    import requests
+    import urllib3
+
+    if getattr(requests.Session, "_ssl_verification_disabled", False):
+        return
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    original_request = requests.Session.request
+
+    def patched_request(session, method, url, **kwargs):
+        kwargs["verify"] = False
+        return original_request(session, method, url, **kwargs)
+
+    requests.Session.request = patched_request
+    requests.Session._ssl_verification_disabled = True
+
 
 class AnthropicEmbeddings:
     """
@@ -29,6 +71,10 @@ class AnthropicEmbeddings:
         model: Model name (e.g., "voyage-2")
         input_type: Input type (document or query)
         batch_size: Number of texts to process in one batch
+        max_batch_tokens: Estimated token budget per batch
+        max_concurrent_batches: Number of batches sent to the API concurrently
+        retry_max_attempts: Attempts per batch on transient API errors
+        retry_max_wait_seconds: Maximum backoff between attempts
         dimension: Embedding dimension
     """
 
@@ -53,52 +99,56 @@ class AnthropicEmbeddings:
         self.model = config.embeddings.anthropic.model
         self.input_type = config.embeddings.anthropic.input_type
         self.batch_size = config.embeddings.anthropic.batch_size
+        self.max_batch_tokens = config.embeddings.anthropic.max_batch_tokens
+        self.max_concurrent_batches = config.embeddings.max_concurrent_batches
+        self.retry_max_attempts = config.embeddings.retry_max_attempts
+        self.retry_max_wait_seconds = config.embeddings.retry_max_wait_seconds
+        self._retryable_errors = (
+            voyageai.error.RateLimitError,
+            voyageai.error.ServiceUnavailableError,
+            voyageai.error.Timeout,
+            voyageai.error.APIConnectionError,
+        )
+        # Invalid-request errors are isolated by splitting the batch; auth
+        # errors fail fast
+        self._splittable_errors = (
+            voyageai.error.InvalidRequestError,
+            voyageai.error.MalformedRequestError,
+        )
+        self._executor = shared_executor(
+            "embeddings-anthropic", self.max_concurrent_batches
+        )
+        self._query_batcher = QueryBatcher(
+            self._embed_query_text,
+            self._embed_query_texts,
+            config.embeddings.query_max_batch_size,
+            config.embeddings.query_flush_interval_ms,
+        )
         self.dimension = config.embeddings.dimension
+        self._cache = EmbeddingCache(
+            "anthropic",
+            self.model,
+            config.embeddings.cache_size,
+            config.embeddings.cache_dir,
+            self.dimension,
+        )
         self.verify_ssl = config.embeddings.anthropic.verify_ssl
 
         # Handle SSL verification for Voyage AI client
         if not self.verify_ssl:
-            pass
-
-            import requests
-            import urllib3
-
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-            original_request = requests.Session.request
-
-            def patched_request(self, method, url, **kwargs):
-                kwargs["verify"] = False
-                return original_request(self, method, url, **kwargs)
-
-            requests.Session.request = patched_request
+            _disable_requests_ssl_verification()
 
             logger.warning(
                 codes.CONFIG_WARNING, message=constants.MSG_SSL_DISABLED_VOYAGEAI_DEV
             )
-
-            self.client = voyageai.Client(api_key=config.embeddings.anthropic.api_key)
-
+        else:
+            # Use certifi's certificate bundle (fixes macOS SSL issues)
+            os.environ.setdefault("REQUESTS_CA_BUNDLE", _CERTIFI_BUNDLE)
             logger.info(
-                codes.EMBEDDINGS_INITIALIZED,
+                codes.EMBEDDINGS_INITIALIZING,
                 provider="anthropic",
-                model=self.model,
-                dimension=self.dimension,
-                message=codes.MSG_EMBEDDINGS_INITIALIZED,
+                message=constants.MSG_SSL_CERTIFI_BUNDLE,
             )
-            return
-
-        # Use certifi's certificate bundle (fixes macOS SSL issues)
-        import os
-
-        import certifi
-
-        os.environ["REQUESTS_CA_BUNDLE"] = certifi.where()
-        logger.info(
-            codes.EMBEDDINGS_INITIALIZING,
-            provider="anthropic",
-            message=constants.MSG_SSL_CERTIFI_BUNDLE,
-        )
 
         self.client = voyageai.Client(api_key=config.embeddings.anthropic.api_key)
 
@@ -114,33 +164,82 @@ class AnthropicEmbeddings:
         """
         Generate embeddings for multiple documents.
 
+        Batches are dispatched concurrently on the provider's thread pool,
+        bounded by max_concurrent_batches, and results keep input order.
+
         Args:
             texts: List of text strings to embed
 
         Returns:
             List of embedding vectors
         """
-        logger.info(
-            codes.EMBEDDINGS_GENERATING, count=len(texts), batch_size=self.batch_size
+        start_time = time.perf_counter()
+
+        results, missing = self._cache.lookup(texts, self.input_type)
+        missing_texts = [texts[i] for i in missing]
+
+        embedded = map_batches(
+            missing_texts,
+            self.batch_size,
+            self._process_batch,
+            self._executor,
+            # config.embeddings.dimension need not match the model's output,
+            # so blank texts are rejected rather than zero-filled
+            0,
+            self.max_batch_tokens,
         )
 
-        all_embeddings = []
-
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            batch_num = i // self.batch_size + 1
-
-            batch_embeddings = self._process_batch(batch, batch_num)
-            all_embeddings.extend(batch_embeddings)
+        all_embeddings = self._cache.fill(
+            results, missing, missing_texts, self.input_type, embedded
+        )
 
+        elapsed = (time.perf_counter() - start_time) * 1000  # ms
         logger.info(
             codes.EMBEDDINGS_GENERATED,
             count=len(all_embeddings),
+            cached=len(texts) - len(missing_texts),
+            duration_ms=f"{elapsed:.2f}",
             message=codes.MSG_EMBEDDINGS_GENERATED,
         )
 
         return all_embeddings
 
+    def iter_embed_documents(self, texts: List[str]) -> Iterator[List[List[float]]]:
+        """
+        Generate embeddings for multiple documents window by window.
+
+        Each window holds batch_size * max_concurrent_batches texts, enough
+        to keep every worker busy. Callers can write each window to the
+        vector store before the next is embedded, so memory stays flat for
+        large ingests.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Iterator over embedding vectors for each window, in input order
+        """
+        return iter_windows(
+            self.embed_documents,
+            texts,
+            self.batch_size * self.max_concurrent_batches,
+        )
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple documents asynchronously.
+
+        Runs embed_documents in a worker thread so the event loop is not
+        blocked while batches are in flight.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            List of embedding vectors
+        """
+        return await asyncio.to_thread(self.embed_documents, texts)
+
     def _process_batch(self, batch: List[str], batch_num: int) -> List[List[float]]:
         """
         Process a single batch of texts to generate embeddings.
@@ -152,25 +251,38 @@ class AnthropicEmbeddings:
         Returns:
             List of embedding vectors for the batch
         """
-        logger.debug(
-            codes.EMBEDDINGS_BATCH_PROCESSING,
-            batch_num=batch_num,
-            batch_size=len(batch),
-        )
-
         try:
-            response = self.client.embed(
-                texts=batch, model=self.model, input_type=self.input_type
+            return embed_with_retry(
+                self._embed_batch,
+                batch,
+                self._retryable_errors,
+                self._splittable_errors,
+                self.retry_max_attempts,
+                self.retry_max_wait_seconds,
             )
 
-            return response.embeddings
-
         except Exception as e:
             logger.error(
                 codes.EMBEDDINGS_ERROR, batch_num=batch_num, error=str(e), exc_info=True
             )
             raise
 
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of texts with a single Voyage AI API call.
+
+        Args:
+            batch: Batch of texts to embed
+
+        Returns:
+            List of embedding vectors for the batch
+        """
+        response = self.client.embed(
+            texts=batch, model=self.model, input_type=self.input_type
+        )
+
+        return response.embeddings
+
     def embed_query(self, text: str) -> List[float]:
         """
         Generate embedding for a single query.
@@ -182,26 +294,62 @@ class AnthropicEmbeddings:
 
         Returns:
             Embedding vector
+
+        Raises:
+            ValueError: If text is empty or whitespace
         """
+        # Rejected before the cache and the API, which would answer with a 400
+        if not text.strip():
+            raise ValueError(constants.ERROR_QUERY_EMPTY)
+
+        cached = self._cache.get(text, constants.EMBEDDINGS_INPUT_TYPE_QUERY)
+        if cached is not None:
+            return cached
+
         logger.debug(codes.EMBEDDINGS_GENERATING, count=1, type="query")
 
         try:
-            response = self.client.embed(
-                texts=[text],
-                model=self.model,
-                input_type="query",  # Use query-specific input type
-            )
-
-            embedding = response.embeddings[0]
+            embedding = self._query_batcher.submit(text)
 
             logger.debug(codes.EMBEDDINGS_GENERATED, dimension=len(embedding))
 
+            self._cache.put(text, constants.EMBEDDINGS_INPUT_TYPE_QUERY, embedding)
             return embedding
 
         except Exception as e:
             logger.error(codes.EMBEDDINGS_ERROR, error=str(e), exc_info=True)
             raise
 
+    def _embed_query_text(self, text: str) -> List[float]:
+        """
+        Embed a single query with the Voyage AI API.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector
+        """
+        return self._embed_query_texts([text])[0]
+
+    def _embed_query_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed multiple queries with one Voyage AI API call.
+
+        Args:
+            texts: Query texts
+
+        Returns:
+            List of embedding vectors
+        """
+        response = self.client.embed(
+            texts=texts,
+            model=self.model,
+            input_type="query",  # Use query-specific input type
+        )
+
+        return response.embeddings
+
     def get_dimension(self) -> int:
         """
         Get the dimension of embeddings.
@@ -4,12 +4,21 @@ Google embeddings implementation using Google Generative AI.
 Uses Google's text-embedding-004 model for generating embeddings.
 """
 
+import asyncio
+import functools
+import time
 from trace import codes
-from typing import TYPE_CHECKING, List
-
-import google.generativeai as genai
+from typing import TYPE_CHECKING, Iterator, List, Union
 
 import constants
+from embeddings.batcher import QueryBatcher
+from embeddings.batching import (
+    embed_with_retry,
+    iter_windows,
+    map_batches,
+    shared_executor,
+)
+from embeddings.cache import EmbeddingCache
 from logger import get_logger
 
 if TYPE_CHECKING:
@@ -18,6 +27,22 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_genai():
+    """
+    Import google.generativeai on first use.
+
+    The SDK pulls in grpc and protobuf, so it is only loaded once a Google
+    provider is actually constructed.
+
+    Returns:
+        The google.generativeai module
+    """
+    import google.generativeai as genai
+
+    return genai
+
+
 class GoogleEmbeddings:
     """
     Google embeddings provider implementation.
@@ -30,6 +55,9 @@ class GoogleEmbeddings:
         model: Model name (e.g., "models/text-embedding-004")
         task_type: Task type for embeddings ("retrieval_document" or "retrieval_query")
         batch_size: Number of texts to process in one batch
+        max_concurrent_batches: Number of batches sent to the API concurrently
+        retry_max_attempts: Attempts per batch on transient API errors
+        retry_max_wait_seconds: Maximum backoff between attempts
         dimension: Embedding dimension
     """
 
@@ -42,12 +70,49 @@ class GoogleEmbeddings:
         """
         logger.info(codes.EMBEDDINGS_INITIALIZING, provider="google")
 
+        try:
+            genai = _get_genai()
+            from google.api_core import exceptions as google_exceptions
+        except ImportError:
+            logger.error(
+                codes.EMBEDDINGS_ERROR,
+                message=constants.ERROR_GOOGLE_GENAI_NOT_INSTALLED,
+            )
+            raise ImportError(constants.ERROR_GOOGLE_GENAI_NOT_INSTALLED)
+
         self.config = config
         self.model = config.embeddings.google.model
         self.task_type = config.embeddings.google.task_type
         self.batch_size = config.embeddings.google.batch_size
+        self.max_concurrent_batches = config.embeddings.max_concurrent_batches
+        self.retry_max_attempts = config.embeddings.retry_max_attempts
+        self.retry_max_wait_seconds = config.embeddings.retry_max_wait_seconds
+        self._retryable_errors = (
+            google_exceptions.ResourceExhausted,
+            google_exceptions.ServiceUnavailable,
+            google_exceptions.DeadlineExceeded,
+        )
+        # Invalid-argument errors are isolated by splitting the batch; auth,
+        # permission and not-found errors fail fast
+        self._splittable_errors = (google_exceptions.InvalidArgument,)
+        self._executor = shared_executor(
+            "embeddings-google", self.max_concurrent_batches
+        )
+        self._query_batcher = QueryBatcher(
+            self._embed_query_text,
+            self._embed_query_texts,
+            config.embeddings.query_max_batch_size,
+            config.embeddings.query_flush_interval_ms,
+        )
         self.title = config.embeddings.google.title
         self.dimension = config.embeddings.dimension
+        self._cache = EmbeddingCache(
+            "google",
+            self.model,
+            config.embeddings.cache_size,
+            config.embeddings.cache_dir,
+            self.dimension,
+        )
 
         # Configure Google API (should already be done, but ensure it's set)
         if config.google.api_key:
@@ -65,7 +130,8 @@ class GoogleEmbeddings:
         """
         Generate embeddings for multiple documents.
 
-        Processes texts in batches to respect API limits and improve performance.
+        Batches are dispatched concurrently on the provider's thread pool,
+        bounded by max_concurrent_batches, and results keep input order.
 
         Args:
             texts: List of text strings to embed
@@ -73,27 +139,72 @@ class GoogleEmbeddings:
         Returns:
             List of embedding vectors
         """
-        logger.info(
-            codes.EMBEDDINGS_GENERATING, count=len(texts), batch_size=self.batch_size
+        start_time = time.perf_counter()
+
+        results, missing = self._cache.lookup(texts, self.task_type)
+        missing_texts = [texts[i] for i in missing]
+
+        embedded = map_batches(
+            missing_texts,
+            self.batch_size,
+            self._process_batch,
+            self._executor,
+            # config.embeddings.dimension need not match the model's output,
+            # so blank texts are rejected rather than zero-filled
+            0,
         )
 
-        all_embeddings = []
-
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            batch_num = i // self.batch_size + 1
-
-            batch_embeddings = self._process_batch(batch, batch_num)
-            all_embeddings.extend(batch_embeddings)
+        all_embeddings = self._cache.fill(
+            results, missing, missing_texts, self.task_type, embedded
+        )
 
+        elapsed = (time.perf_counter() - start_time) * 1000  # ms
         logger.info(
             codes.EMBEDDINGS_GENERATED,
             count=len(all_embeddings),
+            cached=len(texts) - len(missing_texts),
+            duration_ms=f"{elapsed:.2f}",
             message=codes.MSG_EMBEDDINGS_GENERATED,
         )
 
         return all_embeddings
 
+    def iter_embed_documents(self, texts: List[str]) -> Iterator[List[List[float]]]:
+        """
+        Generate embeddings for multiple documents window by window.
+
+        Each window holds batch_size * max_concurrent_batches texts, enough
+        to keep every worker busy. Callers can write each window to the
+        vector store before the next is embedded, so memory stays flat for
+        large ingests.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Iterator over embedding vectors for each window, in input order
+        """
+        return iter_windows(
+            self.embed_documents,
+            texts,
+            self.batch_size * self.max_concurrent_batches,
+        )
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple documents asynchronously.
+
+        Runs embed_documents in a worker thread so the event loop is not
+        blocked while batches are in flight.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            List of embedding vectors
+        """
+        return await asyncio.to_thread(self.embed_documents, texts)
+
     def _process_batch(self, batch: List[str], batch_num: int) -> List[List[float]]:
         """
         Process a single batch of texts to generate embeddings.
@@ -105,28 +216,34 @@ class GoogleEmbeddings:
         Returns:
             List of embedding vectors for the batch
         """
-        logger.debug(
-            codes.EMBEDDINGS_BATCH_PROCESSING,
-            batch_num=batch_num,
-            batch_size=len(batch),
-        )
-
         try:
-            result = genai.embed_content(
-                model=self.model,
-                content=batch,
-                task_type=self.task_type,
-                title=self.title if self.title else None,
+            return embed_with_retry(
+                self._embed_batch,
+                batch,
+                self._retryable_errors,
+                self._splittable_errors,
+                self.retry_max_attempts,
+                self.retry_max_wait_seconds,
             )
 
-            return result.get(constants.EMBEDDING_KEY, [])
-
         except Exception as e:
             logger.error(
                 codes.EMBEDDINGS_ERROR, batch_num=batch_num, error=str(e), exc_info=True
             )
             raise
 
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of texts with a single Google API call.
+
+        Args:
+            batch: Batch of texts to embed
+
+        Returns:
+            List of embedding vectors for the batch
+        """
+        return self._embed_content(batch, self.task_type) or []
+
     def embed_query(self, text: str) -> List[float]:
         """
         Generate embedding for a single query.
@@ -139,29 +256,79 @@ class GoogleEmbeddings:
 
         Returns:
             Embedding vector
+
+        Raises:
+            ValueError: If text is empty or whitespace
         """
+        # Rejected before the cache and the API, which would answer with a 400
+        if not text.strip():
+            raise ValueError(constants.ERROR_QUERY_EMPTY)
+
+        cached = self._cache.get(text, constants.TASK_TYPE_QUERY)
+        if cached is not None:
+            return cached
+
         logger.debug(codes.EMBEDDINGS_GENERATING, count=1, type="query")
 
         try:
-            result = genai.embed_content(
-                model=self.model,
-                content=text,
-                task_type=constants.TASK_TYPE_QUERY,
-                title=self.title if self.title else None,
-            )
-
-            embedding = result.get(constants.EMBEDDING_KEY)
+            embedding = self._query_batcher.submit(text)
 
             logger.debug(
                 codes.EMBEDDINGS_GENERATED, dimension=len(embedding) if embedding else 0
             )
 
+            if embedding:
+                self._cache.put(text, constants.TASK_TYPE_QUERY, embedding)
             return embedding
 
         except Exception as e:
             logger.error(codes.EMBEDDINGS_ERROR, error=str(e), exc_info=True)
             raise
 
+    def _embed_query_text(self, text: str) -> List[float]:
+        """
+        Embed a single query with the Google API.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector
+        """
+        return self._embed_content(text, constants.TASK_TYPE_QUERY)
+
+    def _embed_query_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed multiple queries with one Google API call.
+
+        Args:
+            texts: Query texts
+
+        Returns:
+            List of embedding vectors
+        """
+        return self._embed_content(texts, constants.TASK_TYPE_QUERY) or []
+
+    def _embed_content(self, content: Union[str, List[str]], task_type: str):
+        """
+        Call genai.embed_content, the single place the Google API is invoked.
+
+        Args:
+            content: A text, or a list of texts for a batched call
+            task_type: Google task type (document or query)
+
+        Returns:
+            Embedding vector for a text, or list of vectors for a list
+        """
+        result = _get_genai().embed_content(
+            model=self.model,
+            content=content,
+            task_type=task_type,
+            title=self.title if self.title else None,
+        )
+
+        return result.get(constants.EMBEDDING_KEY)
+
     def get_dimension(self) -> int:
         """
         Get the dimension of embeddings.
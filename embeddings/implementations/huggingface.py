@@ -4,10 +4,14 @@ HuggingFace embeddings implementation.
 Uses sentence-transformers models for local embedding generation.
 """
 
+import os
+import time
 from trace import codes
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List
 
 import constants
+from embeddings.batching import dedupe, iter_windows
+from embeddings.cache import EmbeddingCache
 from logger import get_logger
 
 if TYPE_CHECKING:
@@ -16,6 +20,21 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _configure_inference_runtime() -> None:
+    """
+    Quiet transformers and pin tokenizer parallelism before the model loads.
+
+    transformers' per-call warnings and the tokenizers fork warning
+    otherwise add logging work to the encode() hot path. Setting
+    TOKENIZERS_PARALLELISM explicitly keeps parallel batch tokenization
+    and silences the fork warning; an existing value is respected.
+    """
+    import transformers
+
+    transformers.logging.set_verbosity_error()
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+
 class HuggingFaceEmbeddings:
     """
     HuggingFace embeddings provider implementation.
@@ -27,6 +46,8 @@ class HuggingFaceEmbeddings:
         config: Application configuration
         model: SentenceTransformer model instance
         model_name: Name of the model
+        batch_size: Number of texts encoded per forward pass
+        precision: Weight precision (fp32, fp16, bf16 or int8)
         dimension: Embedding dimension
     """
 
@@ -52,6 +73,8 @@ class HuggingFaceEmbeddings:
         self.model_name = config.embeddings.huggingface.model_name
         self.cache_folder = config.embeddings.huggingface.cache_folder
         self.device = config.embeddings.huggingface.device
+        self.batch_size = config.embeddings.huggingface.batch_size
+        self.precision = config.embeddings.huggingface.precision.lower()
 
         logger.info(
             codes.EMBEDDINGS_MODEL_LOADING,
@@ -59,21 +82,79 @@ class HuggingFaceEmbeddings:
             device=self.device,
         )
 
+        _configure_inference_runtime()
+
         self.model = SentenceTransformer(
             self.model_name, cache_folder=self.cache_folder, device=self.device
         )
 
+        # Read dimension before quantization swaps out the Linear layers
         self.dimension = self.model.get_sentence_embedding_dimension()
 
+        self._apply_precision()
+
+        # Vectors differ by precision, so the effective one (after any fp32
+        # fallback) is part of the cache key alongside model and dimension
+        self._cache = EmbeddingCache(
+            "huggingface",
+            f"{self.model_name}@{self.precision}",
+            config.embeddings.cache_size,
+            config.embeddings.cache_dir,
+            self.dimension,
+        )
+
+        # Inference only: disable dropout once instead of relying on encode()
+        self.model.eval()
+
         logger.info(
             codes.EMBEDDINGS_INITIALIZED,
             provider="huggingface",
             model=self.model_name,
             dimension=self.dimension,
             device=self.device,
+            precision=self.precision,
             message=codes.MSG_EMBEDDINGS_INITIALIZED,
         )
 
+    def _apply_precision(self) -> None:
+        """
+        Convert model weights to the configured precision.
+
+        fp16/bf16 halve memory bandwidth on GPU; int8 dynamic quantization
+        of Linear layers speeds up CPU inference. Unsupported
+        precision/device combinations fall back to fp32.
+        """
+        if self.precision == constants.EMBEDDINGS_PRECISION_FP32:
+            return
+
+        on_cuda = self.device.startswith("cuda")
+
+        if self.precision == constants.EMBEDDINGS_PRECISION_FP16 and on_cuda:
+            self.model.half()
+            return
+
+        if self.precision == constants.EMBEDDINGS_PRECISION_BF16 and on_cuda:
+            import torch
+
+            self.model.to(torch.bfloat16)
+            return
+
+        if self.precision == constants.EMBEDDINGS_PRECISION_INT8 and not on_cuda:
+            import torch
+
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            return
+
+        logger.warning(
+            codes.CONFIG_WARNING,
+            precision=self.precision,
+            device=self.device,
+            message=constants.MSG_EMBEDDINGS_PRECISION_UNSUPPORTED,
+        )
+        self.precision = constants.EMBEDDINGS_PRECISION_FP32
+
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for multiple documents.
@@ -84,18 +165,37 @@ class HuggingFaceEmbeddings:
         Returns:
             List of embedding vectors
         """
-        logger.info(codes.EMBEDDINGS_GENERATING, count=len(texts))
+        start_time = time.perf_counter()
+
+        input_type = constants.EMBEDDINGS_INPUT_TYPE_DOCUMENT
+        results, missing = self._cache.lookup(texts, input_type)
+        missing_texts = [texts[i] for i in missing]
 
         try:
-            embeddings = self.model.encode(
-                texts, convert_to_numpy=False, show_progress_bar=False
+            embedded = []
+            if missing_texts:
+                unique_texts, positions = dedupe(missing_texts)
+
+                # One contiguous float32 array, converted to lists in a single
+                # C-level tolist() call instead of one per vector
+                unique_embedded = self.model.encode(
+                    unique_texts,
+                    batch_size=self.batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                ).tolist()
+                embedded = [unique_embedded[position] for position in positions]
+
+            embeddings_list = self._cache.fill(
+                results, missing, missing_texts, input_type, embedded
             )
 
-            embeddings_list = [emb.tolist() for emb in embeddings]
-
+            elapsed = (time.perf_counter() - start_time) * 1000  # ms
             logger.info(
                 codes.EMBEDDINGS_GENERATED,
                 count=len(embeddings_list),
+                cached=len(texts) - len(missing_texts),
+                duration_ms=f"{elapsed:.2f}",
                 message=codes.MSG_EMBEDDINGS_GENERATED,
             )
 
@@ -105,6 +205,22 @@ class HuggingFaceEmbeddings:
             logger.error(codes.EMBEDDINGS_ERROR, error=str(e), exc_info=True)
             raise
 
+    def iter_embed_documents(self, texts: List[str]) -> Iterator[List[List[float]]]:
+        """
+        Generate embeddings for multiple documents window by window.
+
+        Each window is one encode() batch. Callers can write each window
+        to the vector store before the next is embedded, so memory stays
+        flat for large ingests.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Iterator over embedding vectors for each window, in input order
+        """
+        return iter_windows(self.embed_documents, texts, self.batch_size)
+
     def embed_query(self, text: str) -> List[float]:
         """
         Generate embedding for a single query.
@@ -114,18 +230,30 @@ class HuggingFaceEmbeddings:
 
         Returns:
             Embedding vector
+
+        Raises:
+            ValueError: If text is empty or whitespace
         """
+        # Same contract as the API-backed providers, which reject blank input
+        if not text.strip():
+            raise ValueError(constants.ERROR_QUERY_EMPTY)
+
+        cached = self._cache.get(text, constants.EMBEDDINGS_INPUT_TYPE_QUERY)
+        if cached is not None:
+            return cached
+
         logger.debug(codes.EMBEDDINGS_GENERATING, count=1, type="query")
 
         try:
-            embedding = self.model.encode(
-                text, convert_to_numpy=False, show_progress_bar=False
-            )
-
-            embedding_list = embedding.tolist()
+            # NumPy output skips the torch tensor round trip; tolist() is one
+            # C-level conversion
+            embedding_list = self.model.encode(
+                text, convert_to_numpy=True, show_progress_bar=False
+            ).tolist()
 
             logger.debug(codes.EMBEDDINGS_GENERATED, dimension=len(embedding_list))
 
+            self._cache.put(text, constants.EMBEDDINGS_INPUT_TYPE_QUERY, embedding_list)
             return embedding_list
 
         except Exception as e:
@@ -4,17 +4,141 @@ OpenAI embeddings implementation.
 Uses OpenAI's text-embedding models (text-embedding-3-small, text-embedding-3-large).
 """
 
+import atexit
+import base64
+import functools
+import importlib.util
+import operator
+import ssl
+import time
 from trace import codes
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+import certifi
+import numpy as np
+import orjson
 
 import constants
+from embeddings.batcher import QueryBatcher
+from embeddings.batching import (
+    Vectors,
+    aembed_with_retry,
+    embed_with_retry,
+    estimate_tokens,
+    gather_batches,
+    iter_windows,
+    map_batches,
+    shared_executor,
+)
+from embeddings.cache import EmbeddingCache
+from embeddings.rate_limit import RateLimiter
 from logger import get_logger
 
+# Imported once with the module; clients are looked up as openai.OpenAI at
+# construction so a missing SDK only fails when the provider is selected
+try:
+    import httpx
+    import openai
+except ImportError:
+    httpx = None
+    openai = None
+
 if TYPE_CHECKING:
     from config import Config
 
 logger = get_logger(__name__)
 
+_get_embedding = operator.itemgetter("embedding")
+_get_index = operator.itemgetter("index")
+
+
+@functools.lru_cache(maxsize=None)
+def _certifi_ssl_context():
+    """
+    Get the shared SSL context verifying against certifi's bundle.
+
+    Loading the CA bundle is the costly part of creating an HTTP client,
+    so it is done once per process.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 (needs the h2 package)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _http_client_options(verify_ssl: bool) -> dict:
+    """
+    Build keyword arguments shared by the sync and async HTTP clients.
+
+    HTTP/2 lets concurrent batches share one multiplexed connection, and
+    the limits cap how many sockets a burst of batches can open.
+
+    Args:
+        verify_ssl: Whether to verify certificates against certifi's bundle
+
+    Returns:
+        Keyword arguments for httpx.Client / httpx.AsyncClient
+    """
+    return {
+        "verify": _certifi_ssl_context() if verify_ssl else False,
+        "http2": _http2_available(),
+        "limits": httpx.Limits(
+            max_connections=constants.OPENAI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=constants.OPENAI_HTTP_MAX_KEEPALIVE,
+        ),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_http_client(verify_ssl: bool):
+    """
+    Get the process-wide HTTP client for the given SSL mode.
+
+    Every provider instance shares it, so keep-alive connections (and
+    their TLS sessions) survive across instances. It is closed once at
+    interpreter exit.
+
+    Args:
+        verify_ssl: Whether to verify certificates against certifi's bundle
+
+    Returns:
+        Shared httpx.Client
+    """
+    client = httpx.Client(**_http_client_options(verify_ssl))
+    atexit.register(client.close)
+    return client
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tiktoken_encoding(model: str):
+    """
+    Load the tiktoken encoding for model, once per process.
+
+    tiktoken downloads encodings on first use, so a machine without
+    network access or a warm cache gets None and callers fall back to
+    estimated token counts.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        tiktoken Encoding, or None if it cannot be loaded
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        logger.warning(
+            codes.EMBEDDINGS_TOKENIZER_UNAVAILABLE,
+            model=model,
+            error=str(e),
+            message=codes.MSG_EMBEDDINGS_TOKENIZER_UNAVAILABLE,
+        )
+        return None
+
 
 class OpenAIEmbeddings:
     """
@@ -26,8 +150,14 @@ class OpenAIEmbeddings:
     Attributes:
         config: Application configuration
         client: OpenAI client instance
+        aclient: AsyncOpenAI client used by aembed_documents (opened lazily)
         model: Model name (e.g., "text-embedding-3-small")
         batch_size: Number of texts to process in one batch
+        max_batch_tokens: Token budget per batch
+        max_input_tokens: Token limit per input; longer texts are chunked
+        max_concurrent_batches: Number of batches sent to the API concurrently
+        retry_max_attempts: Attempts per batch on transient API errors
+        retry_max_wait_seconds: Maximum backoff between attempts
         dimensions: Optional dimension reduction
         dimension: Embedding dimension
     """
@@ -41,9 +171,7 @@ class OpenAIEmbeddings:
         """
         logger.info(codes.EMBEDDINGS_INITIALIZING, provider="openai")
 
-        try:
-            from openai import OpenAI
-        except ImportError:
+        if openai is None:
             logger.error(
                 codes.EMBEDDINGS_ERROR, message=constants.ERROR_OPENAI_NOT_INSTALLED
             )
@@ -51,12 +179,68 @@ class OpenAIEmbeddings:
 
         self.config = config
         self.model = config.embeddings.openai.model
-        self.batch_size = config.embeddings.openai.batch_size
+        self.batch_size = min(
+            config.embeddings.openai.batch_size, constants.OPENAI_MAX_BATCH_INPUTS
+        )
+        self.max_batch_tokens = config.embeddings.openai.max_batch_tokens
+        self.max_input_tokens = config.embeddings.openai.max_input_tokens
+        self._encoding = (
+            _get_tiktoken_encoding(self.model)
+            if config.embeddings.openai.tokenizer == constants.OPENAI_TOKENIZER_TIKTOKEN
+            else None
+        )
+        self.max_concurrent_batches = config.embeddings.max_concurrent_batches
+        self.retry_max_attempts = config.embeddings.retry_max_attempts
+        self.retry_max_wait_seconds = config.embeddings.retry_max_wait_seconds
+        self._retryable_errors = (
+            openai.RateLimitError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+        )
+        # Invalid-request errors are isolated by splitting the batch; auth,
+        # permission and not-found errors fail fast
+        self._splittable_errors = (
+            openai.BadRequestError,
+            openai.UnprocessableEntityError,
+        )
+        self._executor = shared_executor(
+            "embeddings-openai", self.max_concurrent_batches
+        )
+        self._query_batcher = QueryBatcher(
+            self._embed_query_text,
+            self._embed_query_texts,
+            config.embeddings.query_max_batch_size,
+            config.embeddings.query_flush_interval_ms,
+        )
         self.dimensions = config.embeddings.openai.dimensions
         self.dimension = self.dimensions
+        # Blank texts get zero vectors only when opted in; dimensions is the
+        # real output size, so they line up with the embedded rows
+        self._blank_dimension = (
+            self.dimension
+            if config.embeddings.blank_texts == constants.EMBEDDINGS_BLANK_TEXTS_ZERO
+            else 0
+        )
+        self._cache = EmbeddingCache(
+            "openai",
+            self.model,
+            config.embeddings.cache_size,
+            config.embeddings.cache_dir,
+            self.dimensions,
+        )
+        self._rate_limiter = RateLimiter(
+            config.embeddings.openai.requests_per_minute,
+            config.embeddings.openai.tokens_per_minute,
+        )
         self.verify_ssl = config.embeddings.openai.verify_ssl
 
-        self.client = self._initialize_client(OpenAI, config.embeddings.openai.api_key)
+        # Built once and splatted into every request; dimensions is only sent
+        # when configured, since models without shortening reject the field
+        self._create_kwargs = {"model": self.model, "encoding_format": "base64"}
+        if self.dimensions:
+            self._create_kwargs["dimensions"] = self.dimensions
+
+        self.client = self._initialize_client(config.embeddings.openai.api_key)
 
         logger.info(
             codes.EMBEDDINGS_INITIALIZED,
@@ -66,20 +250,16 @@ class OpenAIEmbeddings:
             message=codes.MSG_EMBEDDINGS_INITIALIZED,
         )
 
-    def _initialize_client(self, OpenAI, api_key: str):
-        """Initialize OpenAI client with SSL configuration."""
-        import httpx
+    def _initialize_client(self, api_key: str):
+        """Initialize OpenAI client on the shared HTTP client."""
+        client = openai.OpenAI(
+            api_key=api_key, http_client=_get_http_client(self.verify_ssl)
+        )
 
         if not self.verify_ssl:
-            http_client = httpx.Client(verify=False)
-            client = OpenAI(api_key=api_key, http_client=http_client)
             logger.warning(codes.CONFIG_WARNING, message=constants.MSG_SSL_DISABLED_DEV)
             return client
 
-        import certifi
-
-        http_client = httpx.Client(verify=certifi.where())
-        client = OpenAI(api_key=api_key, http_client=http_client)
         logger.info(
             codes.EMBEDDINGS_INITIALIZING,
             provider="openai",
@@ -87,38 +267,152 @@ class OpenAIEmbeddings:
         )
         return client
 
+    @functools.cached_property
+    def aclient(self):
+        """
+        AsyncOpenAI client, created on first async use.
+
+        The async HTTP client is per instance: its connection pool belongs
+        to the event loop that first uses it. Instances that only embed
+        synchronously never open one; aclose() releases it.
+        """
+        return openai.AsyncOpenAI(
+            api_key=self.config.embeddings.openai.api_key,
+            http_client=httpx.AsyncClient(**_http_client_options(self.verify_ssl)),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the async HTTP client, if one was opened.
+
+        Await it on the event loop that ran aembed_documents; a later async
+        call opens a fresh client.
+        """
+        aclient = self.__dict__.pop("aclient", None)
+        if aclient is not None:
+            await aclient.close()
+
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for multiple documents.
 
+        Batches are dispatched concurrently on the provider's thread pool,
+        bounded by max_concurrent_batches, and results keep input order.
+
         Args:
             texts: List of text strings to embed
 
         Returns:
             List of embedding vectors
         """
+        start_time = time.perf_counter()
+
+        results, missing = self._cache.lookup(
+            texts, constants.EMBEDDINGS_INPUT_TYPE_DOCUMENT
+        )
+        missing_texts = [texts[i] for i in missing]
+
+        embedded = map_batches(
+            missing_texts,
+            self.batch_size,
+            self._process_batch,
+            self._executor,
+            self._blank_dimension,
+            self.max_batch_tokens,
+            self._count_tokens,
+        )
+
+        all_embeddings = self._cache.fill(
+            results,
+            missing,
+            missing_texts,
+            constants.EMBEDDINGS_INPUT_TYPE_DOCUMENT,
+            embedded,
+        )
+
+        elapsed = (time.perf_counter() - start_time) * 1000  # ms
         logger.info(
-            codes.EMBEDDINGS_GENERATING, count=len(texts), batch_size=self.batch_size
+            codes.EMBEDDINGS_GENERATED,
+            count=len(all_embeddings),
+            cached=len(texts) - len(missing_texts),
+            duration_ms=f"{elapsed:.2f}",
+            message=codes.MSG_EMBEDDINGS_GENERATED,
+        )
+
+        return all_embeddings
+
+    def iter_embed_documents(self, texts: List[str]) -> Iterator[List[List[float]]]:
+        """
+        Generate embeddings for multiple documents window by window.
+
+        Each window holds batch_size * max_concurrent_batches texts, enough
+        to keep every worker busy. Callers can write each window to the
+        vector store before the next is embedded, so memory stays flat for
+        large ingests.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Iterator over embedding vectors for each window, in input order
+        """
+        return iter_windows(
+            self.embed_documents,
+            texts,
+            self.batch_size * self.max_concurrent_batches,
         )
 
-        all_embeddings = []
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple documents asynchronously.
+
+        Uses the AsyncOpenAI client: batches are awaited concurrently on
+        the caller's event loop, bounded by max_concurrent_batches, with
+        no worker threads involved.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            List of embedding vectors
+        """
+        start_time = time.perf_counter()
 
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            batch_num = i // self.batch_size + 1
+        results, missing = self._cache.lookup(
+            texts, constants.EMBEDDINGS_INPUT_TYPE_DOCUMENT
+        )
+        missing_texts = [texts[i] for i in missing]
+
+        embedded = await gather_batches(
+            missing_texts,
+            self.batch_size,
+            self._aprocess_batch,
+            self.max_concurrent_batches,
+            self._blank_dimension,
+            self.max_batch_tokens,
+            self._count_tokens,
+        )
 
-            batch_embeddings = self._process_batch(batch, batch_num)
-            all_embeddings.extend(batch_embeddings)
+        all_embeddings = self._cache.fill(
+            results,
+            missing,
+            missing_texts,
+            constants.EMBEDDINGS_INPUT_TYPE_DOCUMENT,
+            embedded,
+        )
 
+        elapsed = (time.perf_counter() - start_time) * 1000  # ms
         logger.info(
             codes.EMBEDDINGS_GENERATED,
             count=len(all_embeddings),
+            cached=len(texts) - len(missing_texts),
+            duration_ms=f"{elapsed:.2f}",
             message=codes.MSG_EMBEDDINGS_GENERATED,
         )
 
         return all_embeddings
 
-    def _process_batch(self, batch: List[str], batch_num: int) -> List[List[float]]:
+    def _process_batch(self, batch: List[str], batch_num: int) -> Vectors:
         """
         Process a single batch of texts to generate embeddings.
 
@@ -127,20 +421,57 @@ class OpenAIEmbeddings:
             batch_num: Batch number for logging
 
         Returns:
-            List of embedding vectors for the batch
+            Embedding vectors for the batch
         """
-        logger.debug(
-            codes.EMBEDDINGS_BATCH_PROCESSING,
-            batch_num=batch_num,
-            batch_size=len(batch),
-        )
-
         try:
-            response = self.client.embeddings.create(
-                model=self.model, input=batch, dimensions=self.dimensions
+            return embed_with_retry(
+                self._embed_batch,
+                batch,
+                self._retryable_errors,
+                self._splittable_errors,
+                self.retry_max_attempts,
+                self.retry_max_wait_seconds,
+            )
+
+        except Exception as e:
+            logger.error(
+                codes.EMBEDDINGS_ERROR, batch_num=batch_num, error=str(e), exc_info=True
             )
+            raise
+
+    def _embed_batch(self, batch: List[str]) -> Vectors:
+        """
+        Embed a batch of texts with a single OpenAI API call.
+
+        Args:
+            batch: Batch of texts to embed
+
+        Returns:
+            Embedding vectors for the batch (float32 rows when decoded)
+        """
+        inputs, chunks = self._split_long_texts(batch)
+        return self._merge_chunks(self._create_embeddings(inputs), chunks)
+
+    async def _aprocess_batch(self, batch: List[str], batch_num: int) -> Vectors:
+        """
+        Process a single batch of texts with the async client.
+
+        Args:
+            batch: Batch of texts to process
+            batch_num: Batch number for logging
 
-            return [item.embedding for item in response.data]
+        Returns:
+            Embedding vectors for the batch
+        """
+        try:
+            return await aembed_with_retry(
+                self._aembed_batch,
+                batch,
+                self._retryable_errors,
+                self._splittable_errors,
+                self.retry_max_attempts,
+                self.retry_max_wait_seconds,
+            )
 
         except Exception as e:
             logger.error(
@@ -148,6 +479,113 @@ class OpenAIEmbeddings:
             )
             raise
 
+    async def _aembed_batch(self, batch: List[str]) -> Vectors:
+        """
+        Embed a batch of texts with a single async OpenAI API call.
+
+        Args:
+            batch: Batch of texts to embed
+
+        Returns:
+            Embedding vectors for the batch (float32 rows when decoded)
+        """
+        inputs, chunks = self._split_long_texts(batch)
+        return self._merge_chunks(await self._acreate_embeddings(inputs), chunks)
+
+    def _count_tokens(self, text: str) -> int:
+        """
+        Count a text's tokens for batch packing.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Exact tiktoken count, or an estimate without an encoding
+        """
+        if self._encoding is None:
+            return estimate_tokens(text)
+        return len(self._encoding.encode_ordinary(text))
+
+    def _split_long_text(self, text: str) -> List[str]:
+        """
+        Split a text over max_input_tokens into chunks the API accepts.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            The text itself, or its consecutive chunks
+        """
+        limit = self.max_input_tokens
+
+        # Every token covers at least one byte, so short texts need no count
+        if len(text.encode("utf-8")) <= limit:
+            return [text]
+
+        if self._encoding is None:
+            if estimate_tokens(text) <= limit:
+                return [text]
+            # At most 4 bytes per character keeps each chunk's estimate in limit
+            step = 3 * (limit - 1) // 4
+            return [text[i : i + step] for i in range(0, len(text), step)]
+
+        tokens = self._encoding.encode_ordinary(text)
+        if len(tokens) <= limit:
+            return [text]
+        return [
+            self._encoding.decode(tokens[i : i + limit])
+            for i in range(0, len(tokens), limit)
+        ]
+
+    def _split_long_texts(
+        self, batch: List[str]
+    ) -> Tuple[List[str], Optional[List[List[str]]]]:
+        """
+        Expand texts over the per-input token limit into chunks.
+
+        Args:
+            batch: Batch of texts
+
+        Returns:
+            Tuple of (API inputs, per-text chunks or None if nothing split)
+        """
+        chunks = [self._split_long_text(text) for text in batch]
+        if all(len(text_chunks) == 1 for text_chunks in chunks):
+            return batch, None
+        return [chunk for text_chunks in chunks for chunk in text_chunks], chunks
+
+    @staticmethod
+    def _merge_chunks(
+        embeddings: Vectors, chunks: Optional[List[List[str]]]
+    ) -> Vectors:
+        """
+        Combine chunk embeddings back into one vector per original text.
+
+        Chunk vectors are averaged, weighted by chunk length, and the mean
+        is re-normalized to unit length like the model's own outputs.
+
+        Args:
+            embeddings: Embedding vectors for the API inputs
+            chunks: Per-text chunks from _split_long_texts, or None
+
+        Returns:
+            Embedding vectors for the original texts
+        """
+        if chunks is None:
+            return embeddings
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        merged = np.empty((len(chunks), vectors.shape[1]), dtype=np.float32)
+
+        start = 0
+        for index, text_chunks in enumerate(chunks):
+            rows = vectors[start : start + len(text_chunks)]
+            start += len(text_chunks)
+            mean = np.average(rows, axis=0, weights=[len(c) for c in text_chunks])
+            merged[index] = mean / np.linalg.norm(mean)
+
+        return merged
+
     def embed_query(self, text: str) -> List[float]:
         """
         Generate embedding for a single query.
@@ -157,24 +595,149 @@ class OpenAIEmbeddings:
 
         Returns:
             Embedding vector
+
+        Raises:
+            ValueError: If text is empty or whitespace
         """
+        # Rejected before the cache and the API, which would answer with a 400
+        if not text.strip():
+            raise ValueError(constants.ERROR_QUERY_EMPTY)
+
+        cached = self._cache.get(text, constants.EMBEDDINGS_INPUT_TYPE_QUERY)
+        if cached is not None:
+            return cached
+
         logger.debug(codes.EMBEDDINGS_GENERATING, count=1, type="query")
 
         try:
-            response = self.client.embeddings.create(
-                model=self.model, input=text, dimensions=self.dimensions
-            )
-
-            embedding = response.data[0].embedding
+            embedding = self._query_batcher.submit(text)
 
             logger.debug(codes.EMBEDDINGS_GENERATED, dimension=len(embedding))
 
+            self._cache.put(text, constants.EMBEDDINGS_INPUT_TYPE_QUERY, embedding)
             return embedding
 
         except Exception as e:
             logger.error(codes.EMBEDDINGS_ERROR, error=str(e), exc_info=True)
             raise
 
+    def _embed_query_text(self, text: str) -> List[float]:
+        """
+        Embed a single query with the OpenAI API.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector
+        """
+        return self._embed_query_texts([text])[0]
+
+    def _embed_query_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed multiple queries with one OpenAI API call.
+
+        Args:
+            texts: Query texts
+
+        Returns:
+            List of embedding vectors
+        """
+        embeddings = self._create_embeddings(texts)
+        if isinstance(embeddings, np.ndarray):
+            return embeddings.tolist()
+        return embeddings
+
+    def _create_embeddings(self, inputs: List[str]) -> Vectors:
+        """
+        Call the embeddings endpoint, the single place the sync API is invoked.
+
+        Args:
+            inputs: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        self._rate_limiter.acquire(self._estimate_request_tokens(inputs))
+
+        response = self.client.embeddings.with_raw_response.create(
+            input=inputs, **self._create_kwargs
+        )
+
+        return self._decode_embeddings(response.content)
+
+    async def _acreate_embeddings(self, inputs: List[str]) -> Vectors:
+        """
+        Call the embeddings endpoint with the async client.
+
+        Args:
+            inputs: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        await self._rate_limiter.aacquire(self._estimate_request_tokens(inputs))
+
+        response = await self.aclient.embeddings.with_raw_response.create(
+            input=inputs, **self._create_kwargs
+        )
+
+        return self._decode_embeddings(response.content)
+
+    def _estimate_request_tokens(self, inputs: List[str]) -> int:
+        """
+        Estimate the tokens a request counts against the TPM quota.
+
+        Uses the byte estimate rather than tiktoken: it errs high for
+        typical text, which only makes the limiter more cautious, and
+        keeps each request from being tokenized twice.
+
+        Args:
+            inputs: Texts in the request
+
+        Returns:
+            Estimated token count (0 when no rate limit is configured)
+        """
+        if not self._rate_limiter.enabled:
+            return 0
+        return sum(estimate_tokens(text) for text in inputs)
+
+    @staticmethod
+    def _decode_embeddings(body: bytes) -> Vectors:
+        """
+        Pull embedding vectors out of a raw embeddings response body.
+
+        The body is parsed with orjson straight from bytes, skipping the
+        SDK's stdlib json pass and its per-item pydantic models. Requests
+        use encoding_format="base64": each vector arrives as raw float32
+        bytes (~4x smaller than JSON floats, no float parsing). All vectors
+        are decoded into one float32 array, which is returned as-is so the
+        document path can hand rows to the cache without boxing every
+        value. Servers that ignore the format return float lists, which
+        are passed through unchanged.
+
+        Args:
+            body: Raw HTTP response body
+
+        Returns:
+            Embedding vectors in input order
+        """
+        data = orjson.loads(body)["data"]
+
+        # Items carry their input index; the API returns them in order, so
+        # sorting is only a fallback, not a per-response cost
+        if list(map(_get_index, data)) != list(range(len(data))):
+            data.sort(key=_get_index)
+
+        # map + itemgetter reads every item's field in one C-level loop
+        embeddings = list(map(_get_embedding, data))
+        if not embeddings or not isinstance(embeddings[0], str):
+            return embeddings
+
+        raw = b"".join(map(base64.b64decode, embeddings))
+        vectors = np.frombuffer(raw, dtype=np.float32)
+        return vectors.reshape(len(embeddings), -1)
+
     def get_dimension(self) -> int:
         """
         Get the dimension of embeddings.
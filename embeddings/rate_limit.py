@@ -0,0 +1,118 @@
+"""
+Preemptive request and token rate limiting for embeddings APIs.
+
+Concurrent batches can exceed a provider's requests-per-minute (RPM) or
+tokens-per-minute (TPM) quota within a few seconds of a large ingest,
+and every throttled batch then retries on its own schedule. RateLimiter
+tracks what was sent over the last minute and holds a call back until
+it fits the quota, so requests are paced before the API answers 429.
+
+Both limits default to 0 (disabled).
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Tuple
+
+_WINDOW_SECONDS = 60.0
+
+
+class RateLimiter:
+    """
+    Thread-safe sliding-window limiter for requests and tokens per minute.
+
+    Each acquired call is recorded as (timestamp, tokens). A call waits
+    until the calls of the last 60 seconds leave room for one more request
+    and its tokens. A call larger than the whole token quota is let
+    through once the window is empty, so it can never block forever.
+    The sync and async entry points share one window.
+
+    Attributes:
+        requests_per_minute: Maximum requests per minute (0 disables)
+        tokens_per_minute: Maximum tokens per minute (0 disables)
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute (0 disables)
+            tokens_per_minute: Maximum tokens per minute (0 disables)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._sent: Deque[Tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return self.requests_per_minute > 0 or self.tokens_per_minute > 0
+
+    def acquire(self, tokens: int) -> None:
+        """
+        Block until a request of the given size fits the quota.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        if not self.enabled:
+            return
+
+        delay = self._reserve(tokens)
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._reserve(tokens)
+
+    async def aacquire(self, tokens: int) -> None:
+        """
+        Wait, without blocking the event loop, until a request fits the quota.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        if not self.enabled:
+            return
+
+        delay = self._reserve(tokens)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._reserve(tokens)
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        Record the request if it fits, else return the time to wait.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+
+        Returns:
+            0 if the request was recorded, else seconds until the oldest
+            request leaves the window
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            cutoff = now - _WINDOW_SECONDS
+            while self._sent and self._sent[0][0] <= cutoff:
+                self._tokens_in_window -= self._sent.popleft()[1]
+
+            over_requests = (
+                self.requests_per_minute > 0
+                and len(self._sent) >= self.requests_per_minute
+            )
+            over_tokens = (
+                self.tokens_per_minute > 0
+                and self._sent
+                and self._tokens_in_window + tokens > self.tokens_per_minute
+            )
+            if over_requests or over_tokens:
+                return self._sent[0][0] - cutoff
+
+            self._sent.append((now, tokens))
+            self._tokens_in_window += tokens
+            return 0.0
@@ -13,21 +13,34 @@ Usage:
     python examples/demo_rag_query.py
 """
 
+import asyncio
+import sys
+
+from llm_models import MODEL_MAP
+
+import constants
 from app import RAGChain
 from config import Config
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Section rules, built once
+RULE = "=" * 80
+QUERY_RULE = "-" * 80
+
+
+def _write_lines(lines):
+    """Write a section of lines to stdout with one write and one flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 
 def main():
     """
     Demonstrate RAG query functionality.
     """
-    print("=" * 80)
-    print("RAG QUERY DEMO".center(80))
-    print("=" * 80)
-    print()
+    _write_lines([RULE, "RAG QUERY DEMO".center(80), RULE, ""])
 
     # Initialize configuration
     print("📝 Loading configuration...")
@@ -35,15 +48,9 @@ def main():
     print("✅ Configuration loaded")
     print(f"   - Embeddings: {config.embeddings.provider}")
     print(f"   - Vectorstore: {config.vectorstore.provider}")
-    # Get model based on provider
     provider = config.rag.provider
-    if provider == "google":
-        model = config.rag.google.model
-    elif provider == "openai":
-        model = config.rag.openai.model
-    else:
-        model = config.rag.anthropic.model
-    print(f"   - LLM: {provider}/{model}")
+    model = MODEL_MAP.get(provider, MODEL_MAP[constants.LLM_PROVIDER_ANTHROPIC])
+    print(f"   - LLM: {provider}/{model(config)}")
     print()
 
     # Initialize RAG chain
@@ -56,7 +63,7 @@ def main():
         return
 
     print()
-    print("=" * 80)
+    print(RULE)
     print()
 
     # Example queries
@@ -66,40 +73,62 @@ def main():
         "What are the benefits of vector databases?",
     ]
 
-    for i, question in enumerate(queries, 1):
-        print(f"QUERY {i}: {question}")
-        print("-" * 80)
-
-        try:
-            response = rag_chain.query(question)
-
-            # Display answer
-            print("\n📋 ANSWER:")
-            print(f"{response['answer']}")
-            print()
-
-            # Display metadata
-            print("📊 METADATA:")
-            print(f"   - Retrieved: {response['retrieval_count']} documents")
-            print(f"   - Has Answer: {response['has_answer']}")
-            print()
-
-            # Display sources
-            if response["sources"]:
-                print("📚 SOURCES:")
-                for j, source in enumerate(response["sources"], 1):
-                    source_name = source["metadata"].get("source", "Unknown")
-                    content_preview = source["content"][:100] + "..."
-                    print(f"   [{j}] {source_name}")
-                    print(f"       {content_preview}")
-                print()
-
-        except Exception as e:
-            print(f"❌ Query failed: {e}")
-            print()
-
-        print("=" * 80)
-        print()
+    # Queries are independent and I/O-bound, so run them concurrently and
+    # print the results in order once all have finished
+    print(f"⏳ Running {len(queries)} queries concurrently...")
+    print()
+    responses = asyncio.run(_run_queries(rag_chain, queries))
+
+    for i, (question, response) in enumerate(zip(queries, responses), 1):
+        lines = [f"QUERY {i}: {question}", QUERY_RULE]
+
+        if isinstance(response, Exception):
+            lines += [f"❌ Query failed: {response}", ""]
+        else:
+            lines += _format_response(response)
+
+        lines += [RULE, ""]
+        _write_lines(lines)
+
+
+async def _run_queries(rag_chain, queries):
+    """
+    Run queries concurrently on worker threads.
+
+    Returns:
+        Responses in query order (exceptions in place of failed queries)
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(rag_chain.query, question) for question in queries),
+        return_exceptions=True,
+    )
+
+
+def _format_response(response):
+    """Format answer, metadata and sources of a RAG response as lines."""
+    # Answer and metadata
+    lines = [
+        "",
+        "📋 ANSWER:",
+        f"{response['answer']}",
+        "",
+        "📊 METADATA:",
+        f"   - Retrieved: {response['retrieval_count']} documents",
+        f"   - Has Answer: {response['has_answer']}",
+        "",
+    ]
+
+    # Sources
+    if response["sources"]:
+        lines.append("📚 SOURCES:")
+        for j, source in enumerate(response["sources"], 1):
+            source_name = source["metadata"].get("source", "Unknown")
+            content_preview = source["content"][:100] + "..."
+            lines.append(f"   [{j}] {source_name}")
+            lines.append(f"       {content_preview}")
+        lines.append("")
+
+    return lines
 
 
 if __name__ == "__main__":
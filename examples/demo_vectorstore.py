@@ -10,6 +10,7 @@ To switch providers (e.g., from ChromaDB to Pinecone), just change
 the config file - no code changes needed!
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -21,7 +22,7 @@ import constants
 from config import Config
 from embeddings import create_embeddings
 from logger import get_logger, setup_logging
-from vectorstore import create_vectorstore
+from vectorstore import aadd_documents_batched, create_vectorstore
 
 logger = get_logger(__name__)
 
@@ -59,23 +60,30 @@ def _get_sample_metadata():
 
 
 def _demonstrate_basic_query(vectorstore):
-    """Demonstrate basic similarity search."""
+    """Demonstrate basic similarity search for several queries at once."""
     logger.info(codes.DEMO_QUERY_STARTED, separator="=== Querying ===")
 
-    query = "What is RAG and how does it work?"
-    logger.info(codes.VECTORSTORE_QUERYING, query=query)
+    queries = [
+        "What is RAG and how does it work?",
+        "How are documents stored for search?",
+    ]
+    logger.info(codes.VECTORSTORE_QUERYING, queries=queries)
 
-    results = vectorstore.query(query, n_results=3)
+    # One batched search instead of a round trip per query
+    batch_results = vectorstore.query_batch(queries, n_results=3)
 
-    logger.info(codes.VECTORSTORE_QUERY_RESULTS, results_count=len(results))
-    for i, result in enumerate(results, 1):
+    for query, results in zip(queries, batch_results):
         logger.info(
-            codes.VECTORSTORE_QUERY_RESULTS,
-            result_num=i,
-            text=result[constants.RESULT_KEY_TEXT],
-            metadata=result[constants.RESULT_KEY_METADATA],
-            distance=f"{result[constants.RESULT_KEY_DISTANCE]:.4f}",
+            codes.VECTORSTORE_QUERY_RESULTS, query=query, results_count=len(results)
         )
+        for i, result in enumerate(results, 1):
+            logger.info(
+                codes.VECTORSTORE_QUERY_RESULTS,
+                result_num=i,
+                text=result[constants.RESULT_KEY_TEXT],
+                metadata=result[constants.RESULT_KEY_METADATA],
+                distance=f"{result[constants.RESULT_KEY_DISTANCE]:.4f}",
+            )
 
 
 def _demonstrate_filtered_query(vectorstore):
@@ -114,9 +122,13 @@ def main():
     logger.info(codes.VECTORSTORE_INITIALIZING)
     vectorstore.initialize()
 
-    logger.info(codes.VECTORSTORE_DOCUMENTS_ADDING)
-    vectorstore.add_documents(
-        texts=_get_sample_documents(), metadatas=_get_sample_metadata()
+    # Embed and insert in concurrent batches, the path large ingests use
+    texts = _get_sample_documents()
+    logger.info(codes.VECTORSTORE_DOCUMENTS_ADDING, count=len(texts))
+    asyncio.run(
+        aadd_documents_batched(
+            vectorstore, embeddings, texts, metadatas=_get_sample_metadata()
+        )
     )
 
     stats = vectorstore.get_stats()
@@ -9,29 +9,68 @@ Usage:
     APP_ENV=dev GEMINI_API_KEY=your_key python examples/interactive_rag_cli.py
 """
 
+import atexit
+import os
 import sys
+import textwrap
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from llm_models import MODEL_MAP
+
 import constants
-from app.chain_rag.chain import RAGChain
 from config import Config
 
+if TYPE_CHECKING:
+    from app.chain_rag.chain import RAGChain
+
+
+# Question history, recalled with the arrow keys across sessions
+HISTORY_FILE = Path.home() / ".ragtrial_history"
+HISTORY_LENGTH = 1000
+
+# Section rules, built once
+BANNER_RULE = "=" * 70
+SEPARATOR = "-" * 70
+
+
+def write_lines(*lines: str):
+    """Write a section of lines to stdout with one write and one flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 
 def print_banner():
     """Print welcome banner."""
-    print("\n" + "=" * 70)
-    print("   🤖 RAG SYSTEM - Interactive Terminal Interface")
-    print("=" * 70)
-    print()
+    write_lines(
+        "",
+        BANNER_RULE,
+        "   🤖 RAG SYSTEM - Interactive Terminal Interface",
+        BANNER_RULE,
+        "",
+    )
 
 
 def print_separator():
     """Print section separator."""
-    print("-" * 70)
+    write_lines(SEPARATOR)
+
+
+def format_source(index: int, source: dict) -> str:
+    """Format one source document as a numbered filename and content preview."""
+    metadata = source.get("metadata", {})
+    source_path = metadata.get(constants.META_SOURCE, "unknown")
+    filename = os.path.basename(source_path) if source_path != "unknown" else "unknown"
+
+    content_preview = textwrap.shorten(
+        source.get("content", ""), width=150, placeholder="..."
+    )
+
+    return f"  [{index}] {filename}\n      {content_preview}\n"
 
 
 def format_sources(sources: list) -> str:
@@ -39,71 +78,68 @@ def format_sources(sources: list) -> str:
     if not sources:
         return "  No sources found"
 
-    output = []
-    for i, source in enumerate(sources, 1):
-        metadata = source.get("metadata", {})
-        source_path = metadata.get(constants.META_SOURCE, "unknown")
-        filename = Path(source_path).name if source_path != "unknown" else "unknown"
-
-        content_preview = source.get("content", "")[:150]
-        if len(source.get("content", "")) > 150:
-            content_preview += "..."
-
-        output.append(f"  [{i}] {filename}")
-        output.append(f"      {content_preview}")
-        output.append("")
-
-    return "\n".join(output)
+    return "\n".join(format_source(i, source) for i, source in enumerate(sources, 1))
 
 
 def display_result(result: dict):
     """Display query result in a formatted way."""
-    print()
-    print_separator()
-
-    # Display answer
-    print("📝 ANSWER:")
-    print()
     answer = result.get(constants.RESPONSE_KEY_ANSWER, "No answer generated")
-
-    # Word wrap the answer for better readability
-    words = answer.split()
-    line = ""
-    for word in words:
-        if len(line) + len(word) + 1 <= 70:
-            line += word + " "
-        else:
-            print("  " + line.strip())
-            line = word + " "
-    if line:
-        print("  " + line.strip())
-
-    print()
-
-    # Display has_answer status
     has_answer = result.get(constants.RESPONSE_KEY_HAS_ANSWER, False)
     status_icon = "✅" if has_answer else "❌"
-    print(f"{status_icon} Answer Found: {has_answer}")
-
-    print()
-    print_separator()
-
-    # Display sources
     sources = result.get(constants.RESPONSE_KEY_SOURCES, [])
-    print(f"📚 SOURCES ({len(sources)} documents):")
-    print()
-    print(format_sources(sources))
 
-    print_separator()
-    print()
+    # Word wrap the answer for better readability
+    wrapped_answer = textwrap.fill(
+        answer,
+        width=70,
+        initial_indent="  ",
+        subsequent_indent="  ",
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
+
+    # The whole result goes out in one write
+    write_lines(
+        "",
+        SEPARATOR,
+        "📝 ANSWER:",
+        "",
+        wrapped_answer,
+        "",
+        f"{status_icon} Answer Found: {has_answer}",
+        "",
+        SEPARATOR,
+        f"📚 SOURCES ({len(sources)} documents):",
+        "",
+        format_sources(sources),
+        SEPARATOR,
+        "",
+    )
+
+
+def setup_history():
+    """Enable line editing and persistent question history for input()."""
+    try:
+        import readline
+    except ImportError:
+        # Not available on Windows; input() still works without history
+        return
+
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # First run, or history file unreadable
+    readline.set_history_length(HISTORY_LENGTH)
+    atexit.register(readline.write_history_file, HISTORY_FILE)
 
 
-def interactive_mode(rag_chain: RAGChain):
+def interactive_mode(rag_chain: "RAGChain"):
     """Run interactive query loop."""
     print("💡 Tips:")
     print("  - Type your question and press Enter")
     print("  - Type 'quit', 'exit', or 'q' to exit")
     print("  - Type 'help' for more information")
+    print("  - Use the up/down arrow keys to recall previous questions")
     print()
     print_separator()
 
@@ -111,7 +147,9 @@ def interactive_mode(rag_chain: RAGChain):
         try:
             # Get user input
             print()
-            question = input("🔍 Your Question: ").strip()
+            # Collapse runs of whitespace so retyped questions share one
+            # cached query embedding
+            question = " ".join(input("🔍 Your Question: ").split())
 
             if not question:
                 print("⚠️  Please enter a question")
@@ -161,23 +199,24 @@ def main():
 
         # Display config info
         print(f"   Provider: {config.rag.provider}")
-        if config.rag.provider == constants.LLM_PROVIDER_GOOGLE:
-            print(f"   Model: {config.rag.google.model}")
-        elif config.rag.provider == constants.LLM_PROVIDER_OPENAI:
-            print(f"   Model: {config.rag.openai.model}")
-        elif config.rag.provider == constants.LLM_PROVIDER_ANTHROPIC:
-            print(f"   Model: {config.rag.anthropic.model}")
+        model = MODEL_MAP.get(config.rag.provider)
+        if model:
+            print(f"   Model: {model(config)}")
 
         print(f"   Vector Store: {config.vectorstore.provider}")
         print()
 
-        # Initialize RAG chain
+        # Initialize RAG chain. Imported here so the banner and config
+        # summary show before the LLM and vector store SDKs load.
         print("🚀 Initializing RAG chain...")
+        from app.chain_rag.chain import RAGChain
+
         rag_chain = RAGChain(config=config)
         print("✅ RAG chain initialized successfully!")
         print()
 
         # Start interactive mode
+        setup_history()
         interactive_mode(rag_chain)
 
     except Exception as e:
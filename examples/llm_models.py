@@ -0,0 +1,12 @@
+"""
+Configured LLM model lookup shared by the example scripts.
+"""
+
+import constants
+
+# Configured model name per LLM provider
+MODEL_MAP = {
+    constants.LLM_PROVIDER_GOOGLE: lambda config: config.rag.google.model,
+    constants.LLM_PROVIDER_OPENAI: lambda config: config.rag.openai.model,
+    constants.LLM_PROVIDER_ANTHROPIC: lambda config: config.rag.anthropic.model,
+}
@@ -13,31 +13,105 @@ Usage:
 """
 
 import argparse
-from io import BytesIO
+import hashlib
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
 from pathlib import Path
+from typing import Callable, Tuple
 
 from config import Config
 from storage_backend import create_storage
 
+# Banner rule, built once
+BANNER_RULE = "=" * 60
+
+# Config() is a shared singleton; backends are selected on it one at a time
+_CONFIG_LOCK = threading.Lock()
+
+
+class _ThreadBufferedStdout:
+    """
+    stdout replacement that holds each worker thread's output in a buffer.
+
+    Lets the local and S3 tests run side by side while their output is
+    printed one test at a time instead of interleaved line by line.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def run(self, test: Callable[[], bool]) -> bool:
+        """Run a test with its output buffered, then print it in one piece."""
+        self._local.buffer = StringIO()
+        try:
+            return test()
+        finally:
+            output = self._local.buffer.getvalue()
+            self._local.buffer = None
+            with self._write_lock:
+                self._stream.write(output)
+                self._stream.flush()
+
+
+def _print_banner(title: str, trailing_blank: bool = True):
+    """Print a boxed section title with one write and one flush."""
+    sys.stdout.write(
+        f"\n{BANNER_RULE}\n{title}\n{BANNER_RULE}\n" + ("\n" if trailing_blank else "")
+    )
+    sys.stdout.flush()
+
+
+def _stream_sha256(stream, chunk_size: int = 1 << 20) -> Tuple[bytes, int]:
+    """
+    Hash a stream in 1 MiB reads, so large files are never held in memory.
+
+    Closes the stream and returns (digest, bytes read).
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.digest(), size
+
+
+def _create_storage(config, backend: str):
+    """Create the given storage backend from the shared config."""
+    with _CONFIG_LOCK:
+        config.storage.backend = backend
+        return create_storage(config)
+
 
 def test_local_storage():
     """Test local storage backend."""
-    print("\n" + "=" * 60)
-    print("TESTING LOCAL STORAGE")
-    print("=" * 60 + "\n")
+    _print_banner("TESTING LOCAL STORAGE")
 
     # Load config
     config = Config()
-    config.storage.backend = "local"
 
     # Create storage
-    storage = create_storage(config)
+    storage = _create_storage(config, "local")
     print(f"✓ Created local storage: {storage.storage_path}")
 
     # Create test file
     test_filename = "test_upload.txt"
     test_content = b"This is a test file uploaded via local storage backend.\n"
     test_content += b"Upload time: " + str(Path(__file__).stat().st_mtime).encode()
+    source_digest = hashlib.sha256(test_content).digest()
 
     # Upload file
     print(f"\n→ Uploading {test_filename}...")
@@ -57,32 +131,26 @@ def test_local_storage():
     files = storage.list_files()
     print(f"✓ Total files in storage: {len(files)}")
 
-    # Download file
+    # Download file and verify content by digest
     print(f"\n→ Downloading {test_filename}...")
-    downloaded = storage.download_file(test_filename)
-    downloaded_content = downloaded.read()
-    print(f"✓ Downloaded {len(downloaded_content)} bytes")
+    downloaded_digest, size = _stream_sha256(storage.download_file(test_filename))
+    print(f"✓ Downloaded {size} bytes")
 
     # Verify content
-    if downloaded_content == test_content:
+    if downloaded_digest == source_digest:
         print("✓ Content matches original!")
     else:
         print("✗ Content mismatch!")
 
-    print("\n" + "=" * 60)
-    print("LOCAL STORAGE TEST PASSED ✓")
-    print("=" * 60 + "\n")
+    _print_banner("LOCAL STORAGE TEST PASSED ✓")
 
 
 def test_s3_storage():
     """Test S3 storage backend."""
-    print("\n" + "=" * 60)
-    print("TESTING S3 STORAGE")
-    print("=" * 60 + "\n")
+    _print_banner("TESTING S3 STORAGE")
 
     # Load config
     config = Config()
-    config.storage.backend = "s3"
 
     print("→ Initializing S3 storage...")
     print(f"  Bucket: {config.storage.s3.bucket_name}")
@@ -98,7 +166,7 @@ def test_s3_storage():
 
     try:
         # Create storage (this will discover credentials)
-        storage = create_storage(config)
+        storage = _create_storage(config, "s3")
         print(f"\n✓ Connected to S3 bucket: {storage.bucket_name}")
         print(f"✓ Using region: {storage.region}")
 
@@ -111,10 +179,14 @@ def test_s3_storage():
         test_filename = "test_s3_upload.txt"
         test_content = b"This is a test file uploaded to S3.\n"
         test_content += b"Uploaded via boto3 with automatic credential discovery.\n"
+        source_digest = hashlib.sha256(test_content).digest()
 
-        # Upload file
+        # Upload file, streamed from disk (large files go up as multipart parts)
         print(f"\n→ Uploading {test_filename} to S3...")
-        result = storage.upload_file(BytesIO(test_content), test_filename)
+        with tempfile.TemporaryFile() as source:
+            source.write(test_content)
+            source.seek(0)
+            result = storage.upload_file(source, test_filename)
         print(f"✓ Uploaded to S3: s3://{storage.bucket_name}/{result}")
 
         # Verify file exists
@@ -131,21 +203,18 @@ def test_s3_storage():
         files = storage.list_files()
         print(f"✓ Total files in S3 bucket: {len(files)}")
 
-        # Download file
+        # Download file and verify content by digest
         print(f"\n→ Downloading {test_filename} from S3...")
-        downloaded = storage.download_file(test_filename)
-        downloaded_content = downloaded.read()
-        print(f"✓ Downloaded {len(downloaded_content)} bytes from S3")
+        downloaded_digest, size = _stream_sha256(storage.download_file(test_filename))
+        print(f"✓ Downloaded {size} bytes from S3")
 
         # Verify content
-        if downloaded_content == test_content:
+        if downloaded_digest == source_digest:
             print("✓ Content matches original!")
         else:
             print("✗ Content mismatch!")
 
-        print("\n" + "=" * 60)
-        print("S3 STORAGE TEST PASSED ✓")
-        print("=" * 60 + "\n")
+        _print_banner("S3 STORAGE TEST PASSED ✓")
 
         print("\n💡 CREDENTIAL DISCOVERY WORKED!")
         print(f"   boto3 automatically found credentials via: {credentials.method}")
@@ -164,6 +233,26 @@ def test_s3_storage():
     return True
 
 
+def _run_concurrently(tests):
+    """
+    Run tests in parallel threads; local is disk-bound and S3 network-bound.
+
+    Each test's output is printed in one piece as it finishes, and the
+    first failure is re-raised once all tests are done.
+    """
+    stdout = sys.stdout
+    buffered = _ThreadBufferedStdout(stdout)
+    sys.stdout = buffered
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(buffered.run, test) for test in tests]
+    finally:
+        sys.stdout = stdout
+
+    for future in futures:
+        future.result()
+
+
 def main():
     """Main demo function."""
     parser = argparse.ArgumentParser(description="Test storage backends")
@@ -176,15 +265,16 @@ def main():
 
     args = parser.parse_args()
 
-    print("\n" + "=" * 60)
-    print("STORAGE BACKEND UPLOAD TEST")
-    print("=" * 60)
+    _print_banner("STORAGE BACKEND UPLOAD TEST", trailing_blank=False)
 
     try:
-        if args.backend in ["local", "both"]:
+        if args.backend == "both":
+            _run_concurrently([test_local_storage, test_s3_storage])
+
+        if args.backend == "local":
             test_local_storage()
 
-        if args.backend in ["s3", "both"]:
+        if args.backend == "s3":
             test_s3_storage()
 
         print("\n✅ ALL TESTS PASSED!\n")
@@ -12,27 +12,61 @@ Processes unindexed documents from database through the pipeline:
 Usage:
     python -m ingestion.ingest                    # Process all unindexed files
     python -m ingestion.ingest --clear            # Clear vectorstore first
+    python -m ingestion.ingest --workers 4        # Load and split in 4 processes
 """
 
 import argparse
+import asyncio
+import functools
+import multiprocessing.pool
+import os
 import sys
 import time
+from multiprocessing import Pool
 from pathlib import Path
 from trace import codes
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.documents import Document
 
 import constants
 from app.modules.file.core import FileService
 from config import Config
+from embeddings.base import EmbeddingsProtocol
 from embeddings.factory import create_embeddings
 from loader import DocumentLoader
 from loader.factory import LoaderFactory
 from logger import get_logger, setup_logging
 from splitter import DocumentSplitter
+from vectorstore.base import VectorStoreProtocol
+from vectorstore.bulk import aadd_documents_batched
 from vectorstore.factory import create_vectorstore
 
 logger = get_logger(__name__)
 
+# Outcome of one file record, as returned by _process_file_record
+_RESULT_SUCCESS = "success"
+_RESULT_FAILED = "failed"
+_RESULT_SKIPPED = "skipped"
+
+# File records handed to each pool worker per dispatch
+_WORKER_CHUNKSIZE = 4
+
+# Per worker process loader and splitter cache, set by _init_worker
+_worker_loader: Optional[DocumentLoader] = None
+_worker_get_splitter: Optional[Callable[[str], DocumentSplitter]] = None
+
+# Formats whose structure gives better chunk boundaries than a fixed token
+# window; every other format uses the default token splitter
+_SPLITTER_TYPES_BY_EXTENSION = {
+    constants.EXT_MD: constants.SPLITTER_TYPE_MARKDOWN,
+}
+
+
+def _default_workers() -> int:
+    """Use half the cores for load/split, leaving room for the parent."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -49,19 +83,25 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--clear", action="store_true", help="Clear vectorstore before ingestion"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_default_workers(),
+        help="Processes used to load and split files (1 runs in-process)",
+    )
 
     return parser.parse_args()
 
 
-def scan_directory(source_dir: Path) -> List[Path]:
+def iter_files(source_dir: Path) -> Iterator[Path]:
     """
-    Scan directory for supported document files.
+    Yield supported document files in a directory as they are read.
 
     Args:
         source_dir: Directory to scan
 
-    Returns:
-        List of file paths
+    Yields:
+        File paths, in directory order
 
     Raises:
         FileNotFoundError: If directory doesn't exist
@@ -75,23 +115,43 @@ def scan_directory(source_dir: Path) -> List[Path]:
     logger.info(codes.INGESTION_SCANNING_DIRECTORY, directory=str(source_dir))
 
     # Get supported extensions from loader factory
-    supported_extensions = LoaderFactory.get_supported_extensions()
+    supported_extensions = {
+        ext.lower() for ext in LoaderFactory.get_supported_extensions()
+    }
 
-    # Find all files with supported extensions
-    files = []
-    for ext in supported_extensions:
-        pattern = f"*{ext}"
-        files.extend(source_dir.glob(pattern))
+    # One directory pass with an in-memory suffix check, rather than a
+    # glob (a full readdir) per extension
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if (
+                entry.is_file()
+                and os.path.splitext(entry.name)[1].lower() in supported_extensions
+            ):
+                yield Path(entry.path)
 
-    # Sort for consistent processing order
-    files = sorted(files)
 
-    return files
+def scan_directory(source_dir: Path) -> List[Path]:
+    """
+    Scan directory for supported document files.
+
+    Args:
+        source_dir: Directory to scan
+
+    Returns:
+        List of file paths, sorted for consistent processing order
+
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+    """
+    return sorted(iter_files(source_dir))
 
 
 def process_file(
-    file_path: Path, loader: DocumentLoader, splitter: DocumentSplitter
-) -> Tuple[bool, int, str]:
+    file_path: Path,
+    loader: DocumentLoader,
+    splitter: DocumentSplitter,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Tuple[bool, List[Document], str]:
     """
     Process single file through the pipeline.
 
@@ -99,18 +159,26 @@ def process_file(
         file_path: Path to document file
         loader: Document loader instance
         splitter: Document splitter instance
+        metadata: Extra metadata added to every loaded document, and so
+            inherited by each of its chunks
 
     Returns:
-        Tuple of (success, chunk_count, error_message)
+        Tuple of (success, chunks, error_message); chunks is empty on failure
     """
     try:
         # Load document
         documents = loader.load_document(file_path)
 
         if not documents:
-            return False, 0, "No documents loaded"
+            return False, [], "No documents loaded"
 
-        logger.info(
+        # Splitters copy document metadata into each chunk, so tagging the
+        # few loaded documents avoids a second pass over the chunks
+        if metadata:
+            for document in documents:
+                document.metadata.update(metadata)
+
+        logger.debug(
             codes.INGESTION_FILE_LOADED,
             filename=file_path.name,
             doc_count=len(documents),
@@ -120,13 +188,13 @@ def process_file(
         chunks = splitter.split_documents(documents)
 
         if not chunks:
-            return False, 0, "No chunks created"
+            return False, [], "No chunks created"
 
-        logger.info(
+        logger.debug(
             codes.INGESTION_FILE_SPLIT, filename=file_path.name, chunk_count=len(chunks)
         )
 
-        return True, len(chunks), ""
+        return True, chunks, ""
 
     except Exception as e:
         error_msg = str(e)
@@ -136,21 +204,214 @@ def process_file(
             error=error_msg,
             exc_info=True,
         )
-        return False, 0, error_msg
+        return False, [], error_msg
+
+
+def _create_splitter(extension: str) -> DocumentSplitter:
+    """
+    Create the splitter for files with the given extension.
+
+    Args:
+        extension: Lower-case file extension, including the dot
+
+    Returns:
+        Splitter of the extension's dedicated type, or the default splitter
+    """
+    splitter_type = _SPLITTER_TYPES_BY_EXTENSION.get(extension)
+    if splitter_type is None:
+        return DocumentSplitter()
+    return DocumentSplitter(splitter_type=splitter_type)
+
+
+def _process_file_record(
+    file_record: Dict[str, Any],
+    loader: DocumentLoader,
+    get_splitter: Callable[[str], DocumentSplitter],
+) -> Dict[str, Any]:
+    """
+    Check, load and split one unindexed file record.
+
+    Args:
+        file_record: File record from the database (id, filename, file_path)
+        loader: Document loader instance
+        get_splitter: Returns the splitter for a lower-case file extension
+
+    Returns:
+        Dict with file_id, filename, status, chunks and error; chunks carry
+        file_id and filename metadata
+    """
+    file_id = file_record["id"]
+    filename = file_record["filename"]
+    file_path = Path(file_record["file_path"])
+    result = {
+        "file_id": file_id,
+        "filename": filename,
+        "status": _RESULT_SKIPPED,
+        "chunks": [],
+        "error": "",
+    }
+
+    logger.debug(
+        codes.INGESTION_PROCESSING_FILE,
+        filename=filename,
+        file_id=file_id,
+        file_path=str(file_path),
+    )
+
+    # Check if file exists
+    if not file_path.exists():
+        logger.warning(
+            codes.INGESTION_FILE_SKIPPED,
+            filename=filename,
+            file_id=file_id,
+            reason="File not found in storage",
+        )
+        return result
+
+    # Check if supported
+    if not LoaderFactory.is_supported(file_path):
+        logger.warning(
+            codes.INGESTION_FILE_SKIPPED,
+            filename=filename,
+            file_id=file_id,
+            reason="Unsupported format",
+        )
+        return result
+
+    splitter = get_splitter(file_path.suffix.lower())
+    success, chunks, error_msg = process_file(
+        file_path,
+        loader,
+        splitter,
+        metadata={"file_id": file_id, "filename": filename},
+    )
+
+    if not success:
+        result["status"] = _RESULT_FAILED
+        result["error"] = error_msg
+        return result
+
+    result["status"] = _RESULT_SUCCESS
+    result["chunks"] = chunks
+    return result
+
+
+def _init_worker() -> None:
+    """
+    Pool initializer: build the worker process's loader and splitters once.
+
+    Like the in-process path, every record a worker handles then reuses
+    one DocumentLoader and one cached splitter per extension.
+    """
+    global _worker_loader, _worker_get_splitter
+    _worker_loader = DocumentLoader()
+    _worker_get_splitter = functools.lru_cache(maxsize=None)(_create_splitter)
+
+
+def _process_file_worker(file_record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pool worker: process one file record with the worker's loader and splitter.
+
+    Module-level so it pickles by reference; nothing is shared with the
+    parent beyond the record and the returned result.
+
+    Args:
+        file_record: File record from the database
+
+    Returns:
+        Result dict from _process_file_record
+    """
+    return _process_file_record(file_record, _worker_loader, _worker_get_splitter)
+
+
+def _store_chunks(
+    runner: asyncio.Runner,
+    vectorstore: VectorStoreProtocol,
+    embeddings: EmbeddingsProtocol,
+    chunks: List[Document],
+    batch_size: int,
+    concurrency: int,
+) -> None:
+    """
+    Embed and store chunks, keeping several batches in flight.
+
+    Args:
+        runner: Event loop runner shared by every flush of the ingest
+        vectorstore: Initialized vectorstore
+        embeddings: Embeddings provider used by the vectorstore
+        chunks: Chunks to embed and store
+        batch_size: Chunks per add_documents call
+        concurrency: Batches embedded and stored at once
+    """
+    logger.info(codes.INGESTION_FILE_EMBEDDED, chunk_count=len(chunks))
+
+    runner.run(
+        aadd_documents_batched(
+            vectorstore,
+            embeddings,
+            [chunk.page_content for chunk in chunks],
+            [chunk.metadata for chunk in chunks],
+            batch_size=batch_size,
+            max_concurrency=concurrency,
+        )
+    )
+
+    logger.info(codes.INGESTION_FILE_STORED, chunk_count=len(chunks))
+
+
+def _mark_files_indexed(file_service: FileService, file_ids: List[str]) -> None:
+    """
+    Mark stored files as indexed with a single batched update.
+
+    Args:
+        file_service: File service for database updates
+        file_ids: IDs of files whose chunks are stored
+    """
+    if not file_ids:
+        return
+
+    logger.info(
+        codes.REPOSITORY_OPERATION_STARTED,
+        operation="mark_files_as_indexed",
+        count=len(file_ids),
+    )
+
+    try:
+        marked = file_service.mark_many_as_indexed(file_ids)
+        logger.info(
+            codes.REPOSITORY_OPERATION_COMPLETED,
+            operation="mark_files_as_indexed",
+            count=marked,
+        )
+    except Exception as e:
+        logger.error(
+            codes.REPOSITORY_OPERATION_FAILED,
+            operation="mark_files_as_indexed",
+            count=len(file_ids),
+            error=str(e),
+        )
 
 
 def ingest_documents(
-    config: Config, clear_first: bool = False
+    config: Config, clear_first: bool = False, workers: int = 1
 ) -> Tuple[int, int, int, int]:
     """
     Ingest unindexed documents from database into vectorstore.
 
-    Reads the database for files where indexed=false, processes them from
-    the file_path column, stores in vectorstore, and marks as indexed=true.
+    Streams files where indexed=false from the database a page at a time,
+    processes them from the file_path column, stores in vectorstore, and
+    marks as indexed=true.
+
+    Loading and splitting are CPU-bound and independent per file, so with
+    workers > 1 they run in a process pool; chunks come back to this
+    process and are stored in vectorstore.ingest_batch_size batches,
+    vectorstore.ingest_upload_concurrency at a time, flushed whenever
+    vectorstore.ingest_flush_chunks are pending.
 
     Args:
         config: Application configuration
         clear_first: Whether to clear vectorstore first
+        workers: Processes used to load and split files (1 runs in-process)
 
     Returns:
         Tuple of (successful, failed, skipped, total_chunks)
@@ -158,22 +419,62 @@ def ingest_documents(
     # Initialize file service to query database
     file_service = FileService()
 
-    # Get all unindexed files from database
-    unindexed_files = file_service.get_unindexed_files()
+    # Count up front for progress; records are then streamed a page at a time
+    total_files = file_service.count_unindexed_files()
 
-    if not unindexed_files:
+    if total_files == 0:
         logger.warning(codes.INGESTION_FILES_FOUND, count=0)
         logger.warning(
             codes.INGESTION_FILE_SKIPPED, message="No unindexed files in database"
         )
         return 0, 0, 0, 0
 
+    unindexed_files = file_service.iter_unindexed_files()
+    workers = max(1, min(workers, total_files))
+
     logger.info(
         codes.INGESTION_FILES_FOUND,
-        count=len(unindexed_files),
+        count=total_files,
+        workers=workers,
         message="Unindexed files from database",
     )
 
+    # Fork the load/split workers before any client is built: vectorstore
+    # and SDK clients start threads, and forking a multi-threaded parent can
+    # deadlock a worker on a lock another thread held at fork time
+    if workers == 1:
+        return _ingest_files(
+            config, file_service, unindexed_files, total_files, clear_first, None
+        )
+
+    with Pool(workers, initializer=_init_worker) as pool:
+        return _ingest_files(
+            config, file_service, unindexed_files, total_files, clear_first, pool
+        )
+
+
+def _ingest_files(
+    config: Config,
+    file_service: FileService,
+    unindexed_files: Iterator[Dict[str, Any]],
+    total_files: int,
+    clear_first: bool,
+    pool: Optional[multiprocessing.pool.Pool],
+) -> Tuple[int, int, int, int]:
+    """
+    Load, split, embed and store unindexed files, then mark them indexed.
+
+    Args:
+        config: Application configuration
+        file_service: File service for database updates
+        unindexed_files: File records to ingest
+        total_files: Number of records, for progress logging
+        clear_first: Whether to clear vectorstore first
+        pool: Worker pool loading and splitting files (None runs in-process)
+
+    Returns:
+        Tuple of (successful, failed, skipped, total_chunks)
+    """
     # Initialize components
     embeddings = create_embeddings(config)
     vectorstore = create_vectorstore(config, embeddings)
@@ -185,121 +486,95 @@ def ingest_documents(
         vectorstore.clear()
         logger.info(codes.INGESTION_VECTORSTORE_CLEARED)
 
-    loader = DocumentLoader()
-    splitter = DocumentSplitter()
-
     # Process files from database
     successful = 0
     failed = 0
     skipped = 0
     total_chunks = 0
-    all_chunks = []
-    file_ids_to_mark = []  # Track file IDs to mark as indexed
-
-    for idx, file_record in enumerate(unindexed_files, 1):
-        file_id = file_record["id"]
-        filename = file_record["filename"]
-        file_path = Path(file_record["file_path"])
-
-        logger.info(
-            codes.INGESTION_PROCESSING_FILE,
-            current=idx,
-            total=len(unindexed_files),
-            filename=filename,
-            file_id=file_id,
-            file_path=str(file_path),
+    all_chunks = []  # Chunks not yet stored in the vectorstore
+    file_ids_to_mark = []  # Files whose chunks are in all_chunks
+    batch_size = config.vectorstore.ingest_batch_size
+    flush_chunks = config.vectorstore.ingest_flush_chunks
+    concurrency = config.vectorstore.ingest_upload_concurrency
+
+    def flush() -> None:
+        nonlocal all_chunks, file_ids_to_mark
+        _store_chunks(
+            runner, vectorstore, embeddings, all_chunks, batch_size, concurrency
         )
+        _mark_files_indexed(file_service, file_ids_to_mark)
+        all_chunks, file_ids_to_mark = [], []
 
-        # Check if file exists
-        if not file_path.exists():
-            logger.warning(
-                codes.INGESTION_FILE_SKIPPED,
-                filename=filename,
-                file_id=file_id,
-                reason="File not found in storage",
-            )
+    def collect(result: Dict[str, Any]) -> None:
+        nonlocal successful, failed, skipped, total_chunks
+
+        if result["status"] == _RESULT_SKIPPED:
             skipped += 1
-            continue
-
-        # Check if supported
-        if not LoaderFactory.is_supported(file_path):
-            logger.warning(
-                codes.INGESTION_FILE_SKIPPED,
-                filename=filename,
-                file_id=file_id,
-                reason="Unsupported format",
+        elif result["status"] == _RESULT_FAILED:
+            failed += 1
+            logger.error(
+                codes.INGESTION_FILE_ERROR,
+                filename=result["filename"],
+                file_id=result["file_id"],
+                error=result["error"],
             )
-            skipped += 1
-            continue
-
-        # Process file
-        success, chunk_count, error_msg = process_file(file_path, loader, splitter)
-
-        if success:
+        else:
+            chunk_count = len(result["chunks"])
             successful += 1
             total_chunks += chunk_count
+            all_chunks.extend(result["chunks"])
+            file_ids_to_mark.append(result["file_id"])
 
-            # Load and collect chunks for batch storage
-            documents = loader.load_document(file_path)
-            chunks = splitter.split_documents(documents)
-
-            # Add file metadata to chunks
-            for chunk in chunks:
-                chunk.metadata["file_id"] = file_id
-                chunk.metadata["filename"] = filename
-
-            all_chunks.extend(chunks)
-            file_ids_to_mark.append(file_id)
-
-            logger.info(
+            logger.debug(
                 codes.INGESTION_FILE_SUCCESS,
-                filename=filename,
-                file_id=file_id,
+                filename=result["filename"],
+                file_id=result["file_id"],
                 chunks=chunk_count,
             )
-        else:
-            failed += 1
-            logger.error(
-                codes.INGESTION_FILE_ERROR,
-                filename=filename,
-                file_id=file_id,
-                error=error_msg,
-            )
-
-    # Store all chunks in vectorstore (batch operation)
-    if all_chunks:
-        logger.info(codes.INGESTION_FILE_EMBEDDED, chunk_count=len(all_chunks))
-
-        texts = [chunk.page_content for chunk in all_chunks]
-        metadatas = [chunk.metadata for chunk in all_chunks]
-
-        vectorstore.add_documents(texts, metadatas)
 
-        logger.info(codes.INGESTION_FILE_STORED, chunk_count=len(all_chunks))
-
-        # Mark files as indexed in database
-        if file_ids_to_mark:
+            # Store whole files once enough chunks are pending, so memory
+            # stays bounded however many files are ingested
+            if len(all_chunks) >= flush_chunks:
+                flush()
+
+        # Per-file events are DEBUG; INFO gets a periodic progress line
+        processed = successful + failed + skipped
+        if (
+            processed % constants.INGESTION_PROGRESS_LOG_INTERVAL == 0
+            or processed == total_files
+        ):
             logger.info(
-                codes.REPOSITORY_OPERATION_STARTED,
-                operation="mark_files_as_indexed",
-                count=len(file_ids_to_mark),
+                codes.INGESTION_PROGRESS,
+                current=processed,
+                total=total_files,
+                successful=successful,
+                failed=failed,
+                skipped=skipped,
             )
 
-            for file_id in file_ids_to_mark:
-                try:
-                    file_service.mark_as_indexed(file_id)
-                    logger.info(
-                        codes.REPOSITORY_OPERATION_COMPLETED,
-                        operation="mark_as_indexed",
-                        file_id=file_id,
-                    )
-                except Exception as e:
-                    logger.error(
-                        codes.REPOSITORY_OPERATION_FAILED,
-                        operation="mark_as_indexed",
-                        file_id=file_id,
-                        error=str(e),
-                    )
+    # Every flush runs on this one loop: async embeddings clients (OpenAI's
+    # httpx.AsyncClient) pool connections on the loop that first uses them,
+    # so a fresh loop per flush would leave them holding closed-loop sockets
+    with asyncio.Runner() as runner:
+        if pool is None:
+            loader = DocumentLoader()
+            get_splitter = functools.lru_cache(maxsize=None)(_create_splitter)
+            for file_record in unindexed_files:
+                collect(_process_file_record(file_record, loader, get_splitter))
+        else:
+            for result in pool.imap_unordered(
+                _process_file_worker, unindexed_files, chunksize=_WORKER_CHUNKSIZE
+            ):
+                collect(result)
+
+        # Store chunks of the remaining files
+        if all_chunks:
+            flush()
+
+        # Release the async client's connections on the loop that owns them
+        aclose = getattr(embeddings, "aclose", None)
+        if aclose is not None:
+            runner.run(aclose())
 
     return successful, failed, skipped, total_chunks
 
@@ -366,7 +641,7 @@ def main():
 
         # Run ingestion
         successful, failed, skipped, total_chunks = ingest_documents(
-            config=config, clear_first=args.clear
+            config=config, clear_first=args.clear, workers=args.workers
         )
 
         # Calculate duration
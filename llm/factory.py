@@ -7,7 +7,7 @@ Follows the same pattern as embeddings and vectorstore factories.
 """
 
 from trace import codes
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict
 
 import constants
 from llm.base import LLMProtocol
@@ -23,8 +23,9 @@ def create_llm(config: "Config", **override_kwargs: Any) -> LLMProtocol:
     """
     Create an LLM provider based on configuration.
 
-    Uses a provider-based factory pattern for clean, maintainable code that follows
-    the Open/Closed Principle. To add a new provider, simply add implementation here.
+    Uses a provider mapping dictionary for clean, maintainable code that follows
+    the Open/Closed Principle. To add a new provider, add its _create_*_llm
+    function and an entry to PROVIDER_MAP.
 
     Args:
         config: Application configuration object
@@ -48,18 +49,14 @@ def create_llm(config: "Config", **override_kwargs: Any) -> LLMProtocol:
 
     logger.info(codes.LLM_FACTORY_CREATING, provider=provider)
 
-    if provider == constants.LLM_PROVIDER_GOOGLE:
-        return _create_google_llm(config, **override_kwargs)
+    create_provider_llm = PROVIDER_MAP.get(provider)
 
-    if provider == constants.LLM_PROVIDER_OPENAI:
-        return _create_openai_llm(config, **override_kwargs)
+    if create_provider_llm is None:
+        error_msg = f"Unsupported LLM provider: {provider}"
+        logger.error(codes.LLM_PROVIDER_UNKNOWN, provider=provider, message=error_msg)
+        raise ValueError(error_msg)
 
-    if provider == constants.LLM_PROVIDER_ANTHROPIC:
-        return _create_anthropic_llm(config, **override_kwargs)
-
-    error_msg = f"Unsupported LLM provider: {provider}"
-    logger.error(codes.LLM_PROVIDER_UNKNOWN, provider=provider, message=error_msg)
-    raise ValueError(error_msg)
+    return create_provider_llm(config, **override_kwargs)
 
 
 def _create_google_llm(config: "Config", **override_kwargs: Any):
@@ -126,3 +123,10 @@ def _create_anthropic_llm(config: "Config", **override_kwargs: Any):
         kwargs["anthropic_api_key"] = llm_config.api_key
 
     return ChatAnthropic(**kwargs)
+
+
+PROVIDER_MAP: Dict[str, Callable[..., LLMProtocol]] = {
+    constants.LLM_PROVIDER_GOOGLE: _create_google_llm,
+    constants.LLM_PROVIDER_OPENAI: _create_openai_llm,
+    constants.LLM_PROVIDER_ANTHROPIC: _create_anthropic_llm,
+}
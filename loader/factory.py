@@ -10,15 +10,8 @@ from pathlib import Path
 from typing import List
 
 import constants
+import loader.strategies
 from loader.base import LoaderProtocol
-from loader.strategies import (
-    CSVLoaderStrategy,
-    DocxLoaderStrategy,
-    JSONLoaderStrategy,
-    MarkdownLoaderStrategy,
-    PDFLoaderStrategy,
-    TextLoaderStrategy,
-)
 from logger.setup import get_logger
 
 logger = get_logger(__name__)
@@ -31,14 +24,15 @@ class LoaderFactory:
     Follows the Factory Method pattern with Open/Closed Principle.
     """
 
-    # Map file extensions to loader strategy classes
+    # Map file extensions to loader.strategies class names; the package
+    # imports a strategy's module (and its parser library) on first use
     _STRATEGY_MAP = {
-        constants.EXT_PDF: PDFLoaderStrategy,
-        constants.EXT_TXT: TextLoaderStrategy,
-        constants.EXT_MD: MarkdownLoaderStrategy,
-        constants.EXT_DOCX: DocxLoaderStrategy,
-        constants.EXT_CSV: CSVLoaderStrategy,
-        constants.EXT_JSON: JSONLoaderStrategy,
+        constants.EXT_PDF: "PDFLoaderStrategy",
+        constants.EXT_TXT: "TextLoaderStrategy",
+        constants.EXT_MD: "MarkdownLoaderStrategy",
+        constants.EXT_DOCX: "DocxLoaderStrategy",
+        constants.EXT_CSV: "CSVLoaderStrategy",
+        constants.EXT_JSON: "JSONLoaderStrategy",
     }
 
     @classmethod
@@ -91,5 +85,6 @@ class LoaderFactory:
             )
             raise ValueError(error_msg)
 
-        strategy_class = cls._STRATEGY_MAP[extension]
+        strategy_class = getattr(loader.strategies, cls._STRATEGY_MAP[extension])
+
         return strategy_class(str(file_path))
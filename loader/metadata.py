@@ -34,16 +34,19 @@ class DocumentMetadataEnricher:
         Returns:
             List of documents with enriched metadata (same objects, modified in place)
         """
-        file_size = file_path.stat().st_size
-        file_type = FileTypeMapper.get_type(file_path)
+        # Same values for every document (e.g. each page of a PDF); build
+        # them once and merge with a single dict.update per document
+        file_metadata = {
+            constants.META_SOURCE: str(file_path),
+            constants.META_FILE_TYPE: FileTypeMapper.get_type(file_path),
+            constants.META_FILE_SIZE: file_path.stat().st_size,
+        }
 
         for doc in documents:
             if doc.metadata is None:
                 doc.metadata = {}
 
-            doc.metadata[constants.META_SOURCE] = str(file_path)
-            doc.metadata[constants.META_FILE_TYPE] = file_type
-            doc.metadata[constants.META_FILE_SIZE] = file_size
+            doc.metadata.update(file_metadata)
 
         return documents
 
@@ -3,14 +3,31 @@ Document Loader Strategies.
 
 Individual loader implementations for different file formats.
 Each strategy is a self-contained module following Single Responsibility Principle.
+
+Strategies are imported on first access (PEP 562), so importing this package
+does not load the parsers (pypdf, docx2txt, ...) of formats that are never used.
 """
 
-from loader.strategies.csv import CSVLoaderStrategy
-from loader.strategies.docx import DocxLoaderStrategy
-from loader.strategies.json import JSONLoaderStrategy
-from loader.strategies.markdown import MarkdownLoaderStrategy
-from loader.strategies.pdf import PDFLoaderStrategy
-from loader.strategies.text import TextLoaderStrategy
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from loader.strategies.csv import CSVLoaderStrategy
+    from loader.strategies.docx import DocxLoaderStrategy
+    from loader.strategies.json import JSONLoaderStrategy
+    from loader.strategies.markdown import MarkdownLoaderStrategy
+    from loader.strategies.pdf import PDFLoaderStrategy
+    from loader.strategies.text import TextLoaderStrategy
+
+# Strategy class name -> defining module
+_LAZY_STRATEGIES = {
+    "CSVLoaderStrategy": "loader.strategies.csv",
+    "DocxLoaderStrategy": "loader.strategies.docx",
+    "JSONLoaderStrategy": "loader.strategies.json",
+    "MarkdownLoaderStrategy": "loader.strategies.markdown",
+    "PDFLoaderStrategy": "loader.strategies.pdf",
+    "TextLoaderStrategy": "loader.strategies.text",
+}
 
 __all__ = [
     "CSVLoaderStrategy",
@@ -20,3 +37,18 @@ __all__ = [
     "PDFLoaderStrategy",
     "TextLoaderStrategy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a strategy class on first access and cache it on the package."""
+    if name not in _LAZY_STRATEGIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    strategy_class = getattr(importlib.import_module(_LAZY_STRATEGIES[name]), name)
+    globals()[name] = strategy_class
+    return strategy_class
+
+
+def __dir__() -> list:
+    """Include lazily imported strategies in dir()."""
+    return sorted(set(globals()) | set(__all__))
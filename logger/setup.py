@@ -7,8 +7,9 @@ global context, and optional caller/process information.
 
 import logging
 import sys
-from typing import Any, List
+from typing import Any, Callable, List, Optional
 
+import orjson
 import structlog
 
 LOG_LEVEL_MAP = {
@@ -20,6 +21,28 @@ LOG_LEVEL_MAP = {
 }
 
 
+def _orjson_dumps(
+    event_dict: Any, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any
+) -> str:
+    """
+    Serialize a log event with orjson for structlog's JSONRenderer.
+
+    orjson encodes in C, several times faster than json.dumps. It returns
+    bytes, so the result is decoded for the stdlib logging handlers.
+
+    Args:
+        event_dict: Event dict to serialize
+        default: Fallback for values orjson can't encode natively
+        **kwargs: json.dumps options passed by JSONRenderer (ignored)
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(
+        event_dict, default=default, option=orjson.OPT_NON_STR_KEYS
+    ).decode("utf-8")
+
+
 def setup_logging(logging_config: Any, app_config: Any) -> None:
     """
     Configure structured logging with structlog.
@@ -44,6 +67,9 @@ def setup_logging(logging_config: Any, app_config: Any) -> None:
 def _build_processors(logging_config: Any) -> List:
     """Build processor chain based on configuration."""
     processors = [
+        # Drop events below the configured level before any processor runs,
+        # so filtered debug calls cost no timestamping or rendering
+        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
@@ -69,7 +95,7 @@ def _build_processors(logging_config: Any) -> List:
     if logging_config.format.lower() == "json":
         processors.append(structlog.processors.format_exc_info)
         processors.append(structlog.processors.UnicodeDecoder())
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
         return processors
 
     processors.append(structlog.processors.UnicodeDecoder())
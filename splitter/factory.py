@@ -10,7 +10,7 @@ import trace.codes as codes
 import constants
 from logger.setup import get_logger
 from splitter.base import SplitterProtocol
-from splitter.strategies import TokenSplitterStrategy
+from splitter.strategies import MarkdownSplitterStrategy, TokenSplitterStrategy
 from splitter.validators import SplitterParameterValidator
 
 logger = get_logger(__name__)
@@ -19,8 +19,9 @@ logger = get_logger(__name__)
 class SplitterFactory:
     """Factory for creating text splitter strategies.
 
-    Currently supports token-based splitting. Can be extended to support
-    recursive, character-based, or custom splitting strategies.
+    Currently supports token-based and Markdown-aware splitting. Can be
+    extended to support recursive, character-based, or custom splitting
+    strategies.
 
     Follows the Factory Method pattern with Open/Closed Principle.
     """
@@ -28,6 +29,7 @@ class SplitterFactory:
     # Map splitter types to strategy classes
     _STRATEGY_MAP = {
         constants.SPLITTER_TYPE_TOKEN: TokenSplitterStrategy,
+        constants.SPLITTER_TYPE_MARKDOWN: MarkdownSplitterStrategy,
         # Future: Add more splitter types
         # constants.SPLITTER_TYPE_RECURSIVE: RecursiveSplitterStrategy,
         # constants.SPLITTER_TYPE_CHARACTER: CharacterSplitterStrategy,
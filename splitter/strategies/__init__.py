@@ -5,8 +5,10 @@ Individual splitter implementations for different splitting approaches.
 Each strategy is a self-contained module following Single Responsibility Principle.
 """
 
+from splitter.strategies.markdown import MarkdownSplitterStrategy
 from splitter.strategies.token import TokenSplitterStrategy
 
 __all__ = [
+    "MarkdownSplitterStrategy",
     "TokenSplitterStrategy",
 ]
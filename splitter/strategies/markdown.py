@@ -0,0 +1,59 @@
+"""
+Markdown-Aware Text Splitter Strategy.
+
+Splits Markdown documents along their structure (headings, then paragraphs,
+lines and words) using LangChain's RecursiveCharacterTextSplitter, measuring
+chunk length in tokens like the token strategy.
+"""
+
+from typing import List
+
+from langchain_core.documents import Document
+from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
+
+
+class MarkdownSplitterStrategy:
+    """Strategy for splitting Markdown documents on section boundaries.
+
+    A fixed token window cuts sections mid-sentence and merges the tail of
+    one section with the head of the next. This strategy only falls back to
+    finer separators when a section doesn't fit in chunk_size tokens, so
+    chunks follow the document's headings.
+
+    Attributes:
+        chunk_size: Maximum number of tokens per chunk
+        chunk_overlap: Number of tokens to overlap between chunks
+    """
+
+    def __init__(self, chunk_size: int = 512, chunk_overlap: int = 100):
+        """Initialize Markdown-aware splitter.
+
+        Args:
+            chunk_size: Maximum tokens per chunk (default: 512)
+            chunk_overlap: Tokens to overlap between chunks (default: 100)
+        """
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self._splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            separators=RecursiveCharacterTextSplitter.get_separators_for_language(
+                Language.MARKDOWN
+            ),
+            is_separator_regex=True,
+        )
+
+    def split_documents(self, documents: List[Document]) -> List[Document]:
+        """Split documents into section-aligned chunks.
+
+        Args:
+            documents: List of Document objects to split
+
+        Returns:
+            List of Document objects representing chunks.
+            Each chunk preserves the original document's metadata.
+
+        Raises:
+            Exception: If splitting fails
+        """
+        return self._splitter.split_documents(documents)
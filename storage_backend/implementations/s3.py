@@ -13,6 +13,7 @@ from trace import codes
 from typing import BinaryIO, Dict, List
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 import constants
@@ -29,6 +30,7 @@ class S3Storage:
     - LocalStack support for development
     - Role assumption for cross-account access
     - Secure by default (no hardcoded credentials)
+    - Streaming multipart transfers for large files
     """
 
     def __init__(self, config):
@@ -46,6 +48,7 @@ class S3Storage:
 
         self.session = self._create_session(s3_config)
         self.client = self._create_client(s3_config)
+        self.transfer_config = self._create_transfer_config(s3_config)
 
         self._verify_bucket_access()
 
@@ -142,6 +145,22 @@ class S3Storage:
 
         return self.session.client(**client_kwargs)
 
+    def _create_transfer_config(self, s3_config) -> TransferConfig:
+        """
+        Create transfer settings shared by uploads and downloads.
+
+        Upload streams above the threshold are sent as multipart parts
+        read chunk by chunk, so a large upload is never held in memory
+        whole. Downloads use ranged parts in parallel but are still
+        collected into an in-memory buffer by download_file().
+        """
+        megabyte = constants.BYTES_PER_MB
+        return TransferConfig(
+            multipart_threshold=s3_config.multipart_threshold_mb * megabyte,
+            multipart_chunksize=s3_config.multipart_chunksize_mb * megabyte,
+            max_concurrency=s3_config.max_concurrency,
+        )
+
     def _verify_bucket_access(self) -> None:
         """Verify bucket access and log credential source."""
         self.client.head_bucket(Bucket=self.bucket_name)
@@ -168,7 +187,9 @@ class S3Storage:
         """
         logger.info(codes.STORAGE_UPLOADING, filename=filename, bucket=self.bucket_name)
 
-        self.client.upload_fileobj(file_stream, self.bucket_name, filename)
+        self.client.upload_fileobj(
+            file_stream, self.bucket_name, filename, Config=self.transfer_config
+        )
 
         logger.info(
             codes.STORAGE_UPLOADED,
@@ -198,7 +219,9 @@ class S3Storage:
         logger.info(codes.STORAGE_DOWNLOADING, filename=filename)
 
         stream = BytesIO()
-        self.client.download_fileobj(self.bucket_name, filename, stream)
+        self.client.download_fileobj(
+            self.bucket_name, filename, stream, Config=self.transfer_config
+        )
         stream.seek(0)
 
         logger.info(
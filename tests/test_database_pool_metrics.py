@@ -0,0 +1,137 @@
+"""
+Tests for connection pool overflow metrics.
+
+Test Coverage:
+- attach_to_engine() on pools with and without overflow support
+- Overflow changes are logged on checkout and checkin
+- Steady state (no overflow change) logs nothing
+- Peak overflow and overflow checkout counters
+"""
+
+from trace import codes
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool, StaticPool
+
+import constants
+from database.pool_metrics import PoolMetricsLogger
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create a SQLite engine on a QueuePool with one slot and two overflow."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=2,
+    )
+    # Open the pooled slot once so overflow starts at 0, not -pool_size
+    with engine.connect():
+        pass
+    yield engine
+    engine.dispose()
+
+
+def overflow_events(mock_logger):
+    """Get the overflow values of logged overflow-change events."""
+    return [
+        call.kwargs["overflow"]
+        for call in mock_logger.info.call_args_list
+        if call.args[0] == codes.DB_CONNECTION_POOL_OVERFLOW_CHANGED
+    ]
+
+
+# ============================================================================
+# ATTACH TESTS
+# ============================================================================
+
+
+class TestAttachToEngine:
+    """Test attaching listeners to engines."""
+
+    def test_attaches_to_queue_pool(self, engine):
+        """Test pools with overflow() get listeners."""
+        metrics = PoolMetricsLogger(constants.DB_MODE_READ)
+
+        assert metrics.attach_to_engine(engine) is True
+        assert metrics.mode == constants.DB_MODE_READ
+
+    def test_skips_pool_without_overflow(self):
+        """Test pools without overflow() are skipped and never log."""
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        metrics = PoolMetricsLogger()
+
+        with patch("database.pool_metrics.logger") as mock_logger:
+            assert metrics.attach_to_engine(engine) is False
+            with engine.connect():
+                pass
+
+        mock_logger.info.assert_not_called()
+        engine.dispose()
+
+
+# ============================================================================
+# OVERFLOW LOGGING TESTS
+# ============================================================================
+
+
+class TestOverflowLogging:
+    """Test overflow-change logging."""
+
+    def test_logs_only_when_overflow_changes(self, engine):
+        """Test checkouts within pool_size log nothing."""
+        metrics = PoolMetricsLogger()
+        metrics.attach_to_engine(engine)
+
+        with patch("database.pool_metrics.logger") as mock_logger:
+            for _ in range(3):
+                with engine.connect():
+                    pass
+
+        assert overflow_events(mock_logger) == []
+
+    def test_logs_overflow_growth_and_shrink(self, engine):
+        """Test spilling into max_overflow and back is logged per change."""
+        metrics = PoolMetricsLogger()
+        metrics.attach_to_engine(engine)
+
+        with patch("database.pool_metrics.logger") as mock_logger:
+            first = engine.connect()
+            second = engine.connect()
+            third = engine.connect()
+            third.close()
+            second.close()
+            first.close()
+            # checkin fires before the pool takes the connection back, so
+            # the last shrink is seen by the next event
+            with engine.connect():
+                pass
+
+        assert overflow_events(mock_logger) == [1, 2, 1, 0]
+        assert metrics.peak_overflow == 2
+        assert metrics.overflow_checkouts == 2
+        assert metrics.overflow == 0
+
+    def test_logged_event_carries_pool_state(self, engine):
+        """Test the log line reports mode, delta and pool occupancy."""
+        metrics = PoolMetricsLogger(constants.DB_MODE_WRITE)
+        metrics.attach_to_engine(engine)
+
+        with patch("database.pool_metrics.logger") as mock_logger:
+            first = engine.connect()
+            second = engine.connect()
+            second.close()
+            first.close()
+
+        growth = mock_logger.info.call_args_list[0].kwargs
+        assert growth["mode"] == constants.DB_MODE_WRITE
+        assert growth["delta"] == 1
+        assert growth["checked_out"] == 2
+        assert growth["pool_size"] == 1
@@ -0,0 +1,152 @@
+"""
+Tests for SQL query logging with statement dedupe.
+
+Test Coverage:
+- Mode prefix selection
+- _should_log() dedupe window, suppressed count and 2048-entry cap
+- attach_to_engine() logs a repeated statement once per window
+"""
+
+from trace import codes
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import constants
+from database.query_logger import QueryLogger
+
+WINDOW = constants.QUERY_LOG_DEDUP_WINDOW_SECONDS
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def query_logger():
+    """Create query logger for the write database."""
+    return QueryLogger(constants.DB_MODE_WRITE)
+
+
+@pytest.fixture
+def clock():
+    """Patch the monotonic clock used for dedupe windows."""
+    with patch("database.query_logger.time.monotonic", return_value=1000.0) as now:
+        yield now
+
+
+# ============================================================================
+# PREFIX TESTS
+# ============================================================================
+
+
+class TestPrefix:
+    """Test mode prefix selection."""
+
+    def test_write_prefix(self):
+        """Test write mode uses the write prefix."""
+        logger = QueryLogger(constants.DB_MODE_WRITE)
+
+        assert logger.prefix == constants.QUERY_LOG_PREFIX_WRITE
+
+    def test_read_prefix(self):
+        """Test read mode uses the read prefix."""
+        logger = QueryLogger(constants.DB_MODE_READ)
+
+        assert logger.prefix == constants.QUERY_LOG_PREFIX_READ
+
+
+# ============================================================================
+# DEDUPE TESTS
+# ============================================================================
+
+
+class TestShouldLog:
+    """Test statement dedupe window."""
+
+    def test_first_occurrence_logged(self, query_logger, clock):
+        """Test a new statement is logged with nothing suppressed."""
+        assert query_logger._should_log("SELECT 1") == (True, None)
+
+    def test_repeat_within_window_suppressed(self, query_logger, clock):
+        """Test repeats inside the window are not logged."""
+        query_logger._should_log("SELECT 1")
+        clock.return_value += WINDOW - 1
+
+        assert query_logger._should_log("SELECT 1") == (False, None)
+        assert query_logger._should_log("SELECT 1") == (False, None)
+
+    def test_distinct_statements_logged(self, query_logger, clock):
+        """Test different statements do not suppress each other."""
+        query_logger._should_log("SELECT 1")
+
+        assert query_logger._should_log("SELECT 2") == (True, None)
+
+    def test_window_expiry_reports_suppressed_count(self, query_logger, clock):
+        """Test the first log after the window reports suppressed repeats."""
+        query_logger._should_log("SELECT 1")
+        for _ in range(3):
+            query_logger._should_log("SELECT 1")
+        clock.return_value += WINDOW
+
+        assert query_logger._should_log("SELECT 1") == (True, 3)
+
+    def test_window_restarts_after_expiry(self, query_logger, clock):
+        """Test the suppressed count resets with each new window."""
+        query_logger._should_log("SELECT 1")
+        query_logger._should_log("SELECT 1")
+        clock.return_value += WINDOW
+        query_logger._should_log("SELECT 1")
+        clock.return_value += WINDOW
+
+        assert query_logger._should_log("SELECT 1") == (True, None)
+
+    def test_window_measured_from_first_log(self, query_logger, clock):
+        """Test suppressed repeats do not extend the window."""
+        query_logger._should_log("SELECT 1")
+        clock.return_value += WINDOW - 1
+        query_logger._should_log("SELECT 1")
+        clock.return_value += 1
+
+        assert query_logger._should_log("SELECT 1") == (True, 1)
+
+    def test_entries_capped_oldest_evicted(self, query_logger, clock):
+        """Test at most QUERY_LOG_DEDUP_MAX_ENTRIES statements are tracked."""
+        cap = constants.QUERY_LOG_DEDUP_MAX_ENTRIES
+        for i in range(cap + 1):
+            query_logger._should_log(f"SELECT {i}")
+
+        assert len(query_logger._seen) == cap
+        # The oldest statement was evicted, so it is logged again in-window
+        assert query_logger._should_log("SELECT 0") == (True, None)
+        assert query_logger._should_log(f"SELECT {cap}") == (False, None)
+
+
+# ============================================================================
+# ENGINE INTEGRATION TESTS
+# ============================================================================
+
+
+class TestAttachToEngine:
+    """Test logging executed statements."""
+
+    def test_repeated_statement_logged_once(self, query_logger):
+        """Test an N+1 style repeat is logged once per window."""
+        engine = create_engine("sqlite://")
+        query_logger.attach_to_engine(engine)
+
+        with patch("database.query_logger.logger") as mock_logger:
+            with engine.connect() as conn:
+                for _ in range(5):
+                    conn.execute(text("SELECT 1"))
+
+        executed = [
+            call
+            for call in mock_logger.info.call_args_list
+            if call.args[0] == codes.DB_QUERY_EXECUTED
+        ]
+        assert len(executed) == 1
+        assert executed[0].kwargs["prefix"] == constants.QUERY_LOG_PREFIX_WRITE
+        assert executed[0].kwargs["suppressed"] is None
+        engine.dispose()
@@ -71,6 +71,19 @@ class TestAnthropicEmbeddingsInitialization:
             # Verify SSL settings were configured
             mock_voyage_class.assert_called_once()
 
+    def test_ssl_patch_applied_once(self, mock_config):
+        """Test repeated construction doesn't stack requests patches."""
+        import requests
+
+        with patch("voyageai.Client"):
+            from embeddings.implementations.anthropic import AnthropicEmbeddings
+
+            AnthropicEmbeddings(mock_config)
+            patched_request = requests.Session.request
+            AnthropicEmbeddings(mock_config)
+
+            assert requests.Session.request is patched_request
+
 
 # ============================================================================
 # EMBED DOCUMENTS TESTS
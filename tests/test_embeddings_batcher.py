@@ -0,0 +1,157 @@
+"""
+Tests for embed_query micro-batching.
+
+Test Coverage:
+- Bypass when flush interval is 0
+- Concurrent queries coalesced into one batch call
+- Identical concurrent queries embedded once
+- Batches never exceed max_batch_size
+- Errors propagated to every caller
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from embeddings.batcher import QueryBatcher
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def submit_concurrently(batcher, texts):
+    """Submit texts from separate threads and collect results by text."""
+    results = {}
+    errors = {}
+
+    def worker(text):
+        try:
+            results[text] = batcher.submit(text)
+        except Exception as e:
+            errors[text] = e
+
+    threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results, errors
+
+
+# ============================================================================
+# QUERY BATCHER TESTS
+# ============================================================================
+
+
+class TestQueryBatcher:
+    """Test QueryBatcher coalescing."""
+
+    def test_bypass_when_interval_zero(self):
+        """Test queries are embedded individually with batching disabled."""
+        embed_one = MagicMock(return_value=[0.1])
+        embed_many = MagicMock()
+        batcher = QueryBatcher(embed_one, embed_many, 16, 0)
+
+        assert batcher.submit("query") == [0.1]
+        embed_one.assert_called_once_with("query")
+        embed_many.assert_not_called()
+
+    def test_single_query_uses_embed_one(self):
+        """Test a lone query in the window is embedded individually."""
+        embed_one = MagicMock(return_value=[0.1])
+        embed_many = MagicMock()
+        batcher = QueryBatcher(embed_one, embed_many, 16, 5)
+
+        assert batcher.submit("query") == [0.1]
+        embed_many.assert_not_called()
+
+    def test_coalesces_concurrent_queries(self):
+        """Test concurrent queries share one batch call and get own vectors."""
+        embed_many = MagicMock(
+            side_effect=lambda texts: [[float(len(text))] for text in texts]
+        )
+        texts = ["a", "bb", "ccc", "dddd"]
+        batcher = QueryBatcher(MagicMock(), embed_many, len(texts), 5000)
+
+        results, errors = submit_concurrently(batcher, texts)
+
+        assert not errors
+        assert results == {text: [float(len(text))] for text in texts}
+        embed_many.assert_called_once()
+
+    def test_embeds_identical_queries_once(self):
+        """Test repeated queries in one window share a single input."""
+        embed_many = MagicMock(
+            side_effect=lambda texts: [[float(len(text))] for text in texts]
+        )
+        texts = ["a", "bb", "a", "a"]
+        batcher = QueryBatcher(MagicMock(), embed_many, len(texts), 5000)
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda t=text: results.append(batcher.submit(t)))
+            for text in texts
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == [[1.0], [1.0], [1.0], [2.0]]
+        assert sorted(embed_many.call_args[0][0]) == ["a", "bb"]
+
+    def test_propagates_errors_to_all_callers(self):
+        """Test batch failure is raised in every waiting caller."""
+        embed_many = MagicMock(side_effect=RuntimeError("API Error"))
+        texts = ["a", "b"]
+        batcher = QueryBatcher(MagicMock(), embed_many, len(texts), 5000)
+
+        results, errors = submit_concurrently(batcher, texts)
+
+        assert not results
+        assert set(errors) == set(texts)
+        for error in errors.values():
+            with pytest.raises(RuntimeError, match="API Error"):
+                raise error
+
+    def test_full_batch_closed_before_flush(self):
+        """Test callers arriving before the leader flushes start a new batch."""
+        batch_sizes = []
+
+        def embed_many(texts):
+            batch_sizes.append(len(texts))
+            return [[float(len(text))] for text in texts]
+
+        texts = ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"]
+        batcher = QueryBatcher(MagicMock(), embed_many, 2, 5000)
+
+        # Hold every leader between wake-up and flush so the remaining
+        # callers all arrive while the first batch is already full
+        release = threading.Event()
+        flush = batcher._flush
+
+        def gated_flush(pending):
+            release.wait()
+            flush(pending)
+
+        batcher._flush = gated_flush
+        results = {}
+        threads = [
+            threading.Thread(
+                target=lambda t=text: results.__setitem__(t, batcher.submit(t))
+            )
+            for text in texts
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == {text: [float(len(text))] for text in texts}
+        assert batch_sizes == [2, 2, 2]
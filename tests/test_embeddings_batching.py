@@ -0,0 +1,555 @@
+"""
+Tests for embeddings batch dispatch helpers.
+
+Test Coverage:
+- dedupe()
+- length_order()
+- split_batches() by count and token budget
+- estimate_tokens()
+- map_batches() ordering, dedupe, blank texts, concurrency bound and
+  error propagation
+- gather_batches() async dispatch
+- iter_windows()
+- pipeline_windows() ordering, overlap and error propagation
+- write_windows() precomputed and provider-embedded vectors
+- embed_with_retry() / aembed_with_retry() backoff retries, Retry-After and
+  split-in-half isolation
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from embeddings.batching import (
+    aembed_with_retry,
+    dedupe,
+    embed_with_retry,
+    estimate_tokens,
+    gather_batches,
+    iter_windows,
+    length_order,
+    map_batches,
+    pipeline_windows,
+    split_batches,
+    write_windows,
+)
+
+
+class TransientError(Exception):
+    """Retryable error raised by fake provider calls."""
+
+
+class ThrottledError(TransientError):
+    """Retryable error carrying an HTTP response with Retry-After."""
+
+    def __init__(self, retry_after):
+        super().__init__("429")
+        self.response = SimpleNamespace(headers={"retry-after": retry_after})
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def executor():
+    """Create thread pool for batch dispatch."""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+# ============================================================================
+# DEDUPE TESTS
+# ============================================================================
+
+
+class TestDedupe:
+    """Test dedupe() helper."""
+
+    def test_collapses_repeats(self):
+        """Test repeated texts map to one unique entry."""
+        unique, positions = dedupe(["a", "b", "a", "c", "b"])
+
+        assert unique == ["a", "b", "c"]
+        assert positions == [0, 1, 0, 2, 1]
+
+    def test_no_repeats(self):
+        """Test distinct texts are returned unchanged."""
+        assert dedupe(["a", "b"]) == (["a", "b"], [0, 1])
+
+
+# ============================================================================
+# LENGTH ORDER TESTS
+# ============================================================================
+
+
+class TestLengthOrder:
+    """Test length_order() helper."""
+
+    def test_orders_shortest_first(self):
+        """Test indices are ordered by text length."""
+        assert length_order(["ccc", "a", "bb"]) == [1, 2, 0]
+
+    def test_stable_for_equal_lengths(self):
+        """Test equal-length texts keep input order."""
+        assert length_order(["bb", "aa", "c"]) == [2, 0, 1]
+
+
+# ============================================================================
+# SPLIT BATCHES TESTS
+# ============================================================================
+
+
+class TestSplitBatches:
+    """Test split_batches() helper."""
+
+    def test_split_even(self):
+        """Test texts divisible by batch size."""
+        assert split_batches(["a", "b", "c", "d"], 2) == [["a", "b"], ["c", "d"]]
+
+    def test_split_remainder(self):
+        """Test last batch holds the remainder."""
+        assert split_batches(["a", "b", "c"], 2) == [["a", "b"], ["c"]]
+
+    def test_split_empty(self):
+        """Test empty input yields no batches."""
+        assert split_batches([], 10) == []
+
+    def test_split_by_token_budget(self):
+        """Test batches close before exceeding the token budget."""
+        texts = ["a" * 30, "b" * 30, "c" * 30, "d" * 30]
+
+        # Each text estimates to 11 tokens
+        assert split_batches(texts, 10, max_tokens=25) == [texts[:2], texts[2:]]
+
+    def test_split_oversized_text_alone(self):
+        """Test a text over the budget still gets its own batch."""
+        texts = ["a", "b" * 300]
+
+        assert split_batches(texts, 10, max_tokens=50) == [["a"], ["b" * 300]]
+
+    def test_split_with_custom_token_counter(self):
+        """Test a provider tokenizer replaces the byte estimate."""
+        texts = ["one two", "three", "four five six"]
+
+        batches = split_batches(
+            texts, 10, max_tokens=3, count_tokens=lambda text: len(text.split())
+        )
+
+        assert batches == [["one two", "three"], ["four five six"]]
+
+
+class TestEstimateTokens:
+    """Test estimate_tokens() helper."""
+
+    def test_counts_utf8_bytes(self):
+        """Test multi-byte text estimates more tokens than ASCII."""
+        assert estimate_tokens("abc") == 2
+        assert estimate_tokens("日本語") == 4
+
+
+# ============================================================================
+# MAP BATCHES TESTS
+# ============================================================================
+
+
+class TestMapBatches:
+    """Test map_batches() thread pool dispatch."""
+
+    def test_preserves_input_order(self, executor):
+        """Test results keep input order regardless of completion order."""
+        texts = [f"text {i}" for i in range(7)]
+
+        def process_batch(batch, batch_num):
+            # Later batches finish first
+            threading.Event().wait(0.01 * (5 - batch_num))
+            return [[float(text.split()[1])] for text in batch]
+
+        result = map_batches(texts, 2, process_batch, executor, 1)
+
+        assert result == [[float(i)] for i in range(7)]
+
+    def test_batches_by_length(self, executor):
+        """Test batches group similarly sized texts."""
+        texts = ["long text", "a", "medium", "b"]
+        seen_batches = []
+
+        def process_batch(batch, batch_num):
+            seen_batches.append(batch)
+            return [[float(len(text))] for text in batch]
+
+        result = map_batches(texts, 2, process_batch, executor, 1)
+
+        assert sorted(seen_batches) == [["a", "b"], ["medium", "long text"]]
+        assert result == [[9.0], [1.0], [6.0], [1.0]]
+
+    def test_respects_max_workers(self):
+        """Test no more than max_workers batches run at once."""
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def process_batch(batch, batch_num):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            threading.Event().wait(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return [[0.0] for _ in batch]
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            map_batches(["t"] * 10, 1, process_batch, executor, 1)
+
+        assert peak[0] <= 3
+
+    def test_embeds_repeated_texts_once(self, executor):
+        """Test duplicates are sent once and results fan back out."""
+        seen = []
+
+        def process_batch(batch, batch_num):
+            seen.extend(batch)
+            return [[float(len(text))] for text in batch]
+
+        result = map_batches(["aa", "b", "aa", "b"], 10, process_batch, executor, 1)
+
+        assert sorted(seen) == ["aa", "b"]
+        assert result == [[2.0], [1.0], [2.0], [1.0]]
+
+    def test_token_packed_batches_keep_order(self, executor):
+        """Test uneven token-packed batches scatter back to input order."""
+        texts = ["x" * 60, "a", "y" * 30, "b", "z" * 90]
+
+        def process_batch(batch, batch_num):
+            return [[float(len(text))] for text in batch]
+
+        result = map_batches(texts, 10, process_batch, executor, 1, 25)
+
+        assert result == [[60.0], [1.0], [30.0], [1.0], [90.0]]
+
+    def test_skips_blank_texts(self, executor):
+        """Test blank texts are not sent and get zero vectors."""
+        seen = []
+
+        def process_batch(batch, batch_num):
+            seen.extend(batch)
+            return [[1.0, 1.0] for _ in batch]
+
+        result = map_batches(["a", "", "  ", "b"], 10, process_batch, executor, 2)
+
+        assert sorted(seen) == ["a", "b"]
+        assert result == [[1.0, 1.0], [0.0, 0.0], [0.0, 0.0], [1.0, 1.0]]
+
+    def test_rejects_blank_texts_without_dimension(self, executor):
+        """Test blank texts raise when no zero-vector dimension is given."""
+        seen = []
+
+        def process_batch(batch, batch_num):
+            seen.extend(batch)
+            return [[1.0] for _ in batch]
+
+        with pytest.raises(ValueError, match="whitespace-only"):
+            map_batches(["a", " "], 10, process_batch, executor, 0)
+
+        assert seen == []
+
+    def test_single_batch_runs_inline(self, executor):
+        """Test a single batch skips the thread pool."""
+        caller = threading.current_thread()
+        threads = []
+
+        def process_batch(batch, batch_num):
+            threads.append(threading.current_thread())
+            return [[0.0] for _ in batch]
+
+        map_batches(["a", "b"], 10, process_batch, executor, 1)
+
+        assert threads == [caller]
+
+    def test_propagates_errors(self, executor):
+        """Test batch errors are raised to the caller."""
+
+        def process_batch(batch, batch_num):
+            raise RuntimeError("Batch failed")
+
+        with pytest.raises(RuntimeError, match="Batch failed"):
+            map_batches(["a", "b"], 1, process_batch, executor, 1)
+
+
+# ============================================================================
+# GATHER BATCHES TESTS
+# ============================================================================
+
+
+class TestGatherBatches:
+    """Test gather_batches() async dispatch."""
+
+    def test_preserves_input_order(self):
+        """Test results keep input order regardless of completion order."""
+        texts = [f"text {i}" for i in range(7)]
+
+        async def process_batch(batch, batch_num):
+            # Later batches finish first
+            await asyncio.sleep(0.01 * (5 - batch_num))
+            return [[float(text.split()[1])] for text in batch]
+
+        result = asyncio.run(gather_batches(texts, 2, process_batch, 4, 1))
+
+        assert result == [[float(i)] for i in range(7)]
+
+    def test_respects_max_concurrency(self):
+        """Test no more than max_concurrency batches run at once."""
+        in_flight = [0]
+        peak = [0]
+
+        async def process_batch(batch, batch_num):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return [[0.0] for _ in batch]
+
+        texts = [f"t{i}" for i in range(10)]
+        asyncio.run(gather_batches(texts, 1, process_batch, 3, 1))
+
+        assert peak[0] == 3
+
+
+# ============================================================================
+# ITER WINDOWS TESTS
+# ============================================================================
+
+
+class TestIterWindows:
+    """Test iter_windows() incremental embedding."""
+
+    def test_yields_windows_in_order(self):
+        """Test each window is embedded lazily and in input order."""
+        calls = []
+
+        def embed_documents(texts):
+            calls.append(texts)
+            return [[float(len(text))] for text in texts]
+
+        windows = iter_windows(embed_documents, ["a", "bb", "ccc"], 2)
+
+        assert calls == []
+        assert list(windows) == [[[1.0], [2.0]], [[3.0]]]
+        assert calls == [["a", "bb"], ["ccc"]]
+
+
+# ============================================================================
+# PIPELINE WINDOWS TESTS
+# ============================================================================
+
+
+class TestPipelineWindows:
+    """Test pipeline_windows() overlapped writes."""
+
+    def test_writes_windows_in_order(self):
+        """Test each window is written once with its start offset."""
+        written = []
+
+        count = pipeline_windows(
+            iter([[[1.0], [2.0]], [[3.0]]]),
+            lambda start, vectors: written.append((start, vectors)),
+        )
+
+        assert count == 3
+        assert written == [(0, [[1.0], [2.0]]), (2, [[3.0]])]
+
+    def test_overlaps_write_with_next_window(self):
+        """Test the next window is produced while the previous one is written."""
+        writing = threading.Event()
+        overlapped = []
+
+        def windows():
+            yield [[1.0]]
+            # Produced while window 0 is still being written
+            overlapped.append(writing.wait(1))
+            yield [[2.0]]
+
+        def write(start, vectors):
+            if start == 0:
+                writing.set()
+                threading.Event().wait(0.05)
+
+        pipeline_windows(windows(), write)
+
+        assert overlapped == [True]
+
+    def test_propagates_write_errors(self):
+        """Test a failed write stops the pipeline and is raised."""
+        produced = []
+
+        def windows():
+            for i in range(5):
+                produced.append(i)
+                yield [[float(i)]]
+
+        def write(start, vectors):
+            raise RuntimeError("Upsert failed")
+
+        with pytest.raises(RuntimeError, match="Upsert failed"):
+            pipeline_windows(windows(), write)
+
+        assert len(produced) < 5
+
+
+class TestWriteWindows:
+    """Test write_windows() for provider-embedded and precomputed vectors."""
+
+    def test_precomputed_vectors_written_inline(self):
+        """Test precomputed vectors are written once on the calling thread."""
+        caller = threading.current_thread()
+        written = []
+
+        def write(start, vectors):
+            written.append((start, vectors, threading.current_thread()))
+
+        provider = SimpleNamespace(iter_embed_documents=None)
+        count = write_windows(provider, ["a", "b"], [[1.0], [2.0]], write)
+
+        assert count == 2
+        assert written == [(0, [[1.0], [2.0]], caller)]
+
+    def test_embeds_texts_window_by_window(self):
+        """Test texts are embedded with iter_embed_documents and pipelined."""
+        written = []
+        provider = SimpleNamespace(
+            iter_embed_documents=lambda texts: iter(
+                [[[1.0]] * 2, [[2.0]]] if texts == ["a", "b", "c"] else []
+            )
+        )
+
+        count = write_windows(
+            provider,
+            ["a", "b", "c"],
+            None,
+            lambda start, vectors: written.append((start, len(vectors))),
+        )
+
+        assert count == 3
+        assert written == [(0, 2), (2, 1)]
+
+
+# ============================================================================
+# RETRY TESTS
+# ============================================================================
+
+
+class TestEmbedWithRetry:
+    """Test embed_with_retry() retry and split behaviour."""
+
+    def test_retries_transient_errors(self):
+        """Test retryable errors are retried until the call succeeds."""
+        attempts = []
+
+        def embed_batch(batch):
+            attempts.append(batch)
+            if len(attempts) < 3:
+                raise TransientError("429")
+            return [[1.0] for _ in batch]
+
+        result = embed_with_retry(embed_batch, ["a", "b"], (TransientError,), (), 5, 0)
+
+        assert result == [[1.0], [1.0]]
+        assert len(attempts) == 3
+
+    def test_waits_for_retry_after(self):
+        """Test a Retry-After header sets the wait, capped at the maximum."""
+        attempts = []
+
+        def embed_batch(batch):
+            attempts.append(batch)
+            if len(attempts) < 3:
+                raise ThrottledError("2" if len(attempts) == 1 else "30")
+            return [[1.0] for _ in batch]
+
+        with patch("time.sleep") as mock_sleep:
+            embed_with_retry(embed_batch, ["a"], (TransientError,), (), 5, 10)
+
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert 2 <= waits[0] <= 3
+        assert waits[1] == 10
+
+    def test_raises_after_max_attempts(self):
+        """Test persistent retryable errors are raised without splitting."""
+        attempts = []
+
+        def embed_batch(batch):
+            attempts.append(batch)
+            raise TransientError("429")
+
+        with pytest.raises(TransientError):
+            embed_with_retry(embed_batch, ["a", "b"], (TransientError,), (), 3, 0)
+
+        assert attempts == [["a", "b"]] * 3
+
+    def test_splits_to_isolate_bad_input(self):
+        """Test a failing batch is split so good inputs still embed."""
+
+        def embed_batch(batch):
+            if "bad" in batch and len(batch) > 1:
+                raise ValueError("Input too long")
+            return [[float(len(text))] for text in batch]
+
+        result = embed_with_retry(
+            embed_batch,
+            ["a", "bb", "bad", "dddd"],
+            (TransientError,),
+            (ValueError,),
+            1,
+            0,
+        )
+
+        assert result == [[1.0], [2.0], [3.0], [4.0]]
+
+    def test_raises_for_single_bad_input(self):
+        """Test a failing single-text batch raises the original error."""
+
+        def embed_batch(batch):
+            if "bad" in batch:
+                raise ValueError("Input too long")
+            return [[0.0] for _ in batch]
+
+        with pytest.raises(ValueError, match="Input too long"):
+            embed_with_retry(
+                embed_batch, ["a", "bad"], (TransientError,), (ValueError,), 1, 0
+            )
+
+    def test_raises_unsplittable_errors_immediately(self):
+        """Test errors outside splittable (e.g. auth) fail without splitting."""
+        attempts = []
+
+        def embed_batch(batch):
+            attempts.append(batch)
+            raise PermissionError("Invalid API key")
+
+        with pytest.raises(PermissionError):
+            embed_with_retry(
+                embed_batch, ["a", "b", "c"], (TransientError,), (ValueError,), 1, 0
+            )
+
+        assert attempts == [["a", "b", "c"]]
+
+    def test_async_splits_to_isolate_bad_input(self):
+        """Test the async path splits failing batches like the sync one."""
+
+        async def embed_batch(batch):
+            if "bad" in batch and len(batch) > 1:
+                raise ValueError("Input too long")
+            return [[float(len(text))] for text in batch]
+
+        result = asyncio.run(
+            aembed_with_retry(
+                embed_batch, ["a", "bad"], (TransientError,), (ValueError,), 1, 0
+            )
+        )
+
+        assert result == [[1.0], [3.0]]
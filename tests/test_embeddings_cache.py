@@ -0,0 +1,262 @@
+"""
+Tests for embedding cache.
+
+Test Coverage:
+- get()/put() hit and miss
+- float32 storage and buffer reuse on eviction
+- Key separation by input type
+- LRU eviction
+- lookup()/fill() for batches, including float32 array rows
+- Disabled cache (capacity 0)
+- Persistent SQLite store (survives new instances, keyed by dimension,
+  batched reads)
+- Provider integration (repeat queries skip the API)
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from config import Config
+from embeddings.cache import DiskEmbeddingStore, EmbeddingCache
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def cache():
+    """Create small embedding cache."""
+    return EmbeddingCache("test", "test-model", capacity=2)
+
+
+# ============================================================================
+# GET / PUT TESTS
+# ============================================================================
+
+
+class TestGetPut:
+    """Test single-entry cache operations."""
+
+    def test_miss_returns_none(self, cache):
+        """Test missing entry returns None."""
+        assert cache.get("text", "document") is None
+        assert cache.misses == 1
+
+    def test_hit_returns_embedding(self, cache):
+        """Test stored entry is returned."""
+        cache.put("text", "document", [0.5, 0.25])
+
+        assert cache.get("text", "document") == [0.5, 0.25]
+        assert cache.hits == 1
+
+    def test_input_type_is_part_of_key(self, cache):
+        """Test document and query embeddings are cached separately."""
+        cache.put("text", "document", [0.1])
+
+        assert cache.get("text", "query") is None
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test oldest unused entry is evicted when full."""
+        cache.put("a", "document", [1.0])
+        cache.put("b", "document", [2.0])
+        cache.get("a", "document")
+        cache.put("c", "document", [3.0])
+
+        assert cache.get("a", "document") == [1.0]
+        assert cache.get("b", "document") is None
+        assert cache.get("c", "document") == [3.0]
+
+    def test_stores_float32(self, cache):
+        """Test vectors are stored compactly and returned as float lists."""
+        cache.put("text", "document", [0.1, 0.2])
+
+        result = cache.get("text", "document")
+
+        assert isinstance(result, list)
+        assert result == pytest.approx([0.1, 0.2])
+        assert next(iter(cache._entries.values())).dtype == np.float32
+
+    def test_reuses_evicted_buffer(self, cache):
+        """Test eviction recycles the evicted array for the new entry."""
+        cache.put("a", "document", [1.0, 1.0])
+        cache.put("b", "document", [2.0, 2.0])
+        evicted_buffer = next(iter(cache._entries.values()))
+
+        cache.put("c", "document", [3, 3])
+
+        assert cache._entries[cache._key("c", "document")] is evicted_buffer
+        assert cache.get("c", "document") == [3.0, 3.0]
+
+    def test_zero_capacity_disables_cache(self):
+        """Test capacity 0 never stores entries."""
+        cache = EmbeddingCache("test", "test-model", capacity=0)
+        cache.put("text", "document", [0.1])
+
+        assert cache.get("text", "document") is None
+
+
+# ============================================================================
+# BATCH TESTS
+# ============================================================================
+
+
+class TestLookupFill:
+    """Test batch lookup and fill."""
+
+    def test_lookup_reports_missing_indices(self, cache):
+        """Test lookup returns cached results and miss indices."""
+        cache.put("b", "document", [2.0])
+
+        results, missing = cache.lookup(["a", "b", "c"], "document")
+
+        assert results == [None, [2.0], None]
+        assert missing == [0, 2]
+
+    def test_lookup_repeated_texts_once(self, cache):
+        """Test repeated texts count one lookup and all report missing."""
+        results, missing = cache.lookup(["a", "b", "a"], "document")
+
+        assert results == [None, None, None]
+        assert missing == [0, 1, 2]
+        assert cache.misses == 2
+
+    def test_fill_merges_and_stores(self):
+        """Test fill merges new embeddings in order and caches them."""
+        cache = EmbeddingCache("test", "test-model", capacity=10)
+        cache.put("b", "document", [2.0])
+        results, missing = cache.lookup(["a", "b", "c"], "document")
+
+        merged = cache.fill(results, missing, ["a", "c"], "document", [[1.0], [3.0]])
+
+        assert merged == [[1.0], [2.0], [3.0]]
+        assert cache.get("c", "document") == [3.0]
+
+    def test_fill_converts_array_rows_to_lists(self):
+        """Test float32 batch rows are cached and returned as float lists."""
+        cache = EmbeddingCache("test", "test-model", capacity=10)
+        results, missing = cache.lookup(["a", "b"], "document")
+        matrix = np.array([[0.5, 0.25], [1.0, 2.0]], dtype=np.float32)
+
+        merged = cache.fill(results, missing, ["a", "b"], "document", list(matrix))
+
+        assert merged == [[0.5, 0.25], [1.0, 2.0]]
+        assert all(type(vector) is list for vector in merged)
+        assert cache.get("b", "document") == [1.0, 2.0]
+
+    def test_fill_does_not_cache_blank_texts(self, tmp_path):
+        """Test zero vectors of blank texts are returned but never stored."""
+        cache = EmbeddingCache("test", "test-model", 10, str(tmp_path), 1)
+        results, missing = cache.lookup(["a", " "], "document")
+
+        merged = cache.fill(results, missing, ["a", " "], "document", [[1.0], [0.0]])
+
+        assert merged == [[1.0], [0.0]]
+        assert cache.get(" ", "document") is None
+        assert cache.get("a", "document") == [1.0]
+
+
+# ============================================================================
+# PERSISTENT STORE TESTS
+# ============================================================================
+
+
+class TestDiskStore:
+    """Test persistent SQLite tier."""
+
+    def test_survives_new_cache_instance(self, tmp_path):
+        """Test vectors written by one cache are served to the next."""
+        first = EmbeddingCache("test", "test-model", 10, str(tmp_path), 2)
+        first.store(["a", "b"], "document", [[0.5, 0.25], [1.0, 2.0]])
+
+        second = EmbeddingCache("test", "test-model", 10, str(tmp_path), 2)
+        results, missing = second.lookup(["a", "b", "c"], "document")
+
+        assert results == [[0.5, 0.25], [1.0, 2.0], None]
+        assert missing == [2]
+        assert second.hits == 2
+
+    def test_works_with_memory_tier_disabled(self, tmp_path):
+        """Test the store is used even when capacity is 0."""
+        cache = EmbeddingCache("test", "test-model", 0, str(tmp_path), 1)
+        cache.put("text", "query", [0.5])
+
+        assert cache.get("text", "query") == [0.5]
+
+    def test_key_includes_model_and_dimension(self, tmp_path):
+        """Test entries are not shared across models or output sizes."""
+        store = DiskEmbeddingStore(str(tmp_path), "test", "model-a", 2)
+        store.put_many(["text"], "document", [[0.5, 0.25]])
+
+        other_model = DiskEmbeddingStore(str(tmp_path), "test", "model-b", 2)
+        other_dimension = DiskEmbeddingStore(str(tmp_path), "test", "model-a", 4)
+
+        assert store.get("text", "document").tolist() == [0.5, 0.25]
+        assert other_model.get("text", "document") is None
+        assert other_dimension.get("text", "document") is None
+
+    def test_get_many_spans_query_chunks(self, tmp_path):
+        """Test batched reads keep input order across chunked queries."""
+        store = DiskEmbeddingStore(str(tmp_path), "test", "test-model", 1)
+        texts = [f"text {i}" for i in range(1200)]
+        store.put_many(texts[::2], "document", [[float(i)] for i in range(0, 1200, 2)])
+
+        vectors = store.get_many(texts, "document")
+
+        assert vectors[1198].tolist() == [1198.0]
+        assert vectors[1199] is None
+        assert sum(vector is not None for vector in vectors) == 600
+
+
+# ============================================================================
+# PROVIDER INTEGRATION TESTS (Mocked)
+# ============================================================================
+
+
+class TestProviderIntegration:
+    """Test providers reuse cached embeddings."""
+
+    def test_repeat_query_skips_api(self):
+        """Test repeated embed_query calls hit the API once."""
+        with patch("voyageai.Client") as mock_voyage_class:
+            mock_client = MagicMock()
+            mock_voyage_class.return_value = mock_client
+
+            mock_response = MagicMock()
+            mock_response.embeddings = [[0.5, 0.25]]
+            mock_client.embed.return_value = mock_response
+
+            from embeddings.implementations.anthropic import AnthropicEmbeddings
+
+            embeddings = AnthropicEmbeddings(Config())
+
+            first = embeddings.embed_query("What is RAG?")
+            second = embeddings.embed_query("What is RAG?")
+
+            assert first == second == [0.5, 0.25]
+            mock_client.embed.assert_called_once()
+
+    def test_repeat_documents_only_embed_new_texts(self):
+        """Test embed_documents only sends uncached texts to the API."""
+        with patch("voyageai.Client") as mock_voyage_class:
+            mock_client = MagicMock()
+            mock_voyage_class.return_value = mock_client
+
+            def embed(texts, model, input_type):
+                response = MagicMock()
+                response.embeddings = [[float(len(text))] for text in texts]
+                return response
+
+            mock_client.embed.side_effect = embed
+
+            from embeddings.implementations.anthropic import AnthropicEmbeddings
+
+            embeddings = AnthropicEmbeddings(Config())
+
+            embeddings.embed_documents(["a", "bb"])
+            result = embeddings.embed_documents(["a", "bb", "ccc"])
+
+            assert result == [[1.0], [2.0], [3.0]]
+            assert mock_client.embed.call_args[1]["texts"] == ["ccc"]
@@ -109,16 +109,17 @@ class TestEmbedDocuments:
         google_embeddings.batch_size = 2
         texts = ["Doc 1", "Doc 2", "Doc 3", "Doc 4", "Doc 5"]
 
-        batch_embeddings = [[0.1, 0.2], [0.3, 0.4]]
+        def embed_batch(**kwargs):
+            return {"embedding": [[float(text[-1])] for text in kwargs["content"]]}
 
         with patch("google.generativeai.embed_content") as mock_embed:
-            mock_embed.return_value = {"embedding": batch_embeddings}
+            mock_embed.side_effect = embed_batch
 
             result = google_embeddings.embed_documents(texts)
 
             # Should be called 3 times (batches of 2, 2, 1)
             assert mock_embed.call_count == 3
-            assert len(result) == 6  # 2 + 2 + 2 embeddings
+            assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
 
     def test_embed_documents_empty_list(self, google_embeddings):
         """Test embedding empty list of documents."""
@@ -192,6 +193,15 @@ class TestEmbedQuery:
             with pytest.raises(ValueError):
                 google_embeddings.embed_query(query)
 
+    def test_embed_blank_query_skips_api(self, google_embeddings):
+        """Test empty and whitespace queries raise before any API call."""
+        with patch("google.generativeai.embed_content") as mock_embed:
+            for query in ["", "   "]:
+                with pytest.raises(ValueError, match="Query cannot be empty"):
+                    google_embeddings.embed_query(query)
+
+            mock_embed.assert_not_called()
+
 
 # ============================================================================
 # GET DIMENSION TESTS
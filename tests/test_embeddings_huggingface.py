@@ -9,6 +9,7 @@ Test Coverage:
 - embed_documents()
 - embed_query()
 - get_dimension()
+- Precision (fp16/bf16/int8)
 - Normalization
 - Error handling
 """
@@ -126,8 +127,12 @@ class TestEmbedDocuments:
             embeddings.embed_documents(["Test"])
 
             call_kwargs = mock_model.encode.call_args[1]
-            assert call_kwargs["convert_to_numpy"] is False
+            assert call_kwargs["convert_to_numpy"] is True
             assert call_kwargs["show_progress_bar"] is False
+            assert (
+                call_kwargs["batch_size"]
+                == mock_config.embeddings.huggingface.batch_size
+            )
 
     def test_embed_documents_empty_list(self, mock_config):
         """Test embedding empty list."""
@@ -197,7 +202,7 @@ class TestEmbedQuery:
             embeddings.embed_query("Test")
 
             call_kwargs = mock_model.encode.call_args[1]
-            assert call_kwargs["convert_to_numpy"] is False
+            assert call_kwargs["convert_to_numpy"] is True
             assert call_kwargs["show_progress_bar"] is False
 
     def test_embed_query_error_handling(self, mock_config):
@@ -250,6 +255,88 @@ class TestGetDimension:
             assert embeddings.get_dimension() == embeddings.dimension
 
 
+# ============================================================================
+# PRECISION TESTS
+# ============================================================================
+
+
+class TestPrecision:
+    """Test precision configuration."""
+
+    def test_fp32_leaves_model_unchanged(self, mock_config):
+        """Test default fp32 precision does not convert the model."""
+        with patch("sentence_transformers.SentenceTransformer") as mock_st:
+            mock_model = MagicMock()
+            mock_st.return_value = mock_model
+
+            from embeddings.implementations.huggingface import HuggingFaceEmbeddings
+
+            embeddings = HuggingFaceEmbeddings(mock_config)
+
+            assert embeddings.precision == "fp32"
+            mock_model.half.assert_not_called()
+
+    def test_fp16_on_cuda_halves_model(self, mock_config):
+        """Test fp16 precision on cuda converts weights to half."""
+        hf_config = mock_config.embeddings.huggingface
+        with (
+            patch("sentence_transformers.SentenceTransformer") as mock_st,
+            patch.object(hf_config, "precision", "fp16", create=True),
+            patch.object(hf_config, "device", "cuda", create=True),
+        ):
+            mock_model = MagicMock()
+            mock_st.return_value = mock_model
+
+            from embeddings.implementations.huggingface import HuggingFaceEmbeddings
+
+            embeddings = HuggingFaceEmbeddings(mock_config)
+
+            assert embeddings.precision == "fp16"
+            mock_model.half.assert_called_once()
+
+    def test_fp16_on_cpu_falls_back_to_fp32(self, mock_config):
+        """Test unsupported precision/device combination falls back to fp32."""
+        hf_config = mock_config.embeddings.huggingface
+        with (
+            patch("sentence_transformers.SentenceTransformer") as mock_st,
+            patch.object(hf_config, "precision", "fp16", create=True),
+            patch.object(hf_config, "device", "cpu", create=True),
+        ):
+            mock_model = MagicMock()
+            mock_st.return_value = mock_model
+
+            from embeddings.implementations.huggingface import HuggingFaceEmbeddings
+
+            embeddings = HuggingFaceEmbeddings(mock_config)
+
+            assert embeddings.precision == "fp32"
+            mock_model.half.assert_not_called()
+            # Cache key carries the effective precision, not the configured one
+            assert embeddings._cache.model.endswith("@fp32")
+
+    def test_int8_on_cpu_quantizes_model(self, mock_config):
+        """Test int8 precision on cpu applies dynamic quantization."""
+        hf_config = mock_config.embeddings.huggingface
+        with (
+            patch("sentence_transformers.SentenceTransformer") as mock_st,
+            patch("torch.quantization.quantize_dynamic") as mock_quantize,
+            patch.object(hf_config, "precision", "int8", create=True),
+            patch.object(hf_config, "device", "cpu", create=True),
+        ):
+            mock_model = MagicMock()
+            mock_model.get_sentence_embedding_dimension.return_value = 384
+            mock_st.return_value = mock_model
+
+            from embeddings.implementations.huggingface import HuggingFaceEmbeddings
+
+            embeddings = HuggingFaceEmbeddings(mock_config)
+
+            mock_quantize.assert_called_once()
+            assert embeddings.model is mock_quantize.return_value
+            assert embeddings.dimension == 384
+            assert embeddings._cache.model.endswith("@int8")
+
+
 # ============================================================================
 # INTEGRATION-LIKE TESTS (Still Mocked)
 # ============================================================================
@@ -6,17 +6,24 @@ Following industry best practices - no actual API calls.
 
 Test Coverage:
 - Initialization
-- embed_documents()
+- embed_documents() / aembed_documents()
+- Raw response decoding (orjson, base64)
+- Chunking of texts over the per-input token limit
 - embed_query()
 - get_dimension()
 - Error handling
 - SSL verification configuration
 """
 
+import asyncio
+import base64
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import orjson
 import pytest
 
+import constants
 from config import Config
 
 # ============================================================================
@@ -24,6 +31,12 @@ from config import Config
 # ============================================================================
 
 
+def raw_response(embeddings):
+    """Build a raw embeddings HTTP response carrying the given vectors."""
+    data = [{"index": i, "embedding": e} for i, e in enumerate(embeddings)]
+    return MagicMock(content=orjson.dumps({"data": data}))
+
+
 @pytest.fixture
 def mock_config():
     """Create mock configuration for OpenAI (using test.toml)."""
@@ -70,6 +83,50 @@ class TestOpenAIEmbeddingsInitialization:
             # Verify SSL settings were configured
             mock_openai_class.assert_called_once()
 
+    def test_missing_sdk_raises_import_error(self, mock_config):
+        """Test a missing openai package fails at construction, not import."""
+        with patch("embeddings.implementations.openai.openai", None):
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            with pytest.raises(ImportError, match="openai package not installed"):
+                OpenAIEmbeddings(mock_config)
+
+    def test_verified_http_client_is_shared(self, mock_config):
+        """Test providers with SSL verification reuse one HTTP client."""
+        with patch("openai.OpenAI") as mock_openai_class, patch.object(
+            mock_config.embeddings.openai, "verify_ssl", True
+        ):
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            OpenAIEmbeddings(mock_config)
+            OpenAIEmbeddings(mock_config)
+
+            first, second = mock_openai_class.call_args_list
+            assert first[1]["http_client"] is second[1]["http_client"]
+
+    def test_unverified_http_client_is_shared(self, mock_config):
+        """Test providers with SSL verification disabled share a client too."""
+        with patch("openai.OpenAI") as mock_openai_class, patch.object(
+            mock_config.embeddings.openai, "verify_ssl", False
+        ):
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            OpenAIEmbeddings(mock_config)
+            OpenAIEmbeddings(mock_config)
+
+            first, second = mock_openai_class.call_args_list
+            assert first[1]["http_client"] is second[1]["http_client"]
+
+    def test_batch_executor_is_shared(self, mock_config):
+        """Test provider instances dispatch batches on one shared executor."""
+        with patch("openai.OpenAI"):
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            first = OpenAIEmbeddings(mock_config)
+            second = OpenAIEmbeddings(mock_config)
+
+            assert first._executor is second._executor
+
 
 # ============================================================================
 # EMBED DOCUMENTS TESTS
@@ -84,10 +141,10 @@ class TestEmbedDocuments:
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
 
-            mock_response = MagicMock()
-            mock_response.data = [MagicMock(embedding=[0.1, 0.2, 0.3])]
-            mock_client.embeddings.create.return_value = mock_response
+            mock_response = raw_response([[0.1, 0.2, 0.3]])
+            mock_create.return_value = mock_response
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
@@ -97,20 +154,139 @@ class TestEmbedDocuments:
 
             assert len(result) == 1
             assert result[0] == [0.1, 0.2, 0.3]
-            mock_client.embeddings.create.assert_called_once()
+            mock_create.assert_called_once()
+
+    def test_embed_blank_documents_raise_by_default(self, mock_config):
+        """Test blank documents are rejected unless zero vectors are enabled."""
+        with patch("openai.OpenAI") as mock_openai_class:
+            mock_client = MagicMock()
+            mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+
+            with pytest.raises(ValueError):
+                embeddings.embed_documents(["Hello", "  "])
+
+            mock_create.assert_not_called()
+
+    def test_embed_blank_documents_zero_filled(self, mock_config):
+        """Test blank_texts = zero fills blanks at the configured dimensions."""
+        mock_config.embeddings.blank_texts = constants.EMBEDDINGS_BLANK_TEXTS_ZERO
+        mock_config.embeddings.openai.dimensions = 3
+
+        with patch("openai.OpenAI") as mock_openai_class:
+            mock_client = MagicMock()
+            mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
+            mock_create.return_value = raw_response([[0.1, 0.2, 0.3]])
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+
+            result = embeddings.embed_documents(["Hello", "  "])
+
+            assert result == [[0.1, 0.2, 0.3], [0.0, 0.0, 0.0]]
+
+    def test_embed_documents_orders_by_index(self, mock_config):
+        """Test response items are matched to inputs by their index."""
+        with patch("openai.OpenAI") as mock_openai_class:
+            mock_client = MagicMock()
+            mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
+
+            data = [{"index": 1, "embedding": [2.0]}, {"index": 0, "embedding": [1.0]}]
+            mock_create.return_value = MagicMock(content=orjson.dumps({"data": data}))
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+
+            assert embeddings.embed_documents(["aa", "bb"]) == [[1.0], [2.0]]
+
+    def test_embed_documents_decodes_base64(self, mock_config):
+        """Test base64 float32 payloads are requested and decoded."""
+        with patch("openai.OpenAI") as mock_openai_class:
+            mock_client = MagicMock()
+            mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
+
+            def encode(values):
+                return base64.b64encode(
+                    np.array(values, dtype=np.float32).tobytes()
+                ).decode()
+
+            mock_response = raw_response([encode([0.5, 0.25]), encode([1.0, 2.0])])
+            mock_create.return_value = mock_response
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+
+            result = embeddings.embed_documents(["a", "b"])
+
+            assert result == [[0.5, 0.25], [1.0, 2.0]]
+            assert all(type(vector) is list for vector in result)
+            call_kwargs = mock_create.call_args[1]
+            assert call_kwargs["encoding_format"] == "base64"
+
+    def test_aembed_documents_uses_async_client(self, mock_config):
+        """Test aembed_documents awaits batches on the AsyncOpenAI client."""
+        with patch("openai.OpenAI") as mock_openai_class, patch(
+            "openai.AsyncOpenAI"
+        ) as mock_async_class:
+            mock_async_client = MagicMock()
+            mock_async_class.return_value = mock_async_client
+
+            async def create(model, input, dimensions, encoding_format):
+                return raw_response([[float(len(t))] for t in input])
+
+            mock_async_client.embeddings.with_raw_response.create.side_effect = create
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+
+            result = asyncio.run(embeddings.aembed_documents(["aaa", "b"]))
+
+            assert result == [[3.0], [1.0]]
+            sync_client = mock_openai_class.return_value
+            sync_client.embeddings.with_raw_response.create.assert_not_called()
+
+    def test_async_client_opened_lazily_and_closed(self, mock_config):
+        """Test the AsyncOpenAI client opens on first use and aclose frees it."""
+        with patch("openai.OpenAI"), patch("openai.AsyncOpenAI") as mock_async_class:
+            mock_async_client = MagicMock()
+            mock_async_class.return_value = mock_async_client
+
+            async def close():
+                mock_async_client.closed = True
+
+            mock_async_client.close.side_effect = close
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+            mock_async_class.assert_not_called()
+
+            assert embeddings.aclient is mock_async_client
+            asyncio.run(embeddings.aclose())
+
+            assert mock_async_client.closed is True
+            assert "aclient" not in embeddings.__dict__
 
     def test_embed_multiple_documents(self, mock_config):
         """Test embedding multiple documents."""
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
 
-            mock_response = MagicMock()
-            mock_response.data = [
-                MagicMock(embedding=[0.1, 0.2, 0.3]),
-                MagicMock(embedding=[0.4, 0.5, 0.6]),
-            ]
-            mock_client.embeddings.create.return_value = mock_response
+            mock_response = raw_response([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+            mock_create.return_value = mock_response
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
@@ -127,17 +303,17 @@ class TestEmbedDocuments:
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
 
-            mock_response = MagicMock()
-            mock_response.data = [MagicMock(embedding=[0.1])]
-            mock_client.embeddings.create.return_value = mock_response
+            mock_response = raw_response([[0.1]])
+            mock_create.return_value = mock_response
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
             embeddings = OpenAIEmbeddings(mock_config)
             embeddings.embed_documents(["Test"])
 
-            call_kwargs = mock_client.embeddings.create.call_args[1]
+            call_kwargs = mock_create.call_args[1]
             assert call_kwargs["model"] == mock_config.embeddings.openai.model
 
     def test_embed_documents_empty_list(self, mock_config):
@@ -145,10 +321,10 @@ class TestEmbedDocuments:
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
 
-            mock_response = MagicMock()
-            mock_response.data = []
-            mock_client.embeddings.create.return_value = mock_response
+            mock_response = raw_response([])
+            mock_create.return_value = mock_response
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
@@ -163,7 +339,8 @@ class TestEmbedDocuments:
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
-            mock_client.embeddings.create.side_effect = Exception("API Error")
+            mock_create = mock_client.embeddings.with_raw_response.create
+            mock_create.side_effect = Exception("API Error")
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
@@ -174,6 +351,45 @@ class TestEmbedDocuments:
 
             assert "API Error" in str(exc_info.value)
 
+    def test_long_text_is_chunked_and_averaged(self, mock_config):
+        """Test texts over max_input_tokens are split and their chunks averaged."""
+        with patch("openai.OpenAI") as mock_openai_class, patch.object(
+            mock_config.embeddings.openai, "max_input_tokens", 9
+        ):
+            mock_client = MagicMock()
+            mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
+
+            def create(model, input, dimensions, encoding_format):
+                return raw_response(
+                    [[1.0, 0.0] if text[0] == "a" else [0.0, 1.0] for text in input]
+                )
+
+            mock_create.side_effect = create
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+
+            # Estimated at 17 tokens, the long text is split into 6-char chunks
+            result = embeddings.embed_documents(["a" * 24 + "b" * 24, "short"])
+
+            sent = mock_create.call_args[1]["input"]
+            assert sent == ["short"] + ["a" * 6] * 4 + ["b" * 6] * 4
+            assert result[0] == pytest.approx([0.5**0.5, 0.5**0.5])
+            assert result[1] == [0.0, 1.0]
+
+    def test_batch_size_capped_at_api_limit(self, mock_config):
+        """Test batch_size never exceeds the API's inputs-per-request cap."""
+        with patch("openai.OpenAI"), patch.object(
+            mock_config.embeddings.openai, "batch_size", 10000
+        ):
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+
+            assert embeddings.batch_size == constants.OPENAI_MAX_BATCH_INPUTS
+
 
 # ============================================================================
 # EMBED QUERY TESTS
@@ -188,10 +404,10 @@ class TestEmbedQuery:
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
 
-            mock_response = MagicMock()
-            mock_response.data = [MagicMock(embedding=[0.7, 0.8, 0.9])]
-            mock_client.embeddings.create.return_value = mock_response
+            mock_response = raw_response([[0.7, 0.8, 0.9]])
+            mock_create.return_value = mock_response
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
@@ -200,32 +416,50 @@ class TestEmbedQuery:
             result = embeddings.embed_query("What is AI?")
 
             assert result == [0.7, 0.8, 0.9]
-            mock_client.embeddings.create.assert_called_once()
+            mock_create.assert_called_once()
 
     def test_embed_query_uses_correct_model(self, mock_config):
         """Test query uses correct model."""
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
 
-            mock_response = MagicMock()
-            mock_response.data = [MagicMock(embedding=[0.1])]
-            mock_client.embeddings.create.return_value = mock_response
+            mock_response = raw_response([[0.1]])
+            mock_create.return_value = mock_response
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
             embeddings = OpenAIEmbeddings(mock_config)
             embeddings.embed_query("Query")
 
-            call_kwargs = mock_client.embeddings.create.call_args[1]
+            call_kwargs = mock_create.call_args[1]
             assert call_kwargs["model"] == mock_config.embeddings.openai.model
 
+    def test_embed_query_omits_unset_dimensions(self, mock_config, monkeypatch):
+        """Test dimensions is only sent when configured."""
+        monkeypatch.setattr(mock_config.embeddings.openai, "dimensions", 0)
+
+        with patch("openai.OpenAI") as mock_openai_class:
+            mock_client = MagicMock()
+            mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
+            mock_create.return_value = raw_response([[0.1]])
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+            embeddings.embed_query("Query")
+
+            assert "dimensions" not in mock_create.call_args[1]
+
     def test_embed_query_error_handling(self, mock_config):
         """Test error handling in embed_query."""
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
-            mock_client.embeddings.create.side_effect = ValueError("Invalid query")
+            mock_create = mock_client.embeddings.with_raw_response.create
+            mock_create.side_effect = ValueError("Invalid query")
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
@@ -234,6 +468,23 @@ class TestEmbedQuery:
             with pytest.raises(ValueError):
                 embeddings.embed_query("Test")
 
+    def test_embed_blank_query_skips_api(self, mock_config):
+        """Test empty and whitespace queries raise before any API call."""
+        with patch("openai.OpenAI") as mock_openai_class:
+            mock_client = MagicMock()
+            mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
+
+            from embeddings.implementations.openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(mock_config)
+
+            for query in ["", "   "]:
+                with pytest.raises(ValueError, match="Query cannot be empty"):
+                    embeddings.embed_query(query)
+
+            mock_create.assert_not_called()
+
 
 # ============================================================================
 # GET DIMENSION TESTS
@@ -279,18 +530,14 @@ class TestIntegration:
         with patch("openai.OpenAI") as mock_openai_class:
             mock_client = MagicMock()
             mock_openai_class.return_value = mock_client
+            mock_create = mock_client.embeddings.with_raw_response.create
 
             # Mock responses
-            doc_response = MagicMock()
-            doc_response.data = [
-                MagicMock(embedding=[0.1, 0.2]),
-                MagicMock(embedding=[0.3, 0.4]),
-            ]
+            doc_response = raw_response([[0.1, 0.2], [0.3, 0.4]])
 
-            query_response = MagicMock()
-            query_response.data = [MagicMock(embedding=[0.5, 0.6])]
+            query_response = raw_response([[0.5, 0.6]])
 
-            mock_client.embeddings.create.side_effect = [doc_response, query_response]
+            mock_create.side_effect = [doc_response, query_response]
 
             from embeddings.implementations.openai import OpenAIEmbeddings
 
@@ -304,4 +551,4 @@ class TestIntegration:
             query_result = embeddings.embed_query("Query")
             assert len(query_result) == 2
 
-            assert mock_client.embeddings.create.call_count == 2
+            assert mock_create.call_count == 2
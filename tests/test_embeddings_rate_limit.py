@@ -0,0 +1,118 @@
+"""
+Tests for preemptive embeddings rate limiting.
+
+Test Coverage:
+- Disabled limiter never waits
+- Requests-per-minute and tokens-per-minute limits delay calls
+- Oversized requests pass once the window is empty
+- Window expiry frees capacity
+- Async acquire waits without blocking
+"""
+
+import asyncio
+
+import pytest
+
+from embeddings import rate_limit
+from embeddings.rate_limit import RateLimiter
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace monotonic time and sleeps with a manually advanced clock."""
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    async def async_sleep(seconds):
+        sleep(seconds)
+
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rate_limit.time, "sleep", sleep)
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", async_sleep)
+    return now, sleeps
+
+
+# ============================================================================
+# RATE LIMITER TESTS
+# ============================================================================
+
+
+class TestRateLimiter:
+    """Test RateLimiter sliding window."""
+
+    def test_disabled_never_waits(self, clock):
+        """Test a limiter with no limits lets every call through."""
+        _, sleeps = clock
+        limiter = RateLimiter(0, 0)
+
+        for _ in range(100):
+            limiter.acquire(10_000)
+
+        assert not limiter.enabled
+        assert sleeps == []
+
+    def test_requests_per_minute(self, clock):
+        """Test the call over the request limit waits for the window."""
+        now, sleeps = clock
+        limiter = RateLimiter(2, 0)
+
+        limiter.acquire(1)
+        now[0] += 10
+        limiter.acquire(1)
+        limiter.acquire(1)
+
+        # Waits until the first call is 60 seconds old
+        assert sleeps == [50.0]
+
+    def test_tokens_per_minute(self, clock):
+        """Test a call that would exceed the token limit waits."""
+        _, sleeps = clock
+        limiter = RateLimiter(0, 100)
+
+        limiter.acquire(60)
+        limiter.acquire(30)
+        assert sleeps == []
+
+        limiter.acquire(20)
+        assert sleeps == [60.0]
+
+    def test_oversized_request_passes_when_idle(self, clock):
+        """Test a call larger than the token limit is not blocked forever."""
+        _, sleeps = clock
+        limiter = RateLimiter(0, 100)
+
+        limiter.acquire(500)
+
+        assert sleeps == []
+
+    def test_window_expiry_frees_capacity(self, clock):
+        """Test calls older than a minute no longer count."""
+        now, sleeps = clock
+        limiter = RateLimiter(1, 0)
+
+        limiter.acquire(1)
+        now[0] += 61
+        limiter.acquire(1)
+
+        assert sleeps == []
+
+    def test_async_acquire(self, clock):
+        """Test aacquire applies the same limits on the event loop."""
+        _, sleeps = clock
+        limiter = RateLimiter(1, 0)
+
+        async def acquire_twice():
+            await limiter.aacquire(1)
+            await limiter.aacquire(1)
+
+        asyncio.run(acquire_twice())
+
+        assert sleeps == [60.0]
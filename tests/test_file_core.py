@@ -6,7 +6,7 @@ Tests file service operations with proper database mocking.
 
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock, call, patch
 
 import pytest
 from sqlalchemy.exc import IntegrityError
@@ -394,6 +394,62 @@ class TestFileServiceIndexing:
             mock_read_session, limit=5
         )
 
+    def test_iter_unindexed_files_pages_by_id(
+        self, file_service, mock_session_factory, mock_repository
+    ):
+        """Test unindexed files are streamed page by page after the last ID."""
+        _, mock_read_session, _ = mock_session_factory
+
+        def make_file(file_id):
+            file = Mock()
+            file.to_dict.return_value = {"id": file_id}
+            return file
+
+        mock_repository.find_unindexed_files_after.side_effect = [
+            [make_file("a"), make_file("b")],
+            [make_file("c")],
+        ]
+
+        result = list(file_service.iter_unindexed_files(page_size=2))
+
+        assert [f["id"] for f in result] == ["a", "b", "c"]
+        assert mock_repository.find_unindexed_files_after.call_args_list == [
+            call(mock_read_session, after_id=None, limit=2),
+            call(mock_read_session, after_id="b", limit=2),
+        ]
+
+    def test_mark_many_as_indexed(
+        self, file_service, mock_session_factory, mock_repository
+    ):
+        """Test marking several files uses one write session."""
+        _, _, mock_write_session = mock_session_factory
+        mock_repository.mark_many_as_indexed.return_value = 2
+
+        result = file_service.mark_many_as_indexed(["a", "b"])
+
+        assert result == 2
+        mock_repository.mark_many_as_indexed.assert_called_once_with(
+            mock_write_session, ["a", "b"]
+        )
+
+    def test_mark_many_as_indexed_empty(self, file_service, mock_repository):
+        """Test an empty ID list skips the database."""
+        assert file_service.mark_many_as_indexed([]) == 0
+        mock_repository.mark_many_as_indexed.assert_not_called()
+
+    def test_count_unindexed_files(self, file_service, mock_repository):
+        """Test counting unindexed files."""
+        mock_repository.count_unindexed_files.return_value = 3
+
+        assert file_service.count_unindexed_files() == 3
+
+    def test_iter_unindexed_files_empty(self, file_service, mock_repository):
+        """Test no unindexed files yields nothing after one query."""
+        mock_repository.find_unindexed_files_after.return_value = []
+
+        assert list(file_service.iter_unindexed_files()) == []
+        mock_repository.find_unindexed_files_after.assert_called_once()
+
     def test_get_indexed_files(self, file_service, mock_repository, sample_file):
         """Test getting indexed files."""
         sample_file.indexed = True
@@ -169,6 +169,57 @@ class TestFileRepositoryIndexingQueries:
             assert len(result) == 1
             repository.find_by_fields.assert_called_once()
 
+    def test_find_unindexed_files_after_first_page(
+        self, repository, mock_session, sample_file
+    ):
+        """Test first page of unindexed files has no ID bound."""
+        query = mock_session.query.return_value
+        query.filter.return_value = query
+        query.order_by.return_value = query
+        query.limit.return_value = query
+        query.all.return_value = [sample_file]
+
+        result = repository.find_unindexed_files_after(
+            mock_session, after_id=None, limit=10
+        )
+
+        assert result == [sample_file]
+        query.filter.assert_called_once()
+        query.limit.assert_called_once_with(10)
+
+    def test_find_unindexed_files_after_id(self, repository, mock_session):
+        """Test later pages filter on IDs after the previous page."""
+        query = mock_session.query.return_value
+        query.filter.return_value = query
+        query.order_by.return_value = query
+        query.limit.return_value = query
+        query.all.return_value = []
+
+        repository.find_unindexed_files_after(mock_session, after_id="file-5", limit=10)
+
+        assert query.filter.call_count == 2
+
+    def test_find_unindexed_files_after_error(self, repository, mock_session):
+        """Test query failure raises DatabaseQueryError."""
+        mock_session.query.side_effect = Exception("DB error")
+
+        with pytest.raises(DatabaseQueryError):
+            repository.find_unindexed_files_after(mock_session, after_id=None, limit=10)
+
+    def test_count_unindexed_files(self, repository, mock_session):
+        """Test counting unindexed files."""
+        query = mock_session.query.return_value
+        query.filter.return_value.scalar.return_value = 7
+
+        assert repository.count_unindexed_files(mock_session) == 7
+
+    def test_count_unindexed_files_error(self, repository, mock_session):
+        """Test count failure raises DatabaseQueryError."""
+        mock_session.query.side_effect = Exception("DB error")
+
+        with pytest.raises(DatabaseQueryError):
+            repository.count_unindexed_files(mock_session)
+
     def test_find_indexed_files_no_limit(self, repository, mock_session, sample_file):
         """Test finding indexed files without limit."""
         sample_file.indexed = True
@@ -226,6 +277,34 @@ class TestFileRepositoryMarkAsIndexed:
 
             assert "Database error" in str(exc_info.value.original_error)
 
+    def test_mark_many_as_indexed_single_update(self, repository, mock_session):
+        """Test several files are marked with one UPDATE."""
+        query = mock_session.query.return_value
+        query.filter.return_value.update.return_value = 3
+
+        result = repository.mark_many_as_indexed(mock_session, ["a", "b", "c"])
+
+        assert result == 3
+        query.filter.return_value.update.assert_called_once()
+
+    def test_mark_many_as_indexed_chunks_ids(self, repository, mock_session):
+        """Test large ID lists are split to stay under bind limits."""
+        query = mock_session.query.return_value
+        query.filter.return_value.update.return_value = 1
+
+        with patch("constants.FILE_MARK_INDEXED_CHUNK_SIZE", 2):
+            result = repository.mark_many_as_indexed(mock_session, ["a", "b", "c"])
+
+        assert result == 2
+        assert query.filter.return_value.update.call_count == 2
+
+    def test_mark_many_as_indexed_error(self, repository, mock_session):
+        """Test update failure raises DatabaseQueryError."""
+        mock_session.query.side_effect = SQLAlchemyError("Database error")
+
+        with pytest.raises(DatabaseQueryError):
+            repository.mark_many_as_indexed(mock_session, ["a"])
+
 
 class TestFileRepositoryTotalSize:
     """Test get_total_size operation."""
@@ -223,6 +223,19 @@ class TestLLMHealthCheck:
 
             assert result is False
 
+    def test_test_llm_api_reuses_llm(self, health_service):
+        """Test repeated LLM checks create the LLM client once."""
+        with patch("llm.factory.create_llm") as mock_create:
+            mock_llm = Mock()
+            mock_llm.invoke.return_value = Mock(content="Test response")
+            mock_create.return_value = mock_llm
+
+            assert health_service._test_llm_api() is True
+            assert health_service._test_llm_api() is True
+
+            mock_create.assert_called_once()
+            assert mock_llm.invoke.call_count == 2
+
 
 class TestEmbeddingsHealthCheck:
     """Test embeddings health checks with caching."""
@@ -297,6 +310,19 @@ class TestEmbeddingsHealthCheck:
 
             assert result is False
 
+    def test_test_embeddings_api_reuses_embeddings(self, health_service):
+        """Test repeated embeddings checks create the provider once."""
+        with patch("embeddings.factory.create_embeddings") as mock_create:
+            mock_embeddings = Mock()
+            mock_embeddings.embed_query.return_value = [0.1, 0.2, 0.3]
+            mock_create.return_value = mock_embeddings
+
+            assert health_service._test_embeddings_api() is True
+            assert health_service._test_embeddings_api() is True
+
+            mock_create.assert_called_once()
+            assert mock_embeddings.embed_query.call_count == 2
+
 
 class TestOverallHealthStatus:
     """Test overall health status determination."""
@@ -5,13 +5,21 @@ Tests document ingestion business logic with database-driven processing.
 """
 
 import argparse
+import asyncio
 from pathlib import Path
-from unittest.mock import Mock, patch
+from trace import codes
+from typing import Iterator
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from langchain_core.documents import Document
 
+import constants
+from embeddings.base import EmbeddingsProtocol
 from ingestion.ingest import (
+    _init_worker,
     ingest_documents,
+    iter_files,
     main,
     parse_arguments,
     print_summary,
@@ -41,6 +49,22 @@ class TestParseArguments:
 
             assert args.clear is True
 
+    def test_parse_arguments_workers(self):
+        """Test --workers sets the load/split process count."""
+        with patch("sys.argv", ["ingest.py", "--workers", "3"]):
+            args = parse_arguments()
+
+            assert args.workers == 3
+
+    def test_parse_arguments_default_workers(self):
+        """Test default workers is half the cores, at least one."""
+        with patch("sys.argv", ["ingest.py"]), patch(
+            "ingestion.ingest.os.cpu_count", return_value=1
+        ):
+            args = parse_arguments()
+
+            assert args.workers == 1
+
 
 # ============================================================================
 # Test scan_directory
@@ -110,6 +134,44 @@ class TestScanDirectory:
             assert len(files) == 1
             assert files[0].name == "doc.txt"
 
+    def test_scan_directory_matches_extension_case_insensitively(self, tmp_path):
+        """Test upper-case suffixes match supported extensions."""
+        (tmp_path / "REPORT.PDF").touch()
+        (tmp_path / "notes.Txt").touch()
+
+        with patch("loader.factory.LoaderFactory.get_supported_extensions") as mock_ext:
+            mock_ext.return_value = [".txt", ".pdf"]
+
+            files = scan_directory(tmp_path)
+
+            assert [f.name for f in files] == ["REPORT.PDF", "notes.Txt"]
+
+    def test_iter_files_is_lazy(self, tmp_path):
+        """Test iter_files yields paths without building a list first."""
+        (tmp_path / "a.txt").touch()
+        (tmp_path / "b.txt").touch()
+
+        with patch("loader.factory.LoaderFactory.get_supported_extensions") as mock_ext:
+            mock_ext.return_value = [".txt"]
+
+            files = iter_files(tmp_path)
+
+            assert isinstance(files, Iterator)
+            assert sorted(files) == [tmp_path / "a.txt", tmp_path / "b.txt"]
+
+    def test_scan_directory_skips_subdirectories(self, tmp_path):
+        """Test directories are not returned even with a matching suffix."""
+        (tmp_path / "archive.txt").mkdir()
+        (tmp_path / "archive.txt" / "nested.txt").touch()
+        (tmp_path / "doc.txt").touch()
+
+        with patch("loader.factory.LoaderFactory.get_supported_extensions") as mock_ext:
+            mock_ext.return_value = [".txt"]
+
+            files = scan_directory(tmp_path)
+
+            assert files == [tmp_path / "doc.txt"]
+
 
 # ============================================================================
 # Test process_file
@@ -133,12 +195,10 @@ class TestProcessFile:
         mock_chunk = Mock()
         mock_splitter.split_documents.return_value = [mock_chunk, mock_chunk]
 
-        success, chunk_count, error_msg = process_file(
-            file_path, mock_loader, mock_splitter
-        )
+        success, chunks, error_msg = process_file(file_path, mock_loader, mock_splitter)
 
         assert success is True
-        assert chunk_count == 2
+        assert chunks == [mock_chunk, mock_chunk]
         assert error_msg == ""
 
         mock_loader.load_document.assert_called_once_with(file_path)
@@ -152,14 +212,41 @@ class TestProcessFile:
 
         mock_loader.load_document.return_value = []
 
-        success, chunk_count, error_msg = process_file(
-            file_path, mock_loader, mock_splitter
-        )
+        success, chunks, error_msg = process_file(file_path, mock_loader, mock_splitter)
 
         assert success is False
-        assert chunk_count == 0
+        assert chunks == []
         assert "No documents loaded" in error_msg
 
+    def test_process_file_tags_documents_before_splitting(self):
+        """Test extra metadata is set on loaded documents, not on chunks."""
+        file_path = Path("test.pdf")
+        mock_loader = Mock()
+        mock_splitter = Mock()
+
+        documents = [
+            Document(page_content="page 1", metadata={"page": 1}),
+            Document(page_content="page 2", metadata={"page": 2}),
+        ]
+        mock_loader.load_document.return_value = documents
+        mock_splitter.split_documents.side_effect = lambda docs: [
+            Document(page_content=doc.page_content, metadata=dict(doc.metadata))
+            for doc in docs
+        ]
+
+        success, chunks, _ = process_file(
+            file_path,
+            mock_loader,
+            mock_splitter,
+            metadata={"file_id": "file-1", "filename": "test.pdf"},
+        )
+
+        assert success is True
+        assert [chunk.metadata for chunk in chunks] == [
+            {"page": 1, "file_id": "file-1", "filename": "test.pdf"},
+            {"page": 2, "file_id": "file-1", "filename": "test.pdf"},
+        ]
+
     def test_process_file_no_chunks_created(self):
         """Test when no chunks are created."""
         file_path = Path("test.pdf")
@@ -170,12 +257,10 @@ class TestProcessFile:
         mock_loader.load_document.return_value = [mock_doc]
         mock_splitter.split_documents.return_value = []
 
-        success, chunk_count, error_msg = process_file(
-            file_path, mock_loader, mock_splitter
-        )
+        success, chunks, error_msg = process_file(file_path, mock_loader, mock_splitter)
 
         assert success is False
-        assert chunk_count == 0
+        assert chunks == []
         assert "No chunks created" in error_msg
 
     def test_process_file_loader_exception(self):
@@ -186,12 +271,10 @@ class TestProcessFile:
 
         mock_loader.load_document.side_effect = Exception("Load error")
 
-        success, chunk_count, error_msg = process_file(
-            file_path, mock_loader, mock_splitter
-        )
+        success, chunks, error_msg = process_file(file_path, mock_loader, mock_splitter)
 
         assert success is False
-        assert chunk_count == 0
+        assert chunks == []
         assert "Load error" in error_msg
 
     def test_process_file_splitter_exception(self):
@@ -204,12 +287,10 @@ class TestProcessFile:
         mock_loader.load_document.return_value = [mock_doc]
         mock_splitter.split_documents.side_effect = Exception("Split error")
 
-        success, chunk_count, error_msg = process_file(
-            file_path, mock_loader, mock_splitter
-        )
+        success, chunks, error_msg = process_file(file_path, mock_loader, mock_splitter)
 
         assert success is False
-        assert chunk_count == 0
+        assert chunks == []
         assert "Split error" in error_msg
 
 
@@ -226,13 +307,21 @@ class TestIngestDocuments:
         """Mock configuration."""
         config = Mock()
         config.vectorstore = Mock()
+        config.vectorstore.ingest_batch_size = 256
+        config.vectorstore.ingest_flush_chunks = 4096
+        config.vectorstore.ingest_upload_concurrency = 2
         config.embeddings = Mock()
         return config
 
     @pytest.fixture
     def mock_file_service(self):
-        """Mock file service."""
-        return Mock()
+        """Mock file service counting the records it streams."""
+        file_service = Mock()
+        file_service.iter_unindexed_files.return_value = []
+        file_service.count_unindexed_files.side_effect = lambda: len(
+            file_service.iter_unindexed_files.return_value
+        )
+        return file_service
 
     @pytest.fixture
     def mock_vectorstore(self):
@@ -245,8 +334,10 @@ class TestIngestDocuments:
 
     @pytest.fixture
     def mock_embeddings(self):
-        """Mock embeddings."""
-        return Mock()
+        """Mock embeddings without an async API."""
+        embeddings = Mock(spec=EmbeddingsProtocol)
+        embeddings.embed_documents.side_effect = lambda texts: [[0.5] for _ in texts]
+        return embeddings
 
     @pytest.fixture
     def mock_loader(self):
@@ -263,7 +354,7 @@ class TestIngestDocuments:
     def test_ingest_no_unindexed_files(self, mock_config, mock_file_service):
         """Test ingestion with no unindexed files."""
         with patch("ingestion.ingest.FileService", return_value=mock_file_service):
-            mock_file_service.get_unindexed_files.return_value = []
+            mock_file_service.iter_unindexed_files.return_value = []
 
             successful, failed, skipped, total_chunks = ingest_documents(mock_config)
 
@@ -288,7 +379,7 @@ class TestIngestDocuments:
         test_file.write_text("test content")
 
         # Mock file service
-        mock_file_service.get_unindexed_files.return_value = [
+        mock_file_service.iter_unindexed_files.return_value = [
             {"id": "file-123", "filename": "test.txt", "file_path": str(test_file)}
         ]
 
@@ -297,12 +388,13 @@ class TestIngestDocuments:
         mock_doc.page_content = "test content"
         mock_doc.metadata = {}
 
-        mock_chunk = Mock()
-        mock_chunk.page_content = "test content"
-        mock_chunk.metadata = {}
-
         mock_loader.load_document.return_value = [mock_doc]
-        mock_splitter.split_documents.return_value = [mock_chunk]
+
+        # Like the real splitters, chunks inherit their document's metadata
+        mock_splitter.split_documents.side_effect = lambda documents: [
+            Document(page_content="test content", metadata=dict(doc.metadata))
+            for doc in documents
+        ]
 
         with patch(
             "ingestion.ingest.FileService", return_value=mock_file_service
@@ -325,12 +417,20 @@ class TestIngestDocuments:
             assert skipped == 0
             assert total_chunks == 1
 
+            # Verify the file was loaded and split only once
+            mock_loader.load_document.assert_called_once_with(test_file)
+            mock_splitter.split_documents.assert_called_once_with([mock_doc])
+
             # Verify vectorstore operations
             mock_vectorstore.initialize.assert_called_once()
             mock_vectorstore.add_documents.assert_called_once()
+            texts, metadatas, _ = mock_vectorstore.add_documents.call_args[0]
+            assert texts == ["test content"]
+            assert metadatas == [{"file_id": "file-123", "filename": "test.txt"}]
+            assert mock_vectorstore.add_documents.call_args[1]["embeddings"] == [[0.5]]
 
             # Verify file marked as indexed
-            mock_file_service.mark_as_indexed.assert_called_once_with("file-123")
+            mock_file_service.mark_many_as_indexed.assert_called_once_with(["file-123"])
 
     def test_ingest_with_clear_first(
         self,
@@ -347,7 +447,7 @@ class TestIngestDocuments:
         test_file = tmp_path / "test.txt"
         test_file.write_text("test")
 
-        mock_file_service.get_unindexed_files.return_value = [
+        mock_file_service.iter_unindexed_files.return_value = [
             {"id": "file-123", "filename": "test.txt", "file_path": str(test_file)}
         ]
 
@@ -384,7 +484,7 @@ class TestIngestDocuments:
         self, mock_config, mock_file_service, mock_vectorstore, mock_embeddings
     ):
         """Test file not found is skipped."""
-        mock_file_service.get_unindexed_files.return_value = [
+        mock_file_service.iter_unindexed_files.return_value = [
             {
                 "id": "file-123",
                 "filename": "missing.txt",
@@ -419,7 +519,7 @@ class TestIngestDocuments:
         test_file = tmp_path / "test.exe"
         test_file.touch()
 
-        mock_file_service.get_unindexed_files.return_value = [
+        mock_file_service.iter_unindexed_files.return_value = [
             {"id": "file-123", "filename": "test.exe", "file_path": str(test_file)}
         ]
 
@@ -454,7 +554,7 @@ class TestIngestDocuments:
         test_file = tmp_path / "test.txt"
         test_file.write_text("test")
 
-        mock_file_service.get_unindexed_files.return_value = [
+        mock_file_service.iter_unindexed_files.return_value = [
             {"id": "file-123", "filename": "test.txt", "file_path": str(test_file)}
         ]
 
@@ -499,7 +599,7 @@ class TestIngestDocuments:
         file1.write_text("content 1")
         file2.write_text("content 2")
 
-        mock_file_service.get_unindexed_files.return_value = [
+        mock_file_service.iter_unindexed_files.return_value = [
             {"id": "file-1", "filename": "file1.txt", "file_path": str(file1)},
             {"id": "file-2", "filename": "file2.txt", "file_path": str(file2)},
         ]
@@ -537,8 +637,10 @@ class TestIngestDocuments:
             assert skipped == 0
             assert total_chunks == 2
 
-            # Verify both files marked as indexed
-            assert mock_file_service.mark_as_indexed.call_count == 2
+            # Verify both files marked as indexed in one call
+            mock_file_service.mark_many_as_indexed.assert_called_once_with(
+                ["file-1", "file-2"]
+            )
 
     def test_ingest_mark_as_indexed_failure(
         self,
@@ -550,16 +652,16 @@ class TestIngestDocuments:
         mock_splitter,
         tmp_path,
     ):
-        """Test that mark_as_indexed failure is logged but doesn't stop ingestion."""
+        """Test that a marking failure is logged but doesn't stop ingestion."""
         test_file = tmp_path / "test.txt"
         test_file.write_text("test")
 
-        mock_file_service.get_unindexed_files.return_value = [
+        mock_file_service.iter_unindexed_files.return_value = [
             {"id": "file-123", "filename": "test.txt", "file_path": str(test_file)}
         ]
 
-        # Mock mark_as_indexed to fail
-        mock_file_service.mark_as_indexed.side_effect = Exception("DB error")
+        # Mock the batched update to fail
+        mock_file_service.mark_many_as_indexed.side_effect = Exception("DB error")
 
         mock_doc = Mock()
         mock_doc.page_content = "content"
@@ -592,6 +694,472 @@ class TestIngestDocuments:
             assert successful == 1
             assert total_chunks == 1
 
+    def test_ingest_stores_in_batches(
+        self,
+        mock_config,
+        mock_file_service,
+        mock_vectorstore,
+        mock_embeddings,
+        mock_loader,
+        mock_splitter,
+        tmp_path,
+    ):
+        """Test chunks are stored ingest_batch_size per add_documents call."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("test")
+        mock_file_service.iter_unindexed_files.return_value = [
+            {"id": "file-123", "filename": "test.txt", "file_path": str(test_file)}
+        ]
+        mock_config.vectorstore.ingest_batch_size = 2
+
+        mock_loader.load_document.return_value = [Document(page_content="doc")]
+        mock_splitter.split_documents.return_value = [
+            Document(page_content=f"chunk {i}") for i in range(5)
+        ]
+
+        with patch(
+            "ingestion.ingest.FileService", return_value=mock_file_service
+        ), patch(
+            "ingestion.ingest.create_embeddings", return_value=mock_embeddings
+        ), patch(
+            "ingestion.ingest.create_vectorstore", return_value=mock_vectorstore
+        ), patch(
+            "ingestion.ingest.DocumentLoader", return_value=mock_loader
+        ), patch(
+            "ingestion.ingest.DocumentSplitter", return_value=mock_splitter
+        ), patch(
+            "ingestion.ingest.LoaderFactory.is_supported", return_value=True
+        ):
+
+            ingest_documents(mock_config)
+
+            # Batches run concurrently, so they may be stored in any order
+            batches = sorted(
+                call.args[0] for call in mock_vectorstore.add_documents.call_args_list
+            )
+            assert batches == [
+                ["chunk 0", "chunk 1"],
+                ["chunk 2", "chunk 3"],
+                ["chunk 4"],
+            ]
+            mock_file_service.mark_many_as_indexed.assert_called_once_with(["file-123"])
+
+    def test_ingest_upload_concurrency(
+        self,
+        mock_config,
+        mock_file_service,
+        mock_vectorstore,
+        mock_embeddings,
+        mock_loader,
+        mock_splitter,
+        tmp_path,
+    ):
+        """Test storage batches are bounded by ingest_upload_concurrency."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("test")
+        mock_file_service.iter_unindexed_files.return_value = [
+            {"id": "file-123", "filename": "test.txt", "file_path": str(test_file)}
+        ]
+        mock_config.vectorstore.ingest_batch_size = 1
+        mock_config.vectorstore.ingest_upload_concurrency = 3
+
+        mock_loader.load_document.return_value = [Document(page_content="doc")]
+        mock_splitter.split_documents.return_value = [
+            Document(page_content=f"chunk {i}") for i in range(6)
+        ]
+
+        with patch(
+            "ingestion.ingest.FileService", return_value=mock_file_service
+        ), patch(
+            "ingestion.ingest.create_embeddings", return_value=mock_embeddings
+        ), patch(
+            "ingestion.ingest.create_vectorstore", return_value=mock_vectorstore
+        ), patch(
+            "ingestion.ingest.DocumentLoader", return_value=mock_loader
+        ), patch(
+            "ingestion.ingest.DocumentSplitter", return_value=mock_splitter
+        ), patch(
+            "ingestion.ingest.LoaderFactory.is_supported", return_value=True
+        ), patch(
+            "ingestion.ingest.aadd_documents_batched"
+        ) as mock_bulk:
+
+            ingest_documents(mock_config)
+
+            mock_bulk.assert_called_once()
+            args, kwargs = mock_bulk.call_args
+            assert args[0] is mock_vectorstore
+            assert args[1] is mock_embeddings
+            assert len(args[2]) == 6
+            assert kwargs == {"batch_size": 1, "max_concurrency": 3}
+
+    def test_ingest_flushes_pending_chunks(
+        self,
+        mock_config,
+        mock_file_service,
+        mock_vectorstore,
+        mock_embeddings,
+        mock_loader,
+        mock_splitter,
+        tmp_path,
+    ):
+        """Test files are stored and marked once ingest_flush_chunks pend."""
+        records = []
+        for i in range(3):
+            test_file = tmp_path / f"file{i}.txt"
+            test_file.write_text("test")
+            records.append(
+                {
+                    "id": f"file-{i}",
+                    "filename": test_file.name,
+                    "file_path": str(test_file),
+                }
+            )
+        mock_file_service.iter_unindexed_files.return_value = records
+        mock_config.vectorstore.ingest_flush_chunks = 4
+
+        mock_loader.load_document.return_value = [Document(page_content="doc")]
+        mock_splitter.split_documents.side_effect = lambda docs: [
+            Document(page_content="a"),
+            Document(page_content="b"),
+        ]
+
+        events = []
+        mock_vectorstore.add_documents.side_effect = (
+            lambda texts, metadatas, ids, embeddings: events.append(
+                ("store", len(texts))
+            )
+        )
+        mock_file_service.mark_many_as_indexed.side_effect = lambda file_ids: (
+            events.append(("mark", file_ids))
+        )
+
+        with patch(
+            "ingestion.ingest.FileService", return_value=mock_file_service
+        ), patch(
+            "ingestion.ingest.create_embeddings", return_value=mock_embeddings
+        ), patch(
+            "ingestion.ingest.create_vectorstore", return_value=mock_vectorstore
+        ), patch(
+            "ingestion.ingest.DocumentLoader", return_value=mock_loader
+        ), patch(
+            "ingestion.ingest.DocumentSplitter", return_value=mock_splitter
+        ), patch(
+            "ingestion.ingest.LoaderFactory.is_supported", return_value=True
+        ):
+
+            _, _, _, total_chunks = ingest_documents(mock_config)
+
+            # Files are only marked after their chunks are stored
+            assert events == [
+                ("store", 4),
+                ("mark", ["file-0", "file-1"]),
+                ("store", 2),
+                ("mark", ["file-2"]),
+            ]
+            assert total_chunks == 6
+
+    def test_ingest_flushes_share_one_event_loop(
+        self,
+        mock_config,
+        mock_file_service,
+        mock_vectorstore,
+        mock_embeddings,
+        mock_loader,
+        mock_splitter,
+        tmp_path,
+    ):
+        """Test every flush awaits async embeddings on the same event loop."""
+        records = []
+        for i in range(2):
+            test_file = tmp_path / f"file{i}.txt"
+            test_file.write_text("test")
+            records.append(
+                {
+                    "id": f"file-{i}",
+                    "filename": test_file.name,
+                    "file_path": str(test_file),
+                }
+            )
+        mock_file_service.iter_unindexed_files.return_value = records
+        mock_config.vectorstore.ingest_flush_chunks = 1
+
+        mock_loader.load_document.return_value = [Document(page_content="doc")]
+        mock_splitter.split_documents.side_effect = lambda docs: [
+            Document(page_content="a")
+        ]
+
+        # Async clients bind their connection pool to the first loop using
+        # them, so a second flush on a new loop would fail
+        loops = []
+
+        async def aembed_documents(texts):
+            loops.append(asyncio.get_running_loop())
+            return [[0.5] for _ in texts]
+
+        mock_embeddings.aembed_documents = aembed_documents
+
+        with patch(
+            "ingestion.ingest.FileService", return_value=mock_file_service
+        ), patch(
+            "ingestion.ingest.create_embeddings", return_value=mock_embeddings
+        ), patch(
+            "ingestion.ingest.create_vectorstore", return_value=mock_vectorstore
+        ), patch(
+            "ingestion.ingest.DocumentLoader", return_value=mock_loader
+        ), patch(
+            "ingestion.ingest.DocumentSplitter", return_value=mock_splitter
+        ), patch(
+            "ingestion.ingest.LoaderFactory.is_supported", return_value=True
+        ):
+
+            ingest_documents(mock_config)
+
+            assert len(loops) == 2
+            assert loops[0] is loops[1]
+            assert mock_vectorstore.add_documents.call_count == 2
+
+    def test_ingest_logs_progress_periodically(
+        self,
+        mock_config,
+        mock_file_service,
+        mock_vectorstore,
+        mock_embeddings,
+        mock_loader,
+        mock_splitter,
+        tmp_path,
+    ):
+        """Test progress is logged every interval and after the last file."""
+        records = []
+        for i in range(3):
+            test_file = tmp_path / f"file{i}.txt"
+            test_file.write_text("test")
+            records.append(
+                {
+                    "id": f"file-{i}",
+                    "filename": test_file.name,
+                    "file_path": str(test_file),
+                }
+            )
+        mock_file_service.iter_unindexed_files.return_value = records
+
+        mock_loader.load_document.return_value = [Document(page_content="doc")]
+        mock_splitter.split_documents.side_effect = lambda docs: [
+            Document(page_content="chunk", metadata=dict(docs[0].metadata))
+        ]
+
+        with patch(
+            "ingestion.ingest.FileService", return_value=mock_file_service
+        ), patch(
+            "ingestion.ingest.create_embeddings", return_value=mock_embeddings
+        ), patch(
+            "ingestion.ingest.create_vectorstore", return_value=mock_vectorstore
+        ), patch(
+            "ingestion.ingest.DocumentLoader", return_value=mock_loader
+        ), patch(
+            "ingestion.ingest.DocumentSplitter", return_value=mock_splitter
+        ), patch(
+            "ingestion.ingest.LoaderFactory.is_supported", return_value=True
+        ), patch(
+            "constants.INGESTION_PROGRESS_LOG_INTERVAL", 2
+        ), patch(
+            "ingestion.ingest.logger"
+        ) as mock_logger:
+
+            ingest_documents(mock_config)
+
+            progress = [
+                call.kwargs["current"]
+                for call in mock_logger.info.call_args_list
+                if call.args == (codes.INGESTION_PROGRESS,)
+            ]
+            assert progress == [2, 3]
+
+    def test_ingest_markdown_uses_markdown_splitter(
+        self,
+        mock_config,
+        mock_file_service,
+        mock_vectorstore,
+        mock_embeddings,
+        mock_loader,
+        tmp_path,
+    ):
+        """Test Markdown files are split by the Markdown splitter."""
+        records = []
+        for name in ("guide.md", "notes.txt", "faq.md"):
+            test_file = tmp_path / name
+            test_file.write_text("test")
+            records.append({"id": name, "filename": name, "file_path": str(test_file)})
+        mock_file_service.iter_unindexed_files.return_value = records
+
+        mock_loader.load_document.return_value = [Document(page_content="doc")]
+
+        def create_splitter(splitter_type=constants.SPLITTER_TYPE_TOKEN):
+            splitter = Mock()
+            splitter.split_documents.side_effect = lambda documents: [
+                Document(page_content=splitter_type, metadata=dict(doc.metadata))
+                for doc in documents
+            ]
+            return splitter
+
+        with patch(
+            "ingestion.ingest.FileService", return_value=mock_file_service
+        ), patch(
+            "ingestion.ingest.create_embeddings", return_value=mock_embeddings
+        ), patch(
+            "ingestion.ingest.create_vectorstore", return_value=mock_vectorstore
+        ), patch(
+            "ingestion.ingest.DocumentLoader", return_value=mock_loader
+        ), patch(
+            "ingestion.ingest.DocumentSplitter", side_effect=create_splitter
+        ) as mock_splitter_class, patch(
+            "ingestion.ingest.LoaderFactory.is_supported", return_value=True
+        ):
+
+            ingest_documents(mock_config)
+
+            texts, metadatas, _ = mock_vectorstore.add_documents.call_args.args
+            split_by = {
+                metadata["filename"]: text for text, metadata in zip(texts, metadatas)
+            }
+            assert split_by == {
+                "guide.md": constants.SPLITTER_TYPE_MARKDOWN,
+                "notes.txt": constants.SPLITTER_TYPE_TOKEN,
+                "faq.md": constants.SPLITTER_TYPE_MARKDOWN,
+            }
+            # One splitter per type, reused across files
+            assert mock_splitter_class.call_count == 2
+
+    def test_ingest_with_workers_uses_pool(
+        self,
+        mock_config,
+        mock_file_service,
+        mock_vectorstore,
+        mock_embeddings,
+        mock_loader,
+        mock_splitter,
+        tmp_path,
+    ):
+        """Test workers > 1 loads and splits files through a process pool."""
+        file1 = tmp_path / "file1.txt"
+        file2 = tmp_path / "file2.txt"
+        file1.write_text("content 1")
+        file2.write_text("content 2")
+        records = [
+            {"id": "file-1", "filename": "file1.txt", "file_path": str(file1)},
+            {"id": "file-2", "filename": "file2.txt", "file_path": str(file2)},
+            {"id": "file-3", "filename": "gone.txt", "file_path": "/non/existent"},
+        ]
+        mock_file_service.iter_unindexed_files.return_value = records
+
+        mock_loader.load_document.return_value = [Document(page_content="doc")]
+        mock_splitter.split_documents.side_effect = lambda docs: [
+            Document(page_content="chunk", metadata=dict(docs[0].metadata))
+        ]
+
+        # Runs the initializer and worker calls in-process, completing in
+        # reverse order
+        mock_pool = MagicMock()
+        mock_pool.__enter__.return_value.imap_unordered.side_effect = (
+            lambda func, items, chunksize: [func(item) for item in list(items)[::-1]]
+        )
+
+        order = []
+
+        def create_pool(processes, initializer):
+            order.append("pool")
+            initializer()
+            return mock_pool
+
+        def create_embeddings(config):
+            order.append("embeddings")
+            return mock_embeddings
+
+        with patch(
+            "ingestion.ingest.FileService", return_value=mock_file_service
+        ), patch(
+            "ingestion.ingest.create_embeddings", side_effect=create_embeddings
+        ), patch(
+            "ingestion.ingest.create_vectorstore", return_value=mock_vectorstore
+        ), patch(
+            "ingestion.ingest.DocumentLoader", return_value=mock_loader
+        ) as mock_loader_class, patch(
+            "ingestion.ingest.DocumentSplitter", return_value=mock_splitter
+        ) as mock_splitter_class, patch(
+            "ingestion.ingest.LoaderFactory.is_supported", return_value=True
+        ), patch(
+            "ingestion.ingest.Pool", side_effect=create_pool
+        ) as mock_pool_class:
+
+            successful, failed, skipped, total_chunks = ingest_documents(
+                mock_config, workers=8
+            )
+
+            # Capped at the number of files
+            mock_pool_class.assert_called_once_with(3, initializer=_init_worker)
+            # Workers fork before clients that may start threads are built
+            assert order == ["pool", "embeddings"]
+            assert (successful, failed, skipped, total_chunks) == (2, 0, 1, 2)
+
+            # Loader and splitter are built once per worker, not per record
+            mock_loader_class.assert_called_once_with()
+            mock_splitter_class.assert_called_once_with()
+
+            # One serial store call in the parent with tagged chunks
+            mock_vectorstore.add_documents.assert_called_once()
+            texts, metadatas, _ = mock_vectorstore.add_documents.call_args.args
+            assert texts == ["chunk", "chunk"]
+            assert metadatas == [
+                {"file_id": "file-2", "filename": "file2.txt"},
+                {"file_id": "file-1", "filename": "file1.txt"},
+            ]
+            mock_file_service.mark_many_as_indexed.assert_called_once()
+            assert sorted(mock_file_service.mark_many_as_indexed.call_args.args[0]) == [
+                "file-1",
+                "file-2",
+            ]
+
+    def test_ingest_single_worker_skips_pool(
+        self,
+        mock_config,
+        mock_file_service,
+        mock_vectorstore,
+        mock_embeddings,
+        mock_loader,
+        mock_splitter,
+        tmp_path,
+    ):
+        """Test workers=1 processes files in-process without a pool."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("test")
+        mock_file_service.iter_unindexed_files.return_value = [
+            {"id": "file-123", "filename": "test.txt", "file_path": str(test_file)}
+        ]
+        mock_loader.load_document.return_value = [Document(page_content="doc")]
+        mock_splitter.split_documents.return_value = [Document(page_content="chunk")]
+
+        with patch(
+            "ingestion.ingest.FileService", return_value=mock_file_service
+        ), patch(
+            "ingestion.ingest.create_embeddings", return_value=mock_embeddings
+        ), patch(
+            "ingestion.ingest.create_vectorstore", return_value=mock_vectorstore
+        ), patch(
+            "ingestion.ingest.DocumentLoader", return_value=mock_loader
+        ), patch(
+            "ingestion.ingest.DocumentSplitter", return_value=mock_splitter
+        ), patch(
+            "ingestion.ingest.LoaderFactory.is_supported", return_value=True
+        ), patch(
+            "ingestion.ingest.Pool"
+        ) as mock_pool_class:
+
+            successful, _, _, total_chunks = ingest_documents(mock_config, workers=1)
+
+            mock_pool_class.assert_not_called()
+            assert successful == 1
+            assert total_chunks == 1
+
 
 # ============================================================================
 # Test print_summary
@@ -629,7 +1197,7 @@ class TestMain:
             "ingestion.ingest.print_summary"
         ):
 
-            mock_parse.return_value = argparse.Namespace(clear=False)
+            mock_parse.return_value = argparse.Namespace(clear=False, workers=1)
 
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -670,7 +1238,7 @@ class TestMain:
             "ingestion.ingest.print_summary"
         ):
 
-            mock_parse.return_value = argparse.Namespace(clear=False)
+            mock_parse.return_value = argparse.Namespace(clear=False, workers=1)
 
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -689,7 +1257,7 @@ class TestMain:
             "ingestion.ingest.print_summary"
         ):
 
-            mock_parse.return_value = argparse.Namespace(clear=False)
+            mock_parse.return_value = argparse.Namespace(clear=False, workers=1)
 
             with pytest.raises(SystemExit) as exc_info:
                 main()
@@ -22,6 +22,7 @@ import pytest
 from langchain_core.documents import Document
 
 import constants
+import loader.strategies as loader_strategies
 from loader import DocumentLoader, LoaderFactory
 from loader.strategies import (
     CSVLoaderStrategy,
@@ -246,6 +247,12 @@ class TestLoaderFactory:
 
         assert constants.ERROR_UNSUPPORTED_FORMAT in str(exc_info.value)
 
+    def test_strategy_map_resolves_to_exported_strategies(self):
+        """Test each registered class name is exported by loader.strategies."""
+        for class_name in LoaderFactory._STRATEGY_MAP.values():
+            assert class_name in loader_strategies.__all__
+            assert getattr(loader_strategies, class_name).__name__ == class_name
+
 
 # ============================================================================
 # TEST DOCUMENT LOADER
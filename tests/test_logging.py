@@ -4,8 +4,13 @@ Tests for logging system.
 Tests the logger package setup and configuration.
 """
 
+import json
+import uuid
+from types import SimpleNamespace
+
 from config import Config
 from logger import get_logger, setup_logging
+from logger.setup import _build_processors
 
 
 def test_logging_setup():
@@ -81,3 +86,25 @@ def test_logging_respects_config():
     # Should complete without errors
     logger = get_logger(__name__)
     logger.info("test_message")
+
+
+def test_json_renderer_output():
+    """Test JSON format renders events that json.loads can read back"""
+    logging_config = SimpleNamespace(
+        level="INFO", format="json", include_caller=False, include_process_info=False
+    )
+    renderer = _build_processors(logging_config)[-1]
+    file_id = uuid.uuid4()
+
+    rendered = renderer(
+        None,
+        "info",
+        {"event": "file_stored", "file_id": file_id, "chunks": 3, 1: "non-str key"},
+    )
+
+    assert json.loads(rendered) == {
+        "event": "file_stored",
+        "file_id": str(file_id),
+        "chunks": 3,
+        "1": "non-str key",
+    }
@@ -24,6 +24,9 @@ def mock_config():
     config.rag.google.temperature = 0.1
     config.rag.google.max_tokens = 1000
     config.rag.google.api_key = "test-api-key"
+    config.rag.semantic_cache_size = 0
+    config.rag.semantic_cache_threshold = 0.86
+    config.rag.semantic_cache_ttl_seconds = 3600
     return config
 
 
@@ -297,6 +300,66 @@ class TestRAGChainQuery:
             assert constants.ERROR_RAG_QUERY_FAILED in str(exc_info.value)
 
 
+class TestRAGChainSemanticCache:
+    """Tests for serving near-duplicate questions from the semantic cache."""
+
+    def test_similar_question_skips_retrieval_and_llm(self, mock_config):
+        """Test a repeated question is answered from the cache."""
+        mock_config.rag.semantic_cache_size = 10
+
+        with patch(
+            "app.chain_rag.chain.DocumentRetriever"
+        ) as mock_retriever_class, patch(
+            "app.chain_rag.chain.create_rag_prompt"
+        ) as mock_create_prompt, patch(
+            "llm.factory.create_llm"
+        ) as mock_llm_class:
+
+            mock_retriever = Mock()
+            mock_retriever.embeddings.embed_query.side_effect = lambda q: (
+                [1.0, 0.0] if "RAG" in q else [0.0, 1.0]
+            )
+            mock_retriever.retrieve.return_value = [
+                Document(page_content="Content", metadata={"source": "test.txt"})
+            ]
+            mock_retriever_class.return_value = mock_retriever
+            mock_create_prompt.return_value = Mock(
+                format_messages=Mock(return_value=[])
+            )
+            mock_llm = Mock()
+            mock_llm.invoke.return_value = Mock(content="Answer text")
+            mock_llm_class.return_value = mock_llm
+
+            chain = RAGChain(mock_config)
+            chain.query("What is RAG?")
+            cached = chain.query("What is RAG exactly?")
+            chain.query("Something else")
+
+            assert cached[constants.RESPONSE_KEY_ANSWER] == "Answer text"
+            assert cached[constants.RESPONSE_KEY_QUERY] == "What is RAG exactly?"
+            assert mock_retriever.retrieve.call_count == 2
+            assert mock_llm.invoke.call_count == 2
+
+    def test_disabled_cache_does_not_embed_question(self, mock_config):
+        """Test the default (disabled) cache adds no embedding call."""
+        with patch(
+            "app.chain_rag.chain.DocumentRetriever"
+        ) as mock_retriever_class, patch(
+            "app.chain_rag.chain.create_rag_prompt"
+        ), patch(
+            "llm.factory.create_llm"
+        ):
+
+            mock_retriever = Mock()
+            mock_retriever.retrieve.return_value = []
+            mock_retriever_class.return_value = mock_retriever
+
+            chain = RAGChain(mock_config)
+            chain.query("What is RAG?")
+
+            mock_retriever.embeddings.embed_query.assert_not_called()
+
+
 class TestRAGChainGenerateAnswer:
     """Tests for RAGChain._generate_answer() method."""
 
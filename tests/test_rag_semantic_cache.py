@@ -0,0 +1,119 @@
+"""
+Tests for the RAG semantic cache.
+
+Test Coverage:
+- Hits above the similarity threshold, misses below it
+- Centroid running-mean update on hit
+- Eviction of the oldest entry when full
+- TTL expiry
+- Disabled cache (max_entries 0) and zero vectors
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.chain_rag.semantic_cache import SemanticCache
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def cache():
+    """Create small semantic cache."""
+    return SemanticCache(threshold=0.9, max_entries=2, ttl_seconds=0)
+
+
+# ============================================================================
+# LOOKUP / STORE TESTS
+# ============================================================================
+
+
+class TestLookupStore:
+    """Test similarity matching."""
+
+    def test_empty_cache_misses(self, cache):
+        """Test lookup on an empty cache returns None."""
+        assert cache.lookup([1.0, 0.0]) is None
+        assert cache.misses == 1
+
+    def test_similar_question_hits(self, cache):
+        """Test a question above the threshold gets the cached response."""
+        cache.store([1.0, 0.0], {"answer": "a"})
+
+        assert cache.lookup([0.99, 0.1]) == {"answer": "a"}
+        assert cache.hits == 1
+
+    def test_dissimilar_question_misses(self, cache):
+        """Test a question below the threshold is not served."""
+        cache.store([1.0, 0.0], {"answer": "a"})
+
+        assert cache.lookup([0.5, 0.5]) is None
+
+    def test_scale_does_not_matter(self, cache):
+        """Test embeddings are compared by direction only."""
+        cache.store([2.0, 0.0], {"answer": "a"})
+
+        assert cache.lookup([0.5, 0.0]) == {"answer": "a"}
+
+    def test_hit_moves_centroid(self, cache):
+        """Test a hit folds the question into the cluster's running mean."""
+        cache.store([1.0, 0.0], {"answer": "a"})
+        query = np.array([0.95, 0.31])
+        cache.lookup(query)
+
+        expected = np.array([1.0, 0.0]) + query / np.linalg.norm(query)
+        expected /= np.linalg.norm(expected)
+        assert cache._centroids[0] == pytest.approx(expected, abs=1e-6)
+        assert cache._counts[0] == 2
+
+
+# ============================================================================
+# EVICTION TESTS
+# ============================================================================
+
+
+class TestEviction:
+    """Test capacity and TTL bounds."""
+
+    def test_evicts_oldest_when_full(self, cache):
+        """Test the oldest entry is dropped for a new one."""
+        cache.store([1.0, 0.0, 0.0], {"answer": "a"})
+        cache.store([0.0, 1.0, 0.0], {"answer": "b"})
+        cache.store([0.0, 0.0, 1.0], {"answer": "c"})
+
+        assert cache.lookup([1.0, 0.0, 0.0]) is None
+        assert cache.lookup([0.0, 1.0, 0.0]) == {"answer": "b"}
+        assert cache.lookup([0.0, 0.0, 1.0]) == {"answer": "c"}
+
+    def test_expires_after_ttl(self):
+        """Test entries are not served after ttl_seconds."""
+        cache = SemanticCache(threshold=0.9, max_entries=2, ttl_seconds=60)
+
+        with patch("app.chain_rag.semantic_cache.time.monotonic") as mock_clock:
+            mock_clock.return_value = 1000.0
+            cache.store([1.0, 0.0], {"answer": "a"})
+
+            mock_clock.return_value = 1030.0
+            assert cache.lookup([1.0, 0.0]) == {"answer": "a"}
+
+            mock_clock.return_value = 1061.0
+            assert cache.lookup([1.0, 0.0]) is None
+
+    def test_zero_entries_disables_cache(self):
+        """Test max_entries 0 never stores responses."""
+        cache = SemanticCache(threshold=0.9, max_entries=0, ttl_seconds=0)
+        cache.store([1.0, 0.0], {"answer": "a"})
+
+        assert not cache.enabled
+        assert cache.lookup([1.0, 0.0]) is None
+
+    def test_zero_vector_is_ignored(self, cache):
+        """Test zero embeddings (blank input) are neither stored nor matched."""
+        cache.store([0.0, 0.0], {"answer": "a"})
+
+        assert cache.lookup([0.0, 0.0]) is None
+        assert len(cache._responses) == 0
@@ -3,6 +3,7 @@ Tests for document splitters.
 
 This module tests the text splitting functionality including:
 - Token-based splitting
+- Markdown-aware splitting
 - Factory pattern implementation
 - Parameter validation
 - Chunk overlap preservation
@@ -19,7 +20,7 @@ from langchain_core.documents import Document
 
 import constants
 from splitter import DocumentSplitter, SplitterFactory
-from splitter.strategies import TokenSplitterStrategy
+from splitter.strategies import MarkdownSplitterStrategy, TokenSplitterStrategy
 
 # ============================================================================
 # FIXTURES
@@ -121,6 +122,33 @@ class TestTokenSplitterStrategy:
         assert chunks[0].page_content == short_document.page_content
 
 
+class TestMarkdownSplitterStrategy:
+    """Test MarkdownSplitterStrategy directly."""
+
+    def test_splits_on_headings(self):
+        """Test sections become separate chunks when they fit."""
+        text = "# Intro\n\nShort intro.\n\n## Usage\n\nShort usage notes."
+        document = Document(page_content=text, metadata={"source": "guide.md"})
+        splitter = MarkdownSplitterStrategy(chunk_size=10, chunk_overlap=0)
+
+        chunks = splitter.split_documents([document])
+
+        assert [chunk.page_content for chunk in chunks] == [
+            "# Intro\n\nShort intro.",
+            "## Usage\n\nShort usage notes.",
+        ]
+        assert all(chunk.metadata["source"] == "guide.md" for chunk in chunks)
+
+    def test_split_short_document(self, short_document):
+        """Test a document shorter than chunk size stays whole."""
+        splitter = MarkdownSplitterStrategy(chunk_size=512, chunk_overlap=100)
+
+        chunks = splitter.split_documents([short_document])
+
+        assert len(chunks) == 1
+        assert chunks[0].page_content == short_document.page_content
+
+
 # ============================================================================
 # TEST SPLITTER FACTORY
 # ============================================================================
@@ -141,6 +169,10 @@ class TestSplitterFactory:
         """Test checking if token splitter is supported."""
         assert SplitterFactory.is_supported(constants.SPLITTER_TYPE_TOKEN) is True
 
+    def test_is_supported_markdown(self):
+        """Test markdown splitter type is supported."""
+        assert SplitterFactory.is_supported(constants.SPLITTER_TYPE_MARKDOWN) is True
+
     def test_is_supported_unsupported_type(self):
         """Test checking unsupported splitter type."""
         assert SplitterFactory.is_supported("unsupported_type") is False
@@ -43,7 +43,7 @@ def mock_s3_client():
     client.upload_fileobj.return_value = None
 
     # Mock download_fileobj
-    def mock_download(bucket, key, stream):
+    def mock_download(bucket, key, stream, Config=None):
         stream.write(b"Test content from S3")
 
     client.download_fileobj.side_effect = mock_download
@@ -121,6 +121,16 @@ class TestS3StorageUpload:
         assert result == filename
         mock_s3_client.upload_fileobj.assert_called_once()
 
+    def test_upload_uses_multipart_transfer_config(self, s3_storage, mock_s3_client):
+        """Test uploads stream through the configured multipart settings."""
+        s3_storage.upload_file(BytesIO(b"content"), "test.txt")
+
+        transfer_config = mock_s3_client.upload_fileobj.call_args[1]["Config"]
+        assert transfer_config is s3_storage.transfer_config
+        assert transfer_config.multipart_threshold == 8 * 1024 * 1024
+        assert transfer_config.multipart_chunksize == 8 * 1024 * 1024
+        assert transfer_config.max_concurrency == 8
+
 
 class TestS3StorageDownload:
     """Test file download operations."""
@@ -0,0 +1,207 @@
+"""
+Tests for concurrent bulk ingestion.
+
+Test Coverage:
+- Batching by batch_size, longest texts first
+- Metadata and ids stay aligned with their text
+- Repeated texts are embedded once and share the vector
+- Precomputed vectors are passed to add_documents
+- Async embeddings API is used when available, sync fallback otherwise
+- Concurrency limit on batches in flight
+- Length validation of metadatas and ids
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from embeddings.base import EmbeddingsProtocol
+from vectorstore.base import VectorStoreProtocol
+from vectorstore.bulk import aadd_documents_batched
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def mock_vectorstore():
+    """Create mock vector store recording add_documents calls."""
+    return Mock(spec=VectorStoreProtocol)
+
+
+@pytest.fixture
+def sync_embeddings():
+    """Create embeddings provider without an async API."""
+    embeddings = Mock(spec=EmbeddingsProtocol)
+    embeddings.embed_documents.side_effect = lambda texts: [
+        [float(len(text))] for text in texts
+    ]
+    return embeddings
+
+
+def added(mock_vectorstore):
+    """Return (texts, metadatas, ids, embeddings) of each add_documents call."""
+    return [
+        (*call.args, call.kwargs["embeddings"])
+        for call in mock_vectorstore.add_documents.call_args_list
+    ]
+
+
+# ============================================================================
+# BATCHING TESTS
+# ============================================================================
+
+
+class TestBatching:
+    """Test batch splitting and alignment."""
+
+    def test_batches_longest_first(self, mock_vectorstore, sync_embeddings):
+        """Test texts are sorted by length and split into batches."""
+        texts = ["a", "ccc", "bb", "dddd", "eeeee"]
+
+        asyncio.run(
+            aadd_documents_batched(
+                mock_vectorstore, sync_embeddings, texts, batch_size=2
+            )
+        )
+
+        batches = sorted(call[0] for call in added(mock_vectorstore))
+        assert batches == [["a"], ["ccc", "bb"], ["eeeee", "dddd"]]
+
+    def test_metadata_and_ids_follow_text(self, mock_vectorstore, sync_embeddings):
+        """Test reordering keeps metadata, ids and vectors with their text."""
+        texts = ["a", "ccc", "bb"]
+        metadatas = [{"n": 1}, {"n": 3}, {"n": 2}]
+        ids = ["id-a", "id-c", "id-b"]
+
+        asyncio.run(
+            aadd_documents_batched(
+                mock_vectorstore, sync_embeddings, texts, metadatas, ids, batch_size=2
+            )
+        )
+
+        for batch_texts, batch_metadatas, batch_ids, vectors in added(mock_vectorstore):
+            for text, metadata, doc_id, vector in zip(
+                batch_texts, batch_metadatas, batch_ids, vectors
+            ):
+                assert metadata == {"n": len(text)}
+                assert doc_id == f"id-{text[0]}"
+                assert vector == [float(len(text))]
+
+    def test_repeated_texts_embedded_once(self, mock_vectorstore, sync_embeddings):
+        """Test duplicates share one embedding but are all inserted."""
+        texts = ["footer", "body one", "footer", "body two", "footer"]
+        metadatas = [{"n": i} for i in range(5)]
+
+        asyncio.run(
+            aadd_documents_batched(
+                mock_vectorstore, sync_embeddings, texts, metadatas, batch_size=2
+            )
+        )
+
+        embedded = [
+            text
+            for call in sync_embeddings.embed_documents.call_args_list
+            for text in call.args[0]
+        ]
+        assert sorted(embedded) == ["body one", "body two", "footer"]
+
+        inserted = {
+            metadata["n"]: (text, vector)
+            for batch_texts, batch_metadatas, _, vectors in added(mock_vectorstore)
+            for text, metadata, vector in zip(batch_texts, batch_metadatas, vectors)
+        }
+        assert inserted == {
+            i: (text, [float(len(text))]) for i, text in enumerate(texts)
+        }
+
+    def test_without_metadata_or_ids(self, mock_vectorstore, sync_embeddings):
+        """Test missing metadatas and ids are passed through as None."""
+        asyncio.run(
+            aadd_documents_batched(mock_vectorstore, sync_embeddings, ["a", "b"])
+        )
+
+        assert added(mock_vectorstore) == [(["a", "b"], None, None, [[1.0], [1.0]])]
+
+    def test_empty_input_adds_nothing(self, mock_vectorstore, sync_embeddings):
+        """Test an empty document list makes no calls."""
+        asyncio.run(aadd_documents_batched(mock_vectorstore, sync_embeddings, []))
+
+        mock_vectorstore.add_documents.assert_not_called()
+        sync_embeddings.embed_documents.assert_not_called()
+
+    def test_rejects_misaligned_metadatas(self, mock_vectorstore, sync_embeddings):
+        """Test metadatas of the wrong length raise ValueError."""
+        with pytest.raises(ValueError):
+            asyncio.run(
+                aadd_documents_batched(
+                    mock_vectorstore, sync_embeddings, ["a", "b"], [{}]
+                )
+            )
+
+    def test_rejects_misaligned_ids(self, mock_vectorstore, sync_embeddings):
+        """Test ids of the wrong length raise ValueError."""
+        with pytest.raises(ValueError):
+            asyncio.run(
+                aadd_documents_batched(
+                    mock_vectorstore, sync_embeddings, ["a"], ids=["1", "2"]
+                )
+            )
+
+
+# ============================================================================
+# CONCURRENCY TESTS
+# ============================================================================
+
+
+class TestConcurrency:
+    """Test async embedding and the in-flight batch limit."""
+
+    def test_uses_async_embeddings(self, mock_vectorstore):
+        """Test aembed_documents is awaited instead of embed_documents."""
+        embeddings = Mock(spec=EmbeddingsProtocol)
+
+        async def aembed_documents(texts):
+            return [[0.5] for _ in texts]
+
+        embeddings.aembed_documents = aembed_documents
+
+        asyncio.run(
+            aadd_documents_batched(mock_vectorstore, embeddings, ["a", "b", "c"])
+        )
+
+        embeddings.embed_documents.assert_not_called()
+        assert added(mock_vectorstore) == [
+            (["a", "b", "c"], None, None, [[0.5], [0.5], [0.5]])
+        ]
+
+    def test_limits_batches_in_flight(self, mock_vectorstore):
+        """Test no more than max_concurrency batches embed at once."""
+        embeddings = Mock(spec=EmbeddingsProtocol)
+        in_flight = []
+        peak = []
+
+        async def aembed_documents(texts):
+            in_flight.append(texts)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(texts)
+            return [[0.5] for _ in texts]
+
+        embeddings.aembed_documents = aembed_documents
+        texts = [f"text {i}" for i in range(10)]
+
+        asyncio.run(
+            aadd_documents_batched(
+                mock_vectorstore,
+                embeddings,
+                texts,
+                batch_size=1,
+                max_concurrency=3,
+            )
+        )
+
+        assert max(peak) == 3
+        assert mock_vectorstore.add_documents.call_count == 10
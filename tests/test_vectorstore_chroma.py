@@ -11,7 +11,7 @@ Test Coverage:
 - Initialization with config and embeddings
 - Collection creation and retrieval
 - Document addition (single and batch)
-- Query operations
+- Query operations (single and batched)
 - Delete operations
 - Statistics retrieval
 - Collection clearing
@@ -39,6 +39,10 @@ def mock_embeddings():
         [0.1, 0.2, 0.3],  # Vector for doc 1
         [0.4, 0.5, 0.6],  # Vector for doc 2
     ]
+    # Single window that delegates, so embed_documents assertions still hold
+    embeddings.iter_embed_documents.side_effect = lambda texts: iter(
+        [embeddings.embed_documents(texts)]
+    )
     embeddings.embed_query.return_value = [0.7, 0.8, 0.9]
     embeddings.get_dimension.return_value = 768
     return embeddings
@@ -159,6 +163,22 @@ class TestCollectionInitialization:
         assert chroma_vectorstore.collection is not None
         mock_chroma_client.create_collection.assert_called_once()
 
+    def test_new_collection_uses_configured_hnsw_params(
+        self, chroma_vectorstore, mock_chroma_client
+    ):
+        """Test new collections are built with the configured HNSW index."""
+        mock_chroma_client.get_collection.side_effect = Exception("Not found")
+
+        chroma_vectorstore.initialize()
+
+        metadata = mock_chroma_client.create_collection.call_args[1]["metadata"]
+        assert metadata == {
+            "hnsw:space": "cosine",
+            "hnsw:M": 24,
+            "hnsw:construction_ef": 128,
+            "hnsw:search_ef": 100,
+        }
+
 
 # ============================================================================
 # ADD DOCUMENTS TESTS
@@ -184,6 +204,41 @@ class TestAddDocuments:
         # Verify collection.add was called
         mock_collection.add.assert_called_once()
 
+    def test_add_documents_per_window(self, chroma_vectorstore, mock_embeddings):
+        """Test each embedded window is added with its own slice of inputs."""
+        mock_collection = MagicMock()
+        chroma_vectorstore.collection = mock_collection
+        mock_embeddings.iter_embed_documents.side_effect = lambda texts: iter(
+            [[[0.1], [0.2]], [[0.3]]]
+        )
+
+        chroma_vectorstore.add_documents(["a", "b", "c"], ids=["1", "2", "3"])
+
+        calls = mock_collection.add.call_args_list
+        assert [call.kwargs["ids"] for call in calls] == [["1", "2"], ["3"]]
+        assert calls[1].kwargs["documents"] == ["c"]
+        assert calls[1].kwargs["embeddings"] == [[0.3]]
+
+    def test_add_documents_with_precomputed_embeddings(
+        self, chroma_vectorstore, mock_embeddings
+    ):
+        """Test provided vectors are stored without calling the provider."""
+        mock_collection = MagicMock()
+        chroma_vectorstore.collection = mock_collection
+
+        chroma_vectorstore.add_documents(["a", "b"], embeddings=[[0.1], [0.2]])
+
+        mock_embeddings.iter_embed_documents.assert_not_called()
+        mock_embeddings.embed_documents.assert_not_called()
+        assert mock_collection.add.call_args.kwargs["embeddings"] == [[0.1], [0.2]]
+
+    def test_add_documents_rejects_embedding_count_mismatch(self, chroma_vectorstore):
+        """Test vectors must line up one-to-one with texts."""
+        chroma_vectorstore.collection = MagicMock()
+
+        with pytest.raises(ValueError, match="must match"):
+            chroma_vectorstore.add_documents(["a", "b"], embeddings=[[0.1]])
+
     def test_add_documents_generates_ids_if_not_provided(
         self, chroma_vectorstore, mock_embeddings
     ):
@@ -297,6 +352,29 @@ class TestQuery:
         call_args = mock_collection.query.call_args
         assert call_args.kwargs.get("n_results") == 10
 
+    def test_query_batch_searches_once(self, chroma_vectorstore, mock_embeddings):
+        """Test query_batch sends every query vector in one collection query."""
+        mock_collection = MagicMock()
+        mock_collection.query.return_value = {
+            "ids": [["doc_1"], ["doc_2", "doc_3"]],
+            "documents": [["Text 1"], ["Text 2", "Text 3"]],
+            "metadatas": [[{}], [{}, {}]],
+            "distances": [[0.1], [0.2, 0.3]],
+        }
+        chroma_vectorstore.collection = mock_collection
+
+        results = chroma_vectorstore.query_batch(["first", "second"], n_results=2)
+
+        mock_collection.query.assert_called_once_with(
+            query_embeddings=[[0.7, 0.8, 0.9], [0.7, 0.8, 0.9]],
+            n_results=2,
+            where=None,
+        )
+        assert [[r["id"] for r in matches] for matches in results] == [
+            ["doc_1"],
+            ["doc_2", "doc_3"],
+        ]
+
 
 # ============================================================================
 # DELETE TESTS
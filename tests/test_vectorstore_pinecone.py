@@ -39,6 +39,10 @@ def mock_embeddings():
         [0.1, 0.2, 0.3] * 256,  # 768-dim vector
         [0.4, 0.5, 0.6] * 256,  # 768-dim vector
     ]
+    # Single window that delegates, so embed_documents assertions still hold
+    embeddings.iter_embed_documents.side_effect = lambda texts: iter(
+        [embeddings.embed_documents(texts)]
+    )
     embeddings.embed_query.return_value = [0.7, 0.8, 0.9] * 256
     embeddings.get_dimension.return_value = 768
     return embeddings
@@ -11,7 +11,7 @@ Test Coverage:
 - Initialization with config and embeddings
 - Collection creation and retrieval
 - Document addition (single and batch)
-- Query operations with filters
+- Query operations with filters (single and batched)
 - Delete operations
 - Statistics retrieval
 - Collection clearing
@@ -39,6 +39,10 @@ def mock_embeddings():
         [0.1, 0.2, 0.3] * 256,  # 768-dim vector
         [0.4, 0.5, 0.6] * 256,  # 768-dim vector
     ]
+    # Single window that delegates, so embed_documents assertions still hold
+    embeddings.iter_embed_documents.side_effect = lambda texts: iter(
+        [embeddings.embed_documents(texts)]
+    )
     embeddings.embed_query.return_value = [0.7, 0.8, 0.9] * 256
     embeddings.get_dimension.return_value = 768
     return embeddings
@@ -295,6 +299,24 @@ class TestQuery:
         call_args = mock_qdrant_client.search.call_args
         assert call_args.kwargs.get("limit") == 10
 
+    def test_query_batch_uses_search_batch(
+        self, qdrant_vectorstore, mock_embeddings, mock_qdrant_client
+    ):
+        """Test query_batch sends all queries in one batched search."""
+        mock_point = MagicMock()
+        mock_point.id = "doc_1"
+        mock_point.score = 0.9
+        mock_point.payload = {"text": "Text 1"}
+        mock_qdrant_client.search_batch.return_value = [[mock_point], []]
+
+        results = qdrant_vectorstore.query_batch(["first", "second"], n_results=3)
+
+        mock_qdrant_client.search_batch.assert_called_once()
+        requests = mock_qdrant_client.search_batch.call_args.kwargs["requests"]
+        assert [request.limit for request in requests] == [3, 3]
+        assert results[0][0]["text"] == "Text 1"
+        assert results[1] == []
+
 
 # ============================================================================
 # DELETE TESTS
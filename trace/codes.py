@@ -84,6 +84,7 @@ INGESTION_FILE_STORED = "ingestion_file_stored"
 INGESTION_FILE_SUCCESS = "ingestion_file_success"
 INGESTION_FILE_SKIPPED = "ingestion_file_skipped"
 INGESTION_FILE_ERROR = "ingestion_file_error"
+INGESTION_PROGRESS = "ingestion_progress"
 INGESTION_COMPLETE = "ingestion_complete"
 INGESTION_CLEARING_VECTORSTORE = "ingestion_clearing_vectorstore"
 INGESTION_VECTORSTORE_CLEARED = "ingestion_vectorstore_cleared"
@@ -113,6 +114,7 @@ VECTORSTORE_COLLECTION_CREATED = "vectorstore_collection_created"
 VECTORSTORE_COLLECTION_EXISTS = "vectorstore_collection_exists"
 VECTORSTORE_DOCUMENTS_ADDING = "vectorstore_documents_adding"
 VECTORSTORE_DOCUMENTS_ADDED = "vectorstore_documents_added"
+VECTORSTORE_BULK_BATCH_ADDED = "vectorstore_bulk_batch_added"
 VECTORSTORE_QUERYING = "vectorstore_querying"
 VECTORSTORE_QUERY_RESULTS = "vectorstore_query_results"
 VECTORSTORE_DELETING = "vectorstore_deleting"
@@ -139,11 +141,25 @@ EMBEDDINGS_GENERATING = "embeddings_generating"
 EMBEDDINGS_GENERATED = "embeddings_generated"
 EMBEDDINGS_BATCH_PROCESSING = "embeddings_batch_processing"
 EMBEDDINGS_BATCH_COMPLETE = "embeddings_batch_complete"
+EMBEDDINGS_BATCH_RETRYING = "embeddings_batch_retrying"
+EMBEDDINGS_BATCH_SPLITTING = "embeddings_batch_splitting"
+EMBEDDINGS_BLANK_TEXTS_SKIPPED = "embeddings_blank_texts_skipped"
+EMBEDDINGS_BLANK_TEXTS_REJECTED = "embeddings_blank_texts_rejected"
+EMBEDDINGS_TOKENIZER_UNAVAILABLE = "embeddings_tokenizer_unavailable"
 EMBEDDINGS_ERROR = "embeddings_error"
 EMBEDDINGS_PROVIDER_UNKNOWN = "embeddings_provider_unknown"
 
 MSG_EMBEDDINGS_INITIALIZED = "Embeddings initialized successfully"
 MSG_EMBEDDINGS_GENERATED = "Embeddings generated successfully"
+MSG_EMBEDDINGS_BATCH_RETRYING = "Transient embeddings API error, retrying batch"
+MSG_EMBEDDINGS_BATCH_SPLITTING = "Embeddings batch failed, retrying each half"
+MSG_EMBEDDINGS_BLANK_TEXTS_SKIPPED = (
+    "Blank texts not sent for embedding, using zero vectors"
+)
+MSG_EMBEDDINGS_BLANK_TEXTS_REJECTED = "Blank texts cannot be embedded"
+MSG_EMBEDDINGS_TOKENIZER_UNAVAILABLE = (
+    "Tokenizer encoding unavailable, using estimated token counts"
+)
 MSG_EMBEDDINGS_PROVIDER_UNKNOWN = "Unknown embeddings provider"
 
 # ============================================================================
@@ -314,6 +330,7 @@ RAG_LLM_FAILED = "rag_llm_failed"
 RAG_RESPONSE_FORMATTED = "rag_response_formatted"
 RAG_QUERY_COMPLETED = "rag_query_completed"
 RAG_QUERY_FAILED = "rag_query_failed"
+RAG_SEMANTIC_CACHE_HIT = "rag_semantic_cache_hit"
 
 # RAG messages (imported from constants)
 
@@ -360,6 +377,7 @@ DB_CONNECTION_CLOSED = "db_connection_closed"
 DB_CONNECTION_TIMEOUT = "db_connection_timeout"
 DB_CONNECTION_POOL_CREATED = "db_connection_pool_created"
 DB_CONNECTION_POOL_EXHAUSTED = "db_connection_pool_exhausted"
+DB_CONNECTION_POOL_OVERFLOW_CHANGED = "db_connection_pool_overflow_changed"
 
 # Engine trace codes
 DB_ENGINE_CREATING = "db_engine_creating"
@@ -20,8 +20,12 @@ Usage:
     )
 
     results = vectorstore.query("search query", n_results=5)
+
+    # Large ingests: embed and insert batches concurrently
+    asyncio.run(aadd_documents_batched(vectorstore, embeddings, texts, metadatas))
 """
 
+from vectorstore.bulk import aadd_documents_batched
 from vectorstore.factory import create_vectorstore
 
-__all__ = ["create_vectorstore"]
+__all__ = ["aadd_documents_batched", "create_vectorstore"]
@@ -35,6 +35,7 @@ class VectorStoreProtocol(Protocol):
         texts: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
     ) -> None:
         """
         Add documents to the vector store.
@@ -43,6 +44,11 @@ class VectorStoreProtocol(Protocol):
             texts: List of document text strings
             metadatas: Optional list of metadata dicts (one per document)
             ids: Optional list of document IDs (generated if not provided)
+            embeddings: Optional precomputed vectors, one per text (skips
+                the embeddings provider)
+
+        Raises:
+            ValueError: If embeddings and texts differ in length
 
         Example:
             vectorstore.add_documents(
@@ -83,6 +89,35 @@ class VectorStoreProtocol(Protocol):
         """
         ...
 
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Query the vector store for several texts at once.
+
+        Backends that accept multiple query vectors search them in a
+        single call; the others run one query per text.
+
+        Args:
+            query_texts: Texts to search for
+            n_results: Number of results to return per text
+            where: Optional metadata filter applied to every text
+
+        Returns:
+            One list of result dicts (as returned by query) per text,
+            in input order
+
+        Example:
+            faq_results, topic_results = vectorstore.query_batch(
+                query_texts=["What is RAG?", "How are documents chunked?"],
+                n_results=3,
+            )
+        """
+        ...
+
     def delete(self, ids: List[str]) -> None:
         """
         Delete documents from the vector store.
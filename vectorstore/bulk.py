@@ -0,0 +1,114 @@
+"""
+Concurrent bulk ingestion for vector stores.
+
+add_documents embeds and writes one window at a time, so a large ingest
+waits on the embeddings API and the database in turn. aadd_documents_batched
+splits the input into batches, embeds each one asynchronously and hands
+the vectors to add_documents, keeping several batches in flight so the
+embedding requests of one batch overlap the inserts of another.
+
+Works with every provider: embeddings without an async API and the
+synchronous vector store clients run in worker threads.
+"""
+
+import asyncio
+import time
+from trace import codes
+from typing import Any, Dict, List, Optional
+
+import constants
+from embeddings.base import EmbeddingsProtocol
+from logger import get_logger
+from vectorstore.base import VectorStoreProtocol
+
+logger = get_logger(__name__)
+
+
+async def aadd_documents_batched(
+    vectorstore: VectorStoreProtocol,
+    embeddings: EmbeddingsProtocol,
+    texts: List[str],
+    metadatas: Optional[List[Dict[str, Any]]] = None,
+    ids: Optional[List[str]] = None,
+    batch_size: int = constants.VECTORSTORE_BULK_BATCH_SIZE,
+    max_concurrency: int = constants.VECTORSTORE_BULK_MAX_CONCURRENCY,
+) -> None:
+    """
+    Embed and add documents in concurrent batches.
+
+    Documents are ordered longest first before batching, so each batch
+    holds texts of similar length and requests pack evenly against the
+    provider's token limits. Each distinct text is embedded once; batch_size
+    counts distinct texts, and every document repeating one is inserted
+    in the same batch with the shared vector. Metadata and ids stay with
+    their text.
+
+    Args:
+        vectorstore: Initialized vector store to write to
+        embeddings: Embeddings provider used for the documents
+        texts: Document texts
+        metadatas: Optional metadata dicts aligned with texts
+        ids: Optional document IDs aligned with texts
+        batch_size: Documents embedded and inserted per batch
+        max_concurrency: Maximum number of batches in flight
+
+    Raises:
+        ValueError: If metadatas or ids don't match the number of texts
+    """
+    if metadatas is not None and len(metadatas) != len(texts):
+        raise ValueError(constants.ERROR_METADATAS_COUNT_MISMATCH)
+    if ids is not None and len(ids) != len(texts):
+        raise ValueError(constants.ERROR_IDS_COUNT_MISMATCH)
+
+    start_time = time.perf_counter()
+
+    # Identical texts (repeated headers, footers, boilerplate) are embedded
+    # once and their vector shared by every document carrying them
+    positions: Dict[str, List[int]] = {}
+    for index, text in enumerate(texts):
+        positions.setdefault(text, []).append(index)
+
+    unique_texts = sorted(positions, key=len, reverse=True)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    # Providers without an async client embed in a worker thread instead
+    aembed_documents = getattr(embeddings, "aembed_documents", None)
+
+    async def add_batch(batch_texts: List[str]) -> None:
+        async with semaphore:
+            if aembed_documents is not None:
+                vectors = await aembed_documents(batch_texts)
+            else:
+                vectors = await asyncio.to_thread(
+                    embeddings.embed_documents, batch_texts
+                )
+
+            batch = []
+            batch_vectors = []
+            for text, vector in zip(batch_texts, vectors):
+                batch.extend(positions[text])
+                batch_vectors.extend([vector] * len(positions[text]))
+
+            await asyncio.to_thread(
+                vectorstore.add_documents,
+                [texts[i] for i in batch],
+                [metadatas[i] for i in batch] if metadatas else None,
+                [ids[i] for i in batch] if ids else None,
+                embeddings=batch_vectors,
+            )
+
+        logger.debug(codes.VECTORSTORE_BULK_BATCH_ADDED, count=len(batch))
+
+    await asyncio.gather(
+        *(
+            add_batch(unique_texts[start : start + batch_size])
+            for start in range(0, len(unique_texts), batch_size)
+        )
+    )
+
+    logger.info(
+        codes.VECTORSTORE_DOCUMENTS_ADDED,
+        count=len(texts),
+        duration_ms=round((time.perf_counter() - start_time) * 1000, 1),
+        message=codes.MSG_VECTORSTORE_DOCUMENTS_ADDED,
+    )
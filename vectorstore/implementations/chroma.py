@@ -4,6 +4,7 @@ ChromaDB vector store implementation.
 Uses ChromaDB for local persistent vector storage with cosine/L2/IP similarity.
 """
 
+import functools
 import uuid
 from pathlib import Path
 from trace import codes
@@ -14,6 +15,7 @@ from chromadb.config import Settings
 
 import constants
 from embeddings.base import EmbeddingsProtocol
+from embeddings.batching import write_windows
 from logger import get_logger
 
 if TYPE_CHECKING:
@@ -54,6 +56,9 @@ class ChromaVectorStore:
         chroma_config = config.vectorstore.chroma
         self.persist_directory = chroma_config.persist_directory
         self.distance_function = chroma_config.distance_function
+        self.hnsw_m = chroma_config.hnsw_m
+        self.hnsw_construction_ef = chroma_config.hnsw_construction_ef
+        self.hnsw_search_ef = chroma_config.hnsw_search_ef
 
         # Create persist directory if it doesn't exist
         Path(self.persist_directory).mkdir(parents=True, exist_ok=True)
@@ -72,6 +77,9 @@ class ChromaVectorStore:
             persist_directory=self.persist_directory,
             collection_name=self.collection_name,
             distance=self.distance_function,
+            hnsw_m=self.hnsw_m,
+            hnsw_construction_ef=self.hnsw_construction_ef,
+            hnsw_search_ef=self.hnsw_search_ef,
             message=codes.MSG_VECTORSTORE_INITIALIZED,
         )
 
@@ -100,10 +108,14 @@ class ChromaVectorStore:
             # Map distance function to ChromaDB format
             distance_map = {"cosine": "cosine", "l2": "l2", "ip": "ip"}
 
+            # HNSW parameters can only be set when the collection is created
             metadata = {
                 constants.CHROMA_HNSW_SPACE: distance_map.get(
                     self.distance_function.lower(), "cosine"
-                )
+                ),
+                constants.CHROMA_HNSW_M: self.hnsw_m,
+                constants.CHROMA_HNSW_CONSTRUCTION_EF: self.hnsw_construction_ef,
+                constants.CHROMA_HNSW_SEARCH_EF: self.hnsw_search_ef,
             }
 
             self.collection = self.client.create_collection(
@@ -121,6 +133,7 @@ class ChromaVectorStore:
         texts: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
     ) -> None:
         """
         Add documents to the vector store.
@@ -129,7 +142,12 @@ class ChromaVectorStore:
             texts: List of document text strings
             metadatas: Optional list of metadata dicts
             ids: Optional list of document IDs (auto-generated if not provided)
+            embeddings: Optional precomputed vectors, one per text (skips
+                the embeddings provider)
         """
+        if embeddings is not None and len(embeddings) != len(texts):
+            raise ValueError(constants.ERROR_EMBEDDINGS_COUNT_MISMATCH)
+
         if not self.collection:
             raise RuntimeError(constants.ERROR_COLLECTION_NOT_INITIALIZED)
 
@@ -138,24 +156,32 @@ class ChromaVectorStore:
         ids = ids or [str(uuid.uuid4()) for _ in range(len(texts))]
         metadatas = metadatas or [{} for _ in range(len(texts))]
 
-        self._add_to_collection(texts, metadatas, ids)
+        self._add_to_collection(texts, metadatas, ids, embeddings)
 
     def _add_to_collection(
-        self, texts: List[str], metadatas: List[Dict[str, Any]], ids: List[str]
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        embeddings: Optional[List[List[float]]] = None,
     ) -> None:
         """
         Generate embeddings and add documents to ChromaDB collection.
 
+        Each embedded window is added while the next one is embedded.
+
         Args:
             texts: List of document text strings
             metadatas: List of metadata dicts
             ids: List of document IDs
+            embeddings: Optional precomputed vectors, one per text
         """
         try:
-            embeddings = self.embeddings.embed_documents(texts)
-
-            self.collection.add(
-                ids=ids, embeddings=embeddings, documents=texts, metadatas=metadatas
+            write_windows(
+                self.embeddings,
+                texts,
+                embeddings,
+                functools.partial(self._add_window, texts, metadatas, ids),
             )
 
             logger.info(
@@ -174,6 +200,32 @@ class ChromaVectorStore:
             )
             raise
 
+    def _add_window(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        start: int,
+        embeddings: List[List[float]],
+    ) -> None:
+        """
+        Add one embedded window of documents to the collection.
+
+        Args:
+            texts: All document text strings
+            metadatas: All metadata dicts
+            ids: All document IDs
+            start: Index of the window's first document
+            embeddings: Embedding vectors for the window
+        """
+        end = start + len(embeddings)
+        self.collection.add(
+            ids=ids[start:end],
+            embeddings=embeddings,
+            documents=texts[start:end],
+            metadatas=metadatas[start:end],
+        )
+
     def query(
         self,
         query_text: str,
@@ -203,7 +255,7 @@ class ChromaVectorStore:
 
         try:
             query_embedding = self.embeddings.embed_query(query_text)
-            results = self._query_collection(query_embedding, n_results, where)
+            results = self._query_collection([query_embedding], n_results, where)
             formatted_results = self._format_query_results(results)
 
             logger.info(codes.VECTORSTORE_QUERY_RESULTS, count=len(formatted_results))
@@ -219,45 +271,108 @@ class ChromaVectorStore:
             )
             raise
 
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Query the vector store for several texts in one collection search.
+
+        Args:
+            query_texts: Texts to search for
+            n_results: Number of results to return per text
+            where: Optional metadata filter applied to every text
+
+        Returns:
+            One list of result dicts per text, in input order
+        """
+        if not self.collection:
+            raise RuntimeError(constants.ERROR_COLLECTION_NOT_INITIALIZED)
+
+        logger.info(
+            codes.VECTORSTORE_QUERYING,
+            query_count=len(query_texts),
+            n_results=n_results,
+            has_filter=where is not None,
+        )
+
+        try:
+            query_embeddings = [
+                self.embeddings.embed_query(query_text) for query_text in query_texts
+            ]
+            # Chroma searches all query vectors in one call
+            results = self._query_collection(query_embeddings, n_results, where)
+            formatted_results = [
+                self._format_query_results(results, query_index)
+                for query_index in range(len(query_texts))
+            ]
+
+            logger.info(
+                codes.VECTORSTORE_QUERY_RESULTS,
+                count=sum(len(matches) for matches in formatted_results),
+                query_count=len(query_texts),
+            )
+
+            return formatted_results
+
+        except Exception as e:
+            logger.error(
+                codes.VECTORSTORE_ERROR,
+                operation=constants.OPERATION_QUERY,
+                error=str(e),
+                exc_info=True,
+            )
+            raise
+
     def _query_collection(
         self,
-        query_embedding: List[float],
+        query_embeddings: List[List[float]],
         n_results: int,
         where: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
         """
-        Query ChromaDB collection with embedding.
+        Query ChromaDB collection with embeddings.
 
         Args:
-            query_embedding: Query embedding vector
-            n_results: Number of results to return
+            query_embeddings: Query embedding vectors
+            n_results: Number of results to return per vector
             where: Optional metadata filter
 
         Returns:
-            Raw ChromaDB query results
+            Raw ChromaDB query results, one row per query vector
         """
         return self.collection.query(
-            query_embeddings=[query_embedding], n_results=n_results, where=where
+            query_embeddings=query_embeddings, n_results=n_results, where=where
         )
 
-    def _format_query_results(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _format_query_results(
+        self, results: Dict[str, Any], query_index: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         Format ChromaDB results into standard format.
 
         Args:
             results: Raw ChromaDB query results
+            query_index: Row of the results belonging to one query vector
 
         Returns:
             List of formatted result dicts
         """
+        ids = results["ids"][query_index]
+        documents = results["documents"][query_index]
+        metadatas = results["metadatas"][query_index]
+        distances = results["distances"][query_index]
+
         formatted_results = []
-        for i in range(len(results["ids"][0])):
+        for i in range(len(ids)):
             formatted_results.append(
                 {
-                    constants.RESULT_KEY_ID: results["ids"][0][i],
-                    constants.RESULT_KEY_TEXT: results["documents"][0][i],
-                    constants.RESULT_KEY_METADATA: results["metadatas"][0][i],
-                    constants.RESULT_KEY_DISTANCE: results["distances"][0][i],
+                    constants.RESULT_KEY_ID: ids[i],
+                    constants.RESULT_KEY_TEXT: documents[i],
+                    constants.RESULT_KEY_METADATA: metadatas[i],
+                    constants.RESULT_KEY_DISTANCE: distances[i],
                 }
             )
         return formatted_results
@@ -4,12 +4,14 @@ Pinecone vector store implementation.
 Uses Pinecone's managed vector database service.
 """
 
+import functools
 import uuid
 from trace import codes
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import constants
 from embeddings.base import EmbeddingsProtocol
+from embeddings.batching import write_windows
 from logger import get_logger
 
 if TYPE_CHECKING:
@@ -180,6 +182,7 @@ class PineconeVectorStore:
         texts: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
     ) -> None:
         """
         Add documents to the vector store.
@@ -188,7 +191,12 @@ class PineconeVectorStore:
             texts: List of document text strings
             metadatas: Optional list of metadata dicts
             ids: Optional list of document IDs (auto-generated if not provided)
+            embeddings: Optional precomputed vectors, one per text (skips
+                the embeddings provider)
         """
+        if embeddings is not None and len(embeddings) != len(texts):
+            raise ValueError(constants.ERROR_EMBEDDINGS_COUNT_MISMATCH)
+
         if not self.index:
             raise RuntimeError(constants.ERROR_INDEX_NOT_INITIALIZED)
 
@@ -197,23 +205,33 @@ class PineconeVectorStore:
         ids = ids or [str(uuid.uuid4()) for _ in range(len(texts))]
         metadatas = metadatas or [{} for _ in range(len(texts))]
 
-        self._upsert_documents(texts, metadatas, ids)
+        self._upsert_documents(texts, metadatas, ids, embeddings)
 
     def _upsert_documents(
-        self, texts: List[str], metadatas: List[Dict[str, Any]], ids: List[str]
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        embeddings: Optional[List[List[float]]] = None,
     ) -> None:
         """
         Generate embeddings and upsert documents to Pinecone.
 
+        Each embedded window is upserted while the next one is embedded.
+
         Args:
             texts: List of document text strings
             metadatas: List of metadata dicts
             ids: List of document IDs
+            embeddings: Optional precomputed vectors, one per text
         """
         try:
-            embeddings = self.embeddings.embed_documents(texts)
-            vectors = self._prepare_vectors(ids, embeddings, texts, metadatas)
-            self._batch_upsert(vectors)
+            write_windows(
+                self.embeddings,
+                texts,
+                embeddings,
+                functools.partial(self._upsert_window, texts, metadatas, ids),
+            )
 
             logger.info(
                 codes.VECTORSTORE_DOCUMENTS_ADDED,
@@ -230,6 +248,30 @@ class PineconeVectorStore:
             )
             raise
 
+    def _upsert_window(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        start: int,
+        embeddings: List[List[float]],
+    ) -> None:
+        """
+        Upsert one embedded window of documents.
+
+        Args:
+            texts: All document text strings
+            metadatas: All metadata dicts
+            ids: All document IDs
+            start: Index of the window's first document
+            embeddings: Embedding vectors for the window
+        """
+        end = start + len(embeddings)
+        vectors = self._prepare_vectors(
+            ids[start:end], embeddings, texts[start:end], metadatas[start:end]
+        )
+        self._batch_upsert(vectors)
+
     def _prepare_vectors(
         self,
         ids: List[str],
@@ -342,6 +384,27 @@ class PineconeVectorStore:
             )
             raise
 
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Query the vector store for several texts.
+
+        Pinecone queries take a single vector, so each text is queried in turn.
+
+        Args:
+            query_texts: Texts to search for
+            n_results: Number of results to return per text
+            where: Optional metadata filter applied to every text
+
+        Returns:
+            One list of result dicts per text, in input order
+        """
+        return [self.query(query_text, n_results, where) for query_text in query_texts]
+
     def delete(self, ids: List[str]) -> None:
         """
         Delete documents from the vector store.
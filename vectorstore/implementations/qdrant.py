@@ -4,12 +4,14 @@ Qdrant vector store implementation.
 Uses Qdrant's open-source vector search engine.
 """
 
+import functools
 import uuid
 from trace import codes
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import constants
 from embeddings.base import EmbeddingsProtocol
+from embeddings.batching import write_windows
 from logger import get_logger
 
 if TYPE_CHECKING:
@@ -44,12 +46,18 @@ class QdrantVectorStore:
 
         try:
             from qdrant_client import QdrantClient
-            from qdrant_client.models import Distance, PointStruct, VectorParams
+            from qdrant_client.models import (
+                Distance,
+                PointStruct,
+                SearchRequest,
+                VectorParams,
+            )
 
             self.QdrantClient = QdrantClient
             self.Distance = Distance
             self.VectorParams = VectorParams
             self.PointStruct = PointStruct
+            self.SearchRequest = SearchRequest
         except ImportError:
             logger.error(
                 codes.VECTORSTORE_ERROR, message=constants.ERROR_QDRANT_NOT_INSTALLED
@@ -157,6 +165,7 @@ class QdrantVectorStore:
         texts: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
     ) -> None:
         """
         Add documents to the vector store.
@@ -165,28 +174,25 @@ class QdrantVectorStore:
             texts: List of document text strings
             metadatas: Optional list of metadata dicts
             ids: Optional list of document IDs (auto-generated if not provided)
+            embeddings: Optional precomputed vectors, one per text (skips
+                the embeddings provider)
         """
+        if embeddings is not None and len(embeddings) != len(texts):
+            raise ValueError(constants.ERROR_EMBEDDINGS_COUNT_MISMATCH)
+
         logger.info(codes.VECTORSTORE_DOCUMENTS_ADDING, count=len(texts))
 
         ids = ids or [str(uuid.uuid4()) for _ in range(len(texts))]
         metadatas = metadatas or [{} for _ in range(len(texts))]
 
         try:
-            embeddings = self.embeddings.embed_documents(texts)
-
-            points = []
-            for id, embedding, text, metadata in zip(ids, embeddings, texts, metadatas):
-                payload = {**metadata, constants.QDRANT_PAYLOAD_TEXT: text}
-                id_uuid = (
-                    str(uuid.uuid5(uuid.NAMESPACE_DNS, id))
-                    if isinstance(id, str)
-                    else id
-                )
-                points.append(
-                    self.PointStruct(id=id_uuid, vector=embedding, payload=payload)
-                )
-
-            self.client.upsert(collection_name=self.collection_name, points=points)
+            # Each embedded window is upserted while the next one is embedded
+            write_windows(
+                self.embeddings,
+                texts,
+                embeddings,
+                functools.partial(self._upsert_window, texts, metadatas, ids),
+            )
 
             logger.info(
                 codes.VECTORSTORE_DOCUMENTS_ADDED,
@@ -203,6 +209,39 @@ class QdrantVectorStore:
             )
             raise
 
+    def _upsert_window(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        start: int,
+        embeddings: List[List[float]],
+    ) -> None:
+        """
+        Upsert one embedded window of documents as Qdrant points.
+
+        Args:
+            texts: All document text strings
+            metadatas: All metadata dicts
+            ids: All document IDs
+            start: Index of the window's first document
+            embeddings: Embedding vectors for the window
+        """
+        points = []
+        end = start + len(embeddings)
+        for id, embedding, text, metadata in zip(
+            ids[start:end], embeddings, texts[start:end], metadatas[start:end]
+        ):
+            payload = {**metadata, constants.QDRANT_PAYLOAD_TEXT: text}
+            id_uuid = (
+                str(uuid.uuid5(uuid.NAMESPACE_DNS, id)) if isinstance(id, str) else id
+            )
+            points.append(
+                self.PointStruct(id=id_uuid, vector=embedding, payload=payload)
+            )
+
+        self.client.upsert(collection_name=self.collection_name, points=points)
+
     def query(
         self,
         query_text: str,
@@ -237,18 +276,7 @@ class QdrantVectorStore:
                 query_filter=where,
             )
 
-            formatted_results = []
-            for hit in results:
-                payload = hit.payload or {}
-                text = payload.pop(constants.QDRANT_PAYLOAD_TEXT, "")
-                formatted_results.append(
-                    {
-                        constants.RESULT_KEY_ID: str(hit.id),
-                        constants.RESULT_KEY_TEXT: text,
-                        constants.RESULT_KEY_METADATA: payload,
-                        constants.RESULT_KEY_DISTANCE: hit.score,
-                    }
-                )
+            formatted_results = self._format_hits(results)
 
             logger.info(codes.VECTORSTORE_QUERY_RESULTS, count=len(formatted_results))
 
@@ -263,6 +291,88 @@ class QdrantVectorStore:
             )
             raise
 
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Query the vector store for several texts in one batched search.
+
+        Args:
+            query_texts: Texts to search for
+            n_results: Number of results to return per text
+            where: Optional metadata filter applied to every text (Qdrant
+                filter format)
+
+        Returns:
+            One list of result dicts per text, in input order
+        """
+        logger.info(
+            codes.VECTORSTORE_QUERYING,
+            query_count=len(query_texts),
+            n_results=n_results,
+            has_filter=where is not None,
+        )
+
+        try:
+            requests = [
+                self.SearchRequest(
+                    vector=self.embeddings.embed_query(query_text),
+                    limit=n_results,
+                    filter=where,
+                    with_payload=True,
+                )
+                for query_text in query_texts
+            ]
+            batch_results = self.client.search_batch(
+                collection_name=self.collection_name, requests=requests
+            )
+
+            formatted_results = [self._format_hits(hits) for hits in batch_results]
+
+            logger.info(
+                codes.VECTORSTORE_QUERY_RESULTS,
+                count=sum(len(matches) for matches in formatted_results),
+                query_count=len(query_texts),
+            )
+
+            return formatted_results
+
+        except Exception as e:
+            logger.error(
+                codes.VECTORSTORE_ERROR,
+                operation=constants.OPERATION_QUERY,
+                error=str(e),
+                exc_info=True,
+            )
+            raise
+
+    def _format_hits(self, hits: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Format Qdrant scored points into standard result dicts.
+
+        Args:
+            hits: Scored points returned by a search
+
+        Returns:
+            List of formatted result dicts
+        """
+        formatted_results = []
+        for hit in hits:
+            payload = hit.payload or {}
+            text = payload.pop(constants.QDRANT_PAYLOAD_TEXT, "")
+            formatted_results.append(
+                {
+                    constants.RESULT_KEY_ID: str(hit.id),
+                    constants.RESULT_KEY_TEXT: text,
+                    constants.RESULT_KEY_METADATA: payload,
+                    constants.RESULT_KEY_DISTANCE: hit.score,
+                }
+            )
+        return formatted_results
+
     def delete(self, ids: List[str]) -> None:
         """
         Delete documents from the vector store.
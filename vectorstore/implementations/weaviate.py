@@ -4,6 +4,7 @@ Weaviate vector store implementation.
 Uses Weaviate's cloud-native vector database.
 """
 
+import functools
 import json
 import uuid
 from trace import codes
@@ -11,6 +12,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import constants
 from embeddings.base import EmbeddingsProtocol
+from embeddings.batching import write_windows
 from logger import get_logger
 
 if TYPE_CHECKING:
@@ -264,6 +266,7 @@ class WeaviateVectorStore:
         texts: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None,
+        embeddings: Optional[List[List[float]]] = None,
     ) -> None:
         """
         Add documents to the vector store.
@@ -272,7 +275,12 @@ class WeaviateVectorStore:
             texts: List of document text strings
             metadatas: Optional list of metadata dicts
             ids: Optional list of document IDs (auto-generated if not provided)
+            embeddings: Optional precomputed vectors, one per text (skips
+                the embeddings provider)
         """
+        if embeddings is not None and len(embeddings) != len(texts):
+            raise ValueError(constants.ERROR_EMBEDDINGS_COUNT_MISMATCH)
+
         logger.info(codes.VECTORSTORE_DOCUMENTS_ADDING, count=len(texts))
 
         # Generate IDs if not provided
@@ -284,33 +292,14 @@ class WeaviateVectorStore:
             metadatas = [{} for _ in range(len(texts))]
 
         try:
-            # Generate embeddings for documents
-            embeddings = self.embeddings.embed_documents(texts)
-
-            # Use fixed batch instead of dynamic to prevent hanging
-            from weaviate.classes.data import DataObject
-
-            objects_to_insert = []
-            for id, embedding, text, metadata in zip(ids, embeddings, texts, metadatas):
-                uuid_obj = (
-                    uuid.uuid5(uuid.NAMESPACE_DNS, id) if isinstance(id, str) else id
-                )
-                objects_to_insert.append(
-                    DataObject(
-                        properties={
-                            constants.WEAVIATE_PROPERTY_TEXT: text,
-                            constants.WEAVIATE_PROPERTY_METADATA: json.dumps(metadata),
-                        },
-                        vector=embedding,
-                        uuid=uuid_obj,
-                    )
-                )
-
-            # Insert in smaller batches of 10
-            batch_size = 10
-            for i in range(0, len(objects_to_insert), batch_size):
-                batch = objects_to_insert[i : i + batch_size]
-                self.collection.data.insert_many(batch)
+            # Generate embeddings window by window, inserting each window
+            # while the next one is embedded
+            write_windows(
+                self.embeddings,
+                texts,
+                embeddings,
+                functools.partial(self._insert_window, texts, metadatas, ids),
+            )
 
             logger.info(
                 codes.VECTORSTORE_DOCUMENTS_ADDED,
@@ -327,6 +316,50 @@ class WeaviateVectorStore:
             )
             raise
 
+    def _insert_window(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        start: int,
+        embeddings: List[List[float]],
+    ) -> None:
+        """
+        Insert one embedded window of documents.
+
+        Args:
+            texts: All document text strings
+            metadatas: All metadata dicts
+            ids: All document IDs
+            start: Index of the window's first document
+            embeddings: Embedding vectors for the window
+        """
+        # Use fixed batch instead of dynamic to prevent hanging
+        from weaviate.classes.data import DataObject
+
+        objects_to_insert = []
+        end = start + len(embeddings)
+        for id, embedding, text, metadata in zip(
+            ids[start:end], embeddings, texts[start:end], metadatas[start:end]
+        ):
+            uuid_obj = uuid.uuid5(uuid.NAMESPACE_DNS, id) if isinstance(id, str) else id
+            objects_to_insert.append(
+                DataObject(
+                    properties={
+                        constants.WEAVIATE_PROPERTY_TEXT: text,
+                        constants.WEAVIATE_PROPERTY_METADATA: json.dumps(metadata),
+                    },
+                    vector=embedding,
+                    uuid=uuid_obj,
+                )
+            )
+
+        # Insert in smaller batches of 10
+        batch_size = 10
+        for i in range(0, len(objects_to_insert), batch_size):
+            batch = objects_to_insert[i : i + batch_size]
+            self.collection.data.insert_many(batch)
+
     def query(
         self,
         query_text: str,
@@ -405,6 +438,28 @@ class WeaviateVectorStore:
             )
             raise
 
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Query the vector store for several texts.
+
+        Weaviate near_vector queries take a single vector, so each text is
+        queried in turn.
+
+        Args:
+            query_texts: Texts to search for
+            n_results: Number of results to return per text
+            where: Optional metadata filter applied to every text
+
+        Returns:
+            One list of result dicts per text, in input order
+        """
+        return [self.query(query_text, n_results, where) for query_text in query_texts]
+
     def delete(self, ids: List[str]) -> None:
         """
         Delete documents from the vector store.